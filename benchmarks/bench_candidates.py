@@ -0,0 +1,147 @@
+"""
+Benchmark of candidate accumulation in find_imdb_match.
+
+Feeds synthetic IMDb result sets of 10 to 10,000 candidates per query to
+find_imdb_match and checks that the time per candidate stays flat as the
+result sets grow, i.e. that matching scales linearly:
+
+    python benchmarks/bench_candidates.py
+    python benchmarks/bench_candidates.py --sizes 100 1000 10000 50000 --repeat 5
+
+Every query variant of the movie returns the same candidates in a different
+order, so each candidate is seen once per query and has to be deduplicated.
+For comparison, the list-based accumulation used before (an ``any()`` scan
+per candidate, then a full sort) is timed on the same result sets. The exit
+status is 1 if the time per candidate of the largest size exceeds
+--tolerance times that of the smallest size above 100 candidates.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader.data_processing import find_imdb_match  # noqa: E402
+
+TITLE = "El Zorro Negro (Black Fox)"
+ORIGINAL_TITLE = "The Black Fox"
+YEAR = "1999"
+WORDS = "night day city love war story man woman king river house dark light road sea".split()
+
+
+class FakeMovie(dict):
+    """Stand-in for an IMDbPY search result."""
+
+    def __init__(self, movie_id: str, **fields):
+        super().__init__(**fields)
+        self.movieID = movie_id
+
+
+class FakeClient:
+    """IMDbPY client answering every search with the same shuffled candidates."""
+
+    def __init__(self, size: int, seed: int = 0):
+        rng = random.Random(seed)
+        # Years at least two away from YEAR, so no candidate is confident
+        # enough to end the search early
+        self.movies = [
+            (
+                f"{i:07d}",
+                " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))),
+                rng.randint(1950, 1990),
+            )
+            for i in range(size)
+        ]
+        self.rng = rng
+        self.searches = 0
+
+    def search_movie(self, query: str, *args):
+        self.searches += 1
+        movies = list(self.movies)
+        self.rng.shuffle(movies)
+        return [FakeMovie(movie_id, title=title, year=year) for movie_id, title, year in movies]
+
+    def update(self, movie, *args):
+        pass
+
+
+def accumulate_with_list(result_sets: list[list[tuple[str, float]]]) -> list[tuple[str, float]]:
+    """Candidate accumulation of find_imdb_match before the movieID dict."""
+    all_candidates: list[dict] = []
+    for results in result_sets:
+        for movie_id, score in results:
+            if not any(c["movieID"] == movie_id for c in all_candidates):
+                all_candidates.append({"movieID": movie_id, "base_score": score})
+    top = sorted(all_candidates, key=lambda x: x["base_score"], reverse=True)[:10]
+    return [(c["movieID"], c["base_score"]) for c in top]
+
+
+def best_time(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000], help="Candidates per query"
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best is kept)")
+    arg_parser.add_argument(
+        "--tolerance", type=float, default=3.0, help="Allowed growth of the time per candidate"
+    )
+    arg_parser.add_argument(
+        "--list-max", type=int, default=2000, help="Largest size timed with the list accumulation"
+    )
+    args = arg_parser.parse_args()
+
+    print(f"{'candidates':>10} {'queries':>7} {'ms/match':>9} {'µs/cand':>8} {'list µs/cand':>12}")
+    per_candidate: dict[int, float] = {}
+    for size in args.sizes:
+        client = FakeClient(size)
+
+        def match(client=client, size=size):
+            return find_imdb_match(TITLE, YEAR, ia=client, original_title=ORIGINAL_TITLE, topn=size)
+
+        client.searches = 0
+        best = match()
+        assert best is not None and len(best["candidates"]) == min(size, 10)
+        queries = client.searches
+        elapsed = best_time(match, args.repeat)
+        seen = size * queries
+        per_candidate[size] = elapsed / seen
+
+        list_column = "-"
+        if size <= args.list_max:
+            result_sets = [
+                [(movie.movieID, random.random()) for movie in client.search_movie(TITLE)]
+                for _ in range(queries)
+            ]
+            list_elapsed = best_time(lambda: accumulate_with_list(result_sets), args.repeat)
+            list_column = f"{list_elapsed / seen * 1e6:.2f}"
+        print(
+            f"{size:>10} {queries:>7} {elapsed * 1000:>9.2f} "
+            f"{elapsed / seen * 1e6:>8.2f} {list_column:>12}"
+        )
+
+    baseline_size = min((size for size in per_candidate if size > 100), default=None)
+    largest = max(per_candidate)
+    if baseline_size is None or baseline_size == largest:
+        return
+    growth = per_candidate[largest] / per_candidate[baseline_size]
+    print(f"time per candidate grows {growth:.2f}x from {baseline_size} to {largest} candidates")
+    if growth > args.tolerance:
+        print(f"FAIL: not linear (tolerance {args.tolerance}x)")
+        sys.exit(1)
+    print("OK: linear scaling")
+
+
+if __name__ == "__main__":
+    main()
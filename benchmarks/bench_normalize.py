@@ -0,0 +1,106 @@
+"""
+Benchmark of title normalisation.
+
+Measures the time needed to normalise a corpus of titles and directors with
+the original normalize_text (NFD decomposition and two per-character passes)
+and with the translation tables of imdb_uploader.data_processing, without
+and with its memo:
+
+    python benchmarks/bench_normalize.py
+    python benchmarks/bench_normalize.py --titles 50000 --repeat 5
+
+The corpus is a synthetic set of Spanish and English titles with accents,
+punctuation and leading articles, plus their directors. Each title is
+normalised several times per pass, as find_imdb_match does for the query,
+the candidate titles and the directors of every search.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader import data_processing  # noqa: E402
+
+WORDS = (
+    "señor anillos comunidad niño mañana corazón película canción último acción "
+    "camión pájaro lágrimas días crónica música ópera águila hermanos volver "
+    "the lord rings fellowship king return night day city love war story man woman "
+    "amélie naïve château über fräulein smörgåsbord"
+).split()
+ARTICLES = ["", "", "", "El ", "La ", "Los ", "Las ", "Un ", "Una ", "The "]
+PUNCTUATION = ["", "", "", ":", ",", "!", "?", "...", " -", "'s", " (1999)", " & co."]
+NAMES = ["Pedro Almodóvar", "Alejandro Amenábar", "Luis Buñuel", "Icíar Bollaín", "Peter Jackson"]
+# Times each string is normalised per pass (query, candidate title, director)
+USES = 3
+
+
+def reference_normalize_text(s: str) -> str:
+    """normalize_text before the translation tables and memo."""
+    if not s:
+        return ""
+    s = s.strip().lower()
+    s = unicodedata.normalize("NFD", s)
+    s = "".join(ch for ch in s if unicodedata.category(ch) != "Mn")
+    s = "".join(ch if ch.isalnum() or ch.isspace() else " " for ch in s)
+    for prefix in ("el ", "la ", "los ", "las ", "un ", "una "):
+        if s.startswith(prefix):
+            s = s[len(prefix) :]
+            break
+    return " ".join(s.split())
+
+
+def fixture_corpus(count: int, seed: int = 0) -> list[str]:
+    """Return `count` titles followed by one director per title."""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(1, 6))]
+        if rng.random() < 0.5:
+            words[0] = words[0].capitalize()
+        titles.append(rng.choice(ARTICLES) + " ".join(words) + rng.choice(PUNCTUATION))
+    return titles + [rng.choice(NAMES) for _ in range(count)]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--titles", type=int, default=10000, help="Titles in the corpus")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Passes over the corpus")
+    args = arg_parser.parse_args()
+
+    corpus = fixture_corpus(args.titles)
+    expected = [reference_normalize_text(s) for s in corpus]
+    ascii_share = sum(s.isascii() for s in corpus) / len(corpus)
+
+    def uncached(s: str) -> str:
+        return data_processing._normalize_text.__wrapped__(s) if s else ""
+
+    engines = [
+        ("original", reference_normalize_text),
+        ("tables", uncached),
+        ("tables + memo", data_processing.normalize_text),
+    ]
+
+    print(f"{len(corpus)} strings ({ascii_share:.0%} ASCII), each normalised {USES} times per pass")
+    print(f"{'engine':<14} {'ms/pass':>9} {'speedup':>8} {'identical':>9}")
+    baseline = None
+    for label, normalize in engines:
+        data_processing._normalize_text.cache_clear()
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for _ in range(USES):
+                results = [normalize(s) for s in corpus]
+        elapsed = (time.perf_counter() - start) / args.repeat * 1000
+        baseline = baseline or elapsed
+        print(
+            f"{label:<14} {elapsed:>9.2f} {baseline / elapsed:>7.1f}x "
+            f"{'yes' if results == expected else 'no':>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
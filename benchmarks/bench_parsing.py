@@ -0,0 +1,171 @@
+"""
+Benchmark of FilmAffinity page parsing.
+
+Measures the time needed to parse one page of each type with every available
+parsing backend:
+
+    python benchmarks/bench_parsing.py
+    python benchmarks/bench_parsing.py --pages saved_pages/ --repeat 50
+
+By default synthetic pages that mirror FilmAffinity's markup are used. With
+--pages, saved pages are read from a directory instead; files are matched by
+name: userratings*.html, list*.html, userlists*.html and film*.html.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity import parsing, scraper  # noqa: E402
+
+# Navigation, scripts and ads surrounding the content on every real page
+CHROME = (
+    "<header><nav>"
+    + "".join(f'<a href="/en/section{i}.html" class="nav-link">Section {i}</a>' for i in range(80))
+    + "</nav></header>"
+    + "".join(f"<script>var ad{i} = {{slot: {i}, size: [300, 250]}};</script>" for i in range(40))
+    + "".join(
+        f'<div class="sidebar-item"><img src="/img/{i}.jpg" alt="Ad {i}"><p>Promo {i}</p></div>'
+        for i in range(60)
+    )
+)
+
+
+def movie_card(movie_id: int) -> str:
+    return f"""
+    <div class="movie-card mc-flex movie-card-0" data-movie-id="{movie_id}">
+      <div class="mc-poster"><a href="/en/film{movie_id}.html"><img src="/p/{movie_id}.jpg"></a></div>
+      <div class="mc-info-container">
+        <div class="mc-title"><a href="/en/film{movie_id}.html">Movie number {movie_id} (TV Series)</a></div>
+        <div class="d-flex"><span class="mc-year ms-1">{1950 + movie_id % 70}</span>
+          <img src="/imgs/countries/US.png" alt="United States" class="nflag"></div>
+        <div class="mc-director"><div class="credits">
+          <span class="nb"><a href="/en/name{movie_id}.html">Director {movie_id}</a></span>
+          <span class="nb"><a href="/en/name{movie_id + 1}.html">Co-director {movie_id}</a></span>
+        </div></div>
+        <div class="mc-cast"><span class="nb"><a>Actor A</a></span><span class="nb"><a>Actor B</a></span></div>
+      </div>
+      <div class="fa-avg-rat-box"><div class="avg">{5 + movie_id % 5},{movie_id % 10}</div></div>
+    </div>"""
+
+
+def watched_page(count: int = 20) -> str:
+    rows = "".join(
+        f'<div class="row mb-4"><div class="col-auto"><div class="fa-user-rat-box">'
+        f'{1 + i % 10}</div></div><div class="col">{movie_card(1000 + i)}</div></div>'
+        for i in range(count)
+    )
+    return f'<html><body>{CHROME}<div class="user-ratings-list-resp">{rows}</div>{CHROME}</body></html>'
+
+
+def list_page(count: int = 50) -> str:
+    items = "".join(
+        f'<li data-movie-id="{2000 + i}"><div class="fa-user-rat-box">{1 + i % 10}</div>'
+        f"{movie_card(2000 + i)}</li>"
+        for i in range(count)
+    )
+    return (
+        f'<html><body>{CHROME}<span class="fs-5">List: Favourites</span>'
+        f'<ul class="fa-list-group">{items}</ul>{CHROME}</body></html>'
+    )
+
+
+def user_lists_page(count: int = 30) -> str:
+    items = "".join(
+        f'<li><a class="ls-imgs" href="/l{i}"></a><a href="/en/mylist.php?list_id={i}">List {i}</a></li>'
+        for i in range(count)
+    )
+    return f'<html><body>{CHROME}<ul class="fa-list-group">{items}</ul>{CHROME}</body></html>'
+
+
+def film_page() -> str:
+    return (
+        f"<html><body>{CHROME}<dl class='movie-info'><dt>Original title</dt><dd>Movie aka Film</dd>"
+        f"<dt>Year</dt><dd>1999</dd><dt>Running time</dt><dd>120 min.</dd></dl>{CHROME}</body></html>"
+    )
+
+
+def parse_watched(html: str, strain: bool = True) -> None:
+    soup = parsing.parse_page(html, parsing.WATCHED_PAGE if strain else None)
+    scraper.parse_watched_page(
+        soup, scraper.new_movie_info(scraper.WATCHED_COLUMNS), fetch_original_title=False
+    )
+
+
+def parse_list(html: str, strain: bool = True) -> None:
+    soup = parsing.parse_page(html, parsing.LIST_PAGE if strain else None)
+    scraper.parse_list_title(soup)
+    scraper.parse_list_page(
+        soup, scraper.new_movie_info(scraper.LIST_COLUMNS), fetch_original_title=False
+    )
+
+
+def parse_user_lists(html: str, strain: bool = True) -> None:
+    scraper.parse_user_lists_page(
+        parsing.parse_page(html, parsing.USER_LISTS_PAGE if strain else None)
+    )
+
+
+def parse_film(html: str, strain: bool = True) -> None:
+    scraper.parse_original_title(parsing.parse_page(html, parsing.DETAIL_PAGE if strain else None))
+
+
+PAGE_TYPES = {
+    "userratings": (parse_watched, watched_page),
+    "list": (parse_list, list_page),
+    "userlists": (parse_user_lists, user_lists_page),
+    "film": (parse_film, film_page),
+}
+
+
+def load_pages(pages_dir: Path) -> dict[str, list[str]]:
+    pages: dict[str, list[str]] = {name: [] for name in PAGE_TYPES}
+    for path in sorted(pages_dir.glob("*.html")):
+        # "userlists" must be checked before "list"
+        for name in sorted(PAGE_TYPES, key=len, reverse=True):
+            if path.name.startswith(name):
+                pages[name].append(path.read_text(encoding="utf-8"))
+                break
+    return pages
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--pages", type=Path, help="Directory with saved pages")
+    arg_parser.add_argument("--repeat", type=int, default=20, help="Parses per page")
+    args = arg_parser.parse_args()
+
+    if args.pages:
+        pages = load_pages(args.pages)
+    else:
+        pages = {name: [make_page()] for name, (_, make_page) in PAGE_TYPES.items()}
+
+    # (label, backend, strain); the first one is how pages were parsed before
+    backends = [("bs4 full tree", "html.parser", False), ("html.parser", "html.parser", True)]
+    if parsing.lxml is not None:
+        backends.append(("lxml", "lxml", True))
+
+    print(f"{'page':<12} {'backend':<14} {'ms/page':>8} {'speedup':>8}")
+    for name, (parse, _) in PAGE_TYPES.items():
+        if not pages[name]:
+            continue
+        baseline = None
+        for label, backend, strain in backends:
+            parsing.set_parser(backend)
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for html in pages[name]:
+                    parse(html, strain)
+            elapsed = time.perf_counter() - start
+            per_page = elapsed / (args.repeat * len(pages[name])) * 1000
+            baseline = baseline or per_page
+            print(f"{name:<12} {label:<14} {per_page:>8.2f} {baseline / per_page:>7.1f}x")
+    parsing.set_parser(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark of IMDb candidate scoring.
+
+Measures the time needed to score the candidates of one search (title
+similarity, year adjustment and director boost) with the original per-pair
+difflib loop and with the batched scoring of imdb_uploader.scoring, using
+every available backend:
+
+    python benchmarks/bench_scoring.py
+    python benchmarks/bench_scoring.py --candidates 2000 --repeat 20
+
+Candidates are a synthetic fixture set of titles, years and directors built
+around the query, similar to the results of an offline title index search.
+The rapidfuzz ratio (Indel similarity) is higher than difflib's for loosely
+similar titles, so "mean diff" reports how far its scores are from the
+original ones and "same best" whether the top candidate is unchanged.
+"""
+
+import argparse
+import difflib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader import scoring  # noqa: E402
+
+QUERY = "the lord of the rings the fellowship of the ring"
+YEAR = "2001"
+DIRECTOR = "peter jackson"
+WORDS = (
+    "the lord rings ring fellowship king return two towers hobbit journey unexpected "
+    "battle five armies desolation smaug war rohirrim of and a"
+).split()
+SURNAMES = ["jackson", "bakshi", "bass", "rankin", "boorman", "del toro", "jacksen"]
+FIRST_NAMES = ["peter", "ralph", "jules", "arthur", "john", "guillermo", "pete"]
+
+
+def fixture_candidates(count: int, seed: int = 0) -> list[tuple[str, str, list[str]]]:
+    """Return (normalised title, year, normalised directors) tuples."""
+    rng = random.Random(seed)
+    candidates = [(QUERY, YEAR, [DIRECTOR])]
+    while len(candidates) < count:
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 9)))
+        year = str(rng.randint(1960, 2024)) if rng.random() > 0.05 else ""
+        directors = [
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)}" for _ in range(rng.randint(0, 2))
+        ]
+        candidates.append((title, year, directors))
+    return candidates
+
+
+def score_per_pair(candidates: list[tuple[str, str, list[str]]]) -> list[float]:
+    """Scoring loop of find_imdb_match before imdb_uploader.scoring."""
+    scores = []
+    for cnorm, cand_year, cand_directors in candidates:
+        base_score = difflib.SequenceMatcher(None, QUERY, cnorm).ratio()
+        if YEAR and cand_year and YEAR == cand_year:
+            base_score += 0.8
+        elif YEAR and cand_year:
+            try:
+                if abs(int(YEAR) - int(cand_year)) >= 2:
+                    base_score -= 0.6
+            except Exception:
+                pass
+        director_boost = 0.0
+        for cdnorm in cand_directors:
+            if cdnorm.split()[-1] == DIRECTOR.split()[-1]:
+                director_boost = max(director_boost, 0.35)
+            else:
+                sim = difflib.SequenceMatcher(None, DIRECTOR, cdnorm).ratio()
+                if sim > 0.8:
+                    director_boost = max(director_boost, 0.3)
+                elif sim > 0.6:
+                    director_boost = max(director_boost, 0.15)
+        scores.append(base_score + director_boost)
+    return scores
+
+
+def score_batched(candidates: list[tuple[str, str, list[str]]]) -> list[float]:
+    titles, years, directors = zip(*candidates)
+    scores = scoring.similarities(QUERY, titles)
+    scores += scoring.year_adjustments(YEAR, years)
+    scores += scoring.director_boosts(DIRECTOR, directors)
+    return scores.tolist()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--candidates", type=int, default=1000, help="Candidates per search")
+    arg_parser.add_argument("--repeat", type=int, default=10, help="Searches scored")
+    args = arg_parser.parse_args()
+
+    candidates = fixture_candidates(args.candidates)
+    expected = score_per_pair(candidates)
+
+    # (label, backend); None is the original per-pair loop
+    engines: list[tuple[str, str | None]] = [
+        ("per-pair difflib", None),
+        ("batched difflib", "difflib"),
+    ]
+    if scoring.process is not None:
+        engines.append(("batched rapidfuzz", "rapidfuzz"))
+
+    print(f"{args.candidates} candidates per search")
+    print(f"{'engine':<18} {'ms/search':>9} {'speedup':>8} {'mean diff':>9} {'same best':>9}")
+    baseline = None
+    for label, backend in engines:
+        if backend is None:
+            score = score_per_pair
+        else:
+            scoring.set_backend(backend)
+            score = score_batched
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            scores = score(candidates)
+        elapsed = (time.perf_counter() - start) / args.repeat * 1000
+        baseline = baseline or elapsed
+        diff = sum(abs(a - b) for a, b in zip(scores, expected)) / len(scores)
+        same_best = scores.index(max(scores)) == expected.index(max(expected))
+        print(
+            f"{label:<18} {elapsed:>9.2f} {baseline / elapsed:>7.1f}x {diff:>9.4f} "
+            f"{'yes' if same_best else 'no':>9}"
+        )
+    scoring.set_backend(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,9 @@ FilmAffinity Scraper Package
 Backup your FilmAffinity data (watched movies, lists) to CSV files.
 """
 
+from filmaffinity.async_scraper import AsyncScraper
 from filmaffinity.exporters import export_to_json, export_to_letterboxd
+from filmaffinity.records import FilmRecord, FilmTable
 from filmaffinity.scraper import (
     ConnectionFailedError,
     NetworkError,
@@ -28,6 +30,11 @@ __all__ = [
     "get_watched_movies",
     "export_to_letterboxd",
     "export_to_json",
+    # Async engine
+    "AsyncScraper",
+    # Data containers
+    "FilmRecord",
+    "FilmTable",
     # Exceptions
     "ScraperError",
     "NetworkError",
@@ -0,0 +1,439 @@
+"""
+Asynchronous FilmAffinity scraper.
+
+An asyncio-based alternative to the functions in filmaffinity.scraper. It uses
+a pooled httpx client, non-blocking backoff and a bounded number of in-flight
+requests, so list pages and detail pages can overlap inside one event loop.
+
+Requires the optional ``httpx`` dependency (``pip install filmaffinity-backup[async]``).
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator
+from typing import Any, Callable, Optional
+
+from rich import print
+
+from filmaffinity import parsing, scraper
+from filmaffinity.checkpoint import PageJournal, watched_key
+from filmaffinity.rate_limit import TokenBucket, parse_retry_after
+from filmaffinity.records import FilmTable
+from filmaffinity.scraper import (
+    DEFAULT_MAX_RPS,
+    LIST_COLUMNS,
+    LIST_ORDER_CATEGORIES,
+    MAX_CONSECUTIVE_EMPTY_PAGES,
+    MAX_PAGINATION_PAGES,
+    MAX_RETRIES,
+    RATE_LIMIT_COOLDOWN,
+    WATCHED_COLUMNS,
+    WATCHED_ORDER_BY,
+    ConnectionFailedError,
+    NetworkError,
+    RateLimitError,
+    TimeoutError,
+    UserNotFoundError,
+    _format_connection_error,
+    _format_network_error,
+    _format_timeout_error,
+    distinct_original_title,
+    get_cached_original_title,
+    new_movie_info,
+    parse_list_page,
+    parse_list_title,
+    parse_original_title,
+    parse_page_count,
+    parse_user_lists_page,
+    parse_watched_page,
+    session,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+DEFAULT_CONCURRENCY = 4  # maximum number of in-flight requests
+
+
+class AsyncScraper:
+    """
+    Asynchronous FilmAffinity scraper with a pooled HTTP client.
+
+    Exposes the same scraping functions as filmaffinity.scraper as coroutine
+    methods. Use it as an async context manager so the connection pool is
+    closed when done:
+
+        async with AsyncScraper(concurrency=4) as fa:
+            lists = await fa.get_user_lists(user_id)
+
+    Args:
+        concurrency: Maximum number of requests in flight at once.
+        max_rps: Global requests per second ceiling, or None for no limit.
+        timeout: Request timeout in seconds.
+        max_retries: Maximum number of attempts per request.
+        transport: Optional httpx transport (used by tests).
+        rate_limiter: Optional limiter to use instead of one built from
+            `max_rps`, such as a shared AdaptiveRateLimiter.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_rps: Optional[float] = DEFAULT_MAX_RPS,
+        timeout: float = 30,
+        max_retries: int = MAX_RETRIES,
+        transport: Any = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        if httpx is None:
+            raise ImportError("The async scraper requires httpx. Install with: pip install httpx")
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        if rate_limiter is None and max_rps:
+            rate_limiter = TokenBucket(max_rps)
+        self.rate_limiter = rate_limiter
+        self._timeout = timeout
+        self._transport = transport
+        self._semaphore: Any = None
+        self._client: Any = None
+
+    async def __aenter__(self) -> "AsyncScraper":
+        # Created here so they bind to the running event loop
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._client = httpx.AsyncClient(
+            headers=dict(session.headers),  # type: ignore[arg-type]
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=self.concurrency, max_keepalive_connections=self.concurrency
+            ),
+            transport=self._transport,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # -------------------------------------------------------------------------
+    # HTTP
+    # -------------------------------------------------------------------------
+
+    def _record(
+        self, status_code: Optional[int], started: float, retry_after: Optional[float] = None
+    ) -> None:
+        """Report a response (or a failed request) to the rate limiter."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(status_code, time.monotonic() - started, retry_after)
+
+    async def request_with_retry(self, url: str) -> Any:
+        """
+        Make a request with retry logic for rate limiting (429 errors).
+
+        Waits are done with asyncio.sleep so other requests keep running.
+
+        Raises:
+            ConnectionFailedError: If unable to connect after retries.
+            TimeoutError: If request times out.
+            RateLimitError: If rate limited after all retries exhausted.
+            NetworkError: For other network-related errors.
+        """
+        cooldown = RATE_LIMIT_COOLDOWN
+
+        for attempt in range(self.max_retries):
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve())
+            started = time.monotonic()
+            try:
+                async with self._semaphore:
+                    response = await self._client.get(url)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self._record(response.status_code, started, retry_after)
+
+                # A 503 is only retried when the server says when to come back
+                if response.status_code == 429 or (
+                    response.status_code == 503 and retry_after is not None
+                ):
+                    wait = retry_after if retry_after is not None else cooldown
+                    print(
+                        f"  [yellow]⚠️  Rate limited ({response.status_code}). Waiting {wait:g}s before retry ({attempt + 1}/{self.max_retries})...[/yellow]"
+                    )
+                    await asyncio.sleep(wait)
+                    cooldown = min(cooldown * 2, 120)  # Exponential backoff
+                    continue
+
+                return response
+
+            # Dropped and reset connections are retried like a failed connect,
+            # as requests reports all of them as a ConnectionError
+            except (httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                self._record(None, started)
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep((attempt + 1) * 5)
+                    continue
+                raise ConnectionFailedError(_format_connection_error(e, url), url=url, cause=e)
+
+            except httpx.TimeoutException as e:
+                self._record(None, started)
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep((attempt + 1) * 5)
+                    continue
+                raise TimeoutError(_format_timeout_error(url), url=url, cause=e)
+
+            except httpx.HTTPError as e:
+                raise NetworkError(_format_network_error(e, url), url=url, cause=e)
+
+        raise RateLimitError(
+            f"Rate limited by FilmAffinity after {self.max_retries} retries.\n"
+            f"  FilmAffinity is blocking requests from your IP.\n"
+            f"  Please wait 10-15 minutes before trying again.\n"
+            f"  URL: {url}",
+            url=url,
+        )
+
+    # -------------------------------------------------------------------------
+    # Scraping
+    # -------------------------------------------------------------------------
+
+    async def check_user(self, user_id: str, lang: str = "en") -> None:
+        """Check that the provided user_id exists on FilmAffinity."""
+        url = f"https://www.filmaffinity.com/{lang}/userlists.php?user_id={user_id}"
+        response = await self.request_with_retry(url)
+
+        if response.status_code == 404:
+            raise UserNotFoundError(user_id=user_id, url=url)
+        elif response.status_code != 200:
+            raise NetworkError(
+                f"Unexpected response from FilmAffinity (HTTP {response.status_code}).\n"
+                f"  The server returned an unexpected status code.\n"
+                f"  URL: {url}\n"
+                f"  Status: {response.status_code} {response.reason_phrase}",
+                url=url,
+            )
+
+    async def get_user_lists(
+        self, user_id: str, max_page: Optional[int] = None, lang: str = "en"
+    ) -> dict[str, str]:
+        """Retrieve all public lists from a user."""
+        user_lists: dict[str, str] = {}
+        page = 1
+        consecutive_empty_pages = 0
+        effective_max_page = max_page or MAX_PAGINATION_PAGES
+
+        while page <= effective_max_page:
+            url = f"https://www.filmaffinity.com/{lang}/userlists.php?user_id={user_id}&p={page}"
+            response = await self.request_with_retry(url)
+            if response.status_code != 200:
+                break
+
+            found = parse_user_lists_page(
+                parsing.parse_page(response.text, parsing.USER_LISTS_PAGE)
+            )
+            if found is None:
+                consecutive_empty_pages += 1
+                if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
+                    break
+                page += 1
+                continue
+
+            consecutive_empty_pages = 0
+            if not found:
+                break
+
+            user_lists.update(found)
+            page += 1
+
+        return user_lists
+
+    async def get_original_title(self, movie_id: str) -> str:
+        """
+        Fetch the original title from the movie's detail page.
+
+        Uses the same detail cache as the sync engine (see
+        filmaffinity.scraper.set_detail_cache).
+        """
+        cached = get_cached_original_title(movie_id)
+        if cached is not None:
+            return cached
+
+        url = f"https://www.filmaffinity.com/es/film{movie_id}.html"
+        try:
+            response = await self.request_with_retry(url)
+            if response.status_code != 200:
+                return ""
+            original_title = parse_original_title(
+                parsing.parse_page(response.text, parsing.DETAIL_PAGE)
+            )
+        except Exception:
+            return ""
+
+        if scraper.detail_cache is not None:
+            scraper.detail_cache.put(movie_id, {"original title": original_title})
+        return original_title
+
+    async def _fill_original_titles(self, info: FilmTable, start: int) -> None:
+        """Fetch original titles for the movies added since `start`, concurrently."""
+        records = info.records[start:]
+        # A movie can appear more than once; its detail page is fetched once
+        movie_ids = list(dict.fromkeys(record.fa_movie_id for record in records))
+        fetched = await asyncio.gather(*(self.get_original_title(m) for m in movie_ids))
+        original_titles = dict(zip(movie_ids, fetched))
+        for record in records:
+            record.original_title = distinct_original_title(
+                original_titles[record.fa_movie_id], record.title
+            )
+
+    async def _iter_pages(
+        self, page_url: Callable[[int], str], page_param: str, start_page: int, max_page: int
+    ) -> AsyncGenerator[tuple[int, str, Any], None]:
+        """
+        Fetch the pages of a listing in order, yielding (page, url, response).
+
+        Like scraper._iter_pages: once the first page gives the number of
+        pages, the rest are requested up to `concurrency` at a time.
+        """
+        if start_page > max_page:
+            return
+
+        url = page_url(start_page)
+        response = await self.request_with_retry(url)
+        yield start_page, url, response
+
+        page_count = None
+        if response.status_code == 200:
+            page_count = parse_page_count(response.text, page_param)
+        if page_count is not None and page_count < start_page:
+            page_count = None
+        last_page = max_page if page_count is None else min(page_count, max_page)
+
+        if page_count is None:
+            for page in range(start_page + 1, last_page + 1):
+                url = page_url(page)
+                yield page, url, await self.request_with_retry(url)
+            return
+
+        pending: deque[tuple[int, str, asyncio.Task]] = deque()
+        try:
+            page = start_page + 1
+            while pending or page <= last_page:
+                while page <= last_page and len(pending) < self.concurrency:
+                    url = page_url(page)
+                    task = asyncio.ensure_future(self.request_with_retry(url))
+                    pending.append((page, url, task))
+                    page += 1
+                done_page, url, task = pending.popleft()
+                yield done_page, url, await task
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
+
+    async def get_list_movies(
+        self,
+        base_url: str,
+        order_by: str = "voto",
+        max_page: Optional[int] = None,
+        lang: str = "en",
+        fetch_original_title: bool = True,
+        checkpoint: Optional[PageJournal] = None,
+    ) -> tuple[str, FilmTable]:
+        """Retrieve all movies from a user list."""
+        order_id = LIST_ORDER_CATEGORIES.get(order_by, 3)
+        info = new_movie_info(LIST_COLUMNS)
+        start_page = 1
+        if checkpoint is not None:
+            start_page, info = checkpoint.restore(base_url, LIST_COLUMNS)
+        title = ""
+        consecutive_empty_pages = 0
+        pages = self._iter_pages(
+            lambda page: f"{base_url}&page={page}&orderby={order_id}",
+            "page",
+            start_page,
+            max_page or MAX_PAGINATION_PAGES,
+        )
+
+        try:
+            async for page, _, response in pages:
+                if response.status_code != 200:
+                    break
+
+                print(f"  [grey50]Parsing page {page}[/grey50]")
+                soup = parsing.parse_page(response.text, parsing.LIST_PAGE)
+                if page == 1:
+                    title = parse_list_title(soup)
+
+                start = len(info.records)
+                movies_found = parse_list_page(soup, info, lang=lang, fetch_original_title=False)
+                if movies_found is None:
+                    consecutive_empty_pages += 1
+                    if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
+                        break
+                    continue
+
+                consecutive_empty_pages = 0
+                if movies_found == 0:
+                    break
+
+                if lang == "es" and fetch_original_title:
+                    await self._fill_original_titles(info, start)
+                if checkpoint is not None:
+                    checkpoint.record(base_url, page, info.records[start:])
+        finally:
+            await pages.aclose()
+
+        return title, info
+
+    async def get_watched_movies(
+        self,
+        user_id: str,
+        max_page: Optional[int] = None,
+        lang: str = "en",
+        fetch_original_title: bool = True,
+        checkpoint: Optional[PageJournal] = None,
+    ) -> FilmTable:
+        """Retrieve all watched (rated) movies from a user."""
+        info = new_movie_info(WATCHED_COLUMNS)
+        start_page = 1
+        key = watched_key(user_id, lang)
+        if checkpoint is not None:
+            start_page, info = checkpoint.restore(key, WATCHED_COLUMNS)
+
+        def page_url(page: int) -> str:
+            return f"https://www.filmaffinity.com/{lang}/userratings.php?user_id={user_id}&p={page}&orderby={WATCHED_ORDER_BY}&chv=list"
+
+        consecutive_empty_pages = 0
+        pages = self._iter_pages(page_url, "p", start_page, max_page or MAX_PAGINATION_PAGES)
+
+        try:
+            async for page, _, response in pages:
+                if response.status_code != 200:
+                    break
+
+                print(f"  [grey50]Parsing page {page}[/grey50]")
+                soup = parsing.parse_page(response.text, parsing.WATCHED_PAGE)
+
+                start = len(info.records)
+                movies_found = parse_watched_page(soup, info, lang=lang, fetch_original_title=False)
+                if not movies_found:
+                    # Empty pages and pages without valid movies both count as empty
+                    consecutive_empty_pages += 1
+                    if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
+                        break
+                    continue
+
+                consecutive_empty_pages = 0
+                if lang == "es" and fetch_original_title:
+                    await self._fill_original_titles(info, start)
+                if checkpoint is not None:
+                    checkpoint.record(key, page, info.records[start:])
+        finally:
+            await pages.aclose()
+
+        return info
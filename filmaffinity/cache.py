@@ -0,0 +1,320 @@
+"""
+On-disk caches of FilmAffinity pages.
+
+DetailCache stores the parsed fields of each movie's detail page (currently
+the original title) in a small SQLite database keyed by FA movie ID, so
+repeated backups only hit the network for movies that were not seen before or
+whose entry has expired.
+
+ResponseCache stores list and ratings pages with their HTTP validators, so
+unchanged pages are revalidated with cheap conditional requests instead of
+being downloaded and parsed again.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional, Union
+
+DEFAULT_CACHE_TTL_DAYS = 180  # original titles practically never change
+DEFAULT_CACHE_MAX_ENTRIES = 100_000
+CACHE_FILENAME = ".detail_cache.sqlite"
+
+
+class DetailCache:
+    """
+    SQLite-backed cache of parsed movie detail fields.
+
+    Entries older than ``ttl`` seconds are treated as missing. When the cache
+    holds more than ``max_entries`` movies, the least recently fetched ones
+    are evicted (on open and on close). The cache may be shared by several
+    threads.
+
+    Args:
+        path: Database file (created if missing).
+        ttl: Maximum age of an entry in seconds, or None to never expire.
+        max_entries: Maximum number of movies kept on disk.
+        refresh: Ignore existing entries (but still store new ones).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[float] = DEFAULT_CACHE_TTL_DAYS * 86400,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        refresh: bool = False,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS details ("
+            "movie_id TEXT PRIMARY KEY, data TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS details_fetched_at ON details (fetched_at)")
+        self._conn.commit()
+        self.prune()
+
+    def __enter__(self) -> "DetailCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM details").fetchone()[0]
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return self.ttl is None or time.time() - fetched_at <= self.ttl
+
+    def get(self, movie_id: str) -> Optional[dict[str, Any]]:
+        """Return the cached fields of a movie, or None if missing or expired."""
+        with self._lock:
+            row = None
+            if not self.refresh:
+                row = self._conn.execute(
+                    "SELECT data, fetched_at FROM details WHERE movie_id = ?", (str(movie_id),)
+                ).fetchone()
+
+            if row is None or not self._is_fresh(row[1]):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, movie_id: str, fields: dict[str, Any]) -> None:
+        """Store the parsed fields of a movie, stamped with the current time."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO details (movie_id, data, fetched_at) VALUES (?, ?, ?)",
+                (str(movie_id), json.dumps(fields, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """
+        Delete expired entries and evict the oldest ones beyond max_entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            removed = 0
+            if self.ttl is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM details WHERE fetched_at < ?", (time.time() - self.ttl,)
+                ).rowcount
+            removed += self._conn.execute(
+                "DELETE FROM details WHERE movie_id IN ("
+                "SELECT movie_id FROM details ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._conn.commit()
+            return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM details")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Evict old entries and close the database."""
+        if self._conn is None:
+            return
+        self.prune()
+        with self._lock:
+            self._conn.close()
+            self._conn = None  # type: ignore[assignment]
+
+
+RESPONSE_CACHE_FILENAME = ".page_cache.sqlite"
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 20_000
+
+
+class CachedPage:
+    """A page stored in a ResponseCache."""
+
+    __slots__ = ("body", "digest", "etag", "last_modified")
+
+    def __init__(self, body: str, digest: str, etag: str, last_modified: str):
+        self.body = body
+        self.digest = digest
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating the page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def page_digest(body: str) -> str:
+    """Return the SHA-256 digest of a page body."""
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed HTTP cache of FilmAffinity list and ratings pages.
+
+    Each page body is stored (compressed) with its ETag and Last-Modified
+    headers, so the next request for it can be made conditional and a 304
+    answered from disk. Bodies are also stored with their SHA-256 digest and,
+    optionally, the data parsed from them: a page that comes back
+    byte-identical, with or without validators, does not need to be parsed
+    again. The cache may be shared by several threads.
+
+    Args:
+        path: Database file (created if missing).
+        max_entries: Maximum number of pages kept on disk (least recently
+            fetched ones are evicted on open and on close).
+        refresh: Don't revalidate or reuse existing entries (but still store
+            new ones).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        refresh: bool = False,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self.not_modified = 0  # 304 responses served from disk
+        self.unchanged = 0  # pages whose parsed data was reused
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, body BLOB NOT NULL, digest TEXT NOT NULL, "
+            "etag TEXT NOT NULL, last_modified TEXT NOT NULL, parsed TEXT, "
+            "fetched_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_fetched_at ON pages (fetched_at)")
+        self._conn.commit()
+        self.prune()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the stored copy of a page, or None."""
+        if self.refresh:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, digest, etag, last_modified FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedPage(zlib.decompress(row[0]).decode("utf-8"), row[1], row[2], row[3])
+
+    def put(self, url: str, body: str, etag: str = "", last_modified: str = "") -> str:
+        """
+        Store a page fetched with a 200 response.
+
+        Parsed data stored for the page is kept if the body is unchanged.
+
+        Returns:
+            Digest of the body.
+        """
+        digest = page_digest(body)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO pages (url, body, digest, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (url) DO UPDATE SET "
+                "parsed = CASE WHEN digest = excluded.digest THEN parsed END, "
+                "body = excluded.body, digest = excluded.digest, etag = excluded.etag, "
+                "last_modified = excluded.last_modified, fetched_at = excluded.fetched_at",
+                (
+                    url,
+                    zlib.compress(body.encode("utf-8")),
+                    digest,
+                    etag or "",
+                    last_modified or "",
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+        return digest
+
+    def touch(self, url: str) -> None:
+        """Mark a page as just revalidated (after a 304 response)."""
+        with self._lock:
+            self._conn.execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+            self.not_modified += 1
+
+    def get_parsed(self, url: str, digest: str) -> Optional[Any]:
+        """Return the data parsed from a page, if its body still has `digest`."""
+        if self.refresh:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT parsed FROM pages WHERE url = ? AND digest = ?", (url, digest)
+            ).fetchone()
+            if row is None or row[0] is None:
+                return None
+            self.unchanged += 1
+        return json.loads(row[0])
+
+    def put_parsed(self, url: str, digest: str, data: Any) -> None:
+        """Store the data parsed from a page body with the given digest."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET parsed = ? WHERE url = ? AND digest = ?",
+                (json.dumps(data, ensure_ascii=False), url, digest),
+            )
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """
+        Evict the least recently fetched pages beyond max_entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM pages WHERE url IN ("
+                "SELECT url FROM pages ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._conn.commit()
+            return removed
+
+    def close(self) -> None:
+        """Evict old entries and close the database."""
+        if self._conn is None:
+            return
+        self.prune()
+        with self._lock:
+            self._conn.close()
+            self._conn = None  # type: ignore[assignment]
@@ -0,0 +1,94 @@
+"""
+Page-level checkpoints for the FilmAffinity scraper.
+
+A PageJournal records every page completed by get_list_movies and
+get_watched_movies (sync or async) together with the movies it produced.
+When a scrape is run again with the same journal, the movies of completed
+pages are restored and pagination continues from the next page, so a failure
+late in a long scrape only costs the pages that were not finished.
+
+The journal is a JSON Lines file with one entry per page, appended and
+flushed as each page completes. A line truncated by a crash is ignored.
+"""
+
+import json
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from filmaffinity.records import FilmRecord, FilmTable
+
+CHECKPOINT_FILENAME = ".pages.jsonl"
+
+
+def watched_key(user_id: str, lang: str) -> str:
+    """Journal key of a user's watched movies (lists use their URL)."""
+    return f"watched:{lang}:{user_id}"
+
+
+class PageJournal:
+    """
+    Journal of completed pages, keyed by list URL or watched_key().
+
+    Safe to share between threads and between concurrent scrapes.
+
+    Args:
+        path: JSON Lines file holding the journal (created on first page).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _load(self, key: str) -> dict[int, list[dict[str, Any]]]:
+        """Read the recorded pages of one scrape."""
+        pages: dict[int, list[dict[str, Any]]] = {}
+        with self._lock:
+            if not self.path.exists():
+                return pages
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        if entry["key"] == key:
+                            pages[int(entry["page"])] = entry["rows"]
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                        continue
+        return pages
+
+    def restore(self, key: str, columns: Iterable[str]) -> tuple[int, FilmTable]:
+        """
+        Return the movies of the completed pages of a scrape.
+
+        Only consecutive pages from page 1 are restored, so a gap left by a
+        damaged entry is fetched again along with every page after it.
+
+        Args:
+            key: List URL or watched_key().
+            columns: Columns of the returned table.
+
+        Returns:
+            Tuple of (next page to fetch, FilmTable of restored movies).
+        """
+        info = FilmTable(columns)
+        pages = self._load(key)
+
+        page = 1
+        while page in pages:
+            info.extend(FilmRecord(**fields) for fields in pages[page])
+            page += 1
+        return page, info
+
+    def record(self, key: str, page: int, films: Iterable[FilmRecord]) -> None:
+        """Record a completed page and the movies it produced."""
+        entry = {"key": key, "page": page, "rows": [record.fields() for record in films]}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def clear(self) -> None:
+        """Forget every checkpoint and delete the journal file."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
@@ -4,11 +4,16 @@ FilmAffinity Backup CLI
 Command-line interface for backing up FilmAffinity data to CSV files.
 """
 
+import asyncio
 import shutil
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as get_version
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any, Callable, Optional, TypeVar, Union
 
 import click
 import pandas as pd
@@ -16,16 +21,30 @@ import typer
 from rich import print
 from rich.panel import Panel
 
-from filmaffinity import scraper
+from filmaffinity import async_scraper, enrichment, scraper
+from filmaffinity.cache import (
+    CACHE_FILENAME,
+    DEFAULT_CACHE_TTL_DAYS,
+    RESPONSE_CACHE_FILENAME,
+    DetailCache,
+    ResponseCache,
+)
+from filmaffinity.checkpoint import CHECKPOINT_FILENAME, PageJournal
+from filmaffinity.rate_limit import RATE_STATE_FILENAME, AdaptiveRateLimiter, TokenBucket
+from filmaffinity.records import FilmTable
 from filmaffinity.scraper import (
+    DEFAULT_COOLDOWN,
     NetworkError,
     RateLimitError,
     ScraperError,
     UserNotFoundError,
 )
+from filmaffinity.sink import CsvSink
 
 from .exporters import export_to_json, export_to_letterboxd
 
+_T = TypeVar("_T")
+
 
 def get_app_version() -> str:
     """Get the application version from package metadata."""
@@ -76,6 +95,9 @@ def app_callback(
 # Default data directory (relative to this file's package root)
 DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data"
 
+# Summary report of the batch command, saved in the data directory
+BATCH_REPORT_FILENAME = "batch_report.csv"
+
 
 def _handle_scraper_error(error: ScraperError) -> None:
     """Display a user-friendly error message and exit."""
@@ -131,55 +153,297 @@ def load_existing_data(user_dir: Path) -> dict[str, dict[str, list[Any]]]:
         return data
 
     for csv_file in user_dir.glob("*.csv"):
-        name = csv_file.stem
-        try:
-            df = pd.read_csv(csv_file, sep=";")
-            data[name] = dict(df.to_dict(orient="list"))  # type: ignore[arg-type]
-            qprint(f"  [dim]Loaded existing: {name} ({len(df)} items)[/dim]")
-        except Exception as e:
-            qprint(f"  [yellow]Warning: Could not load {csv_file}: {e}[/yellow]")
+        loaded = load_csv(csv_file)
+        if loaded is not None:
+            data[csv_file.stem] = loaded
 
     return data
 
 
-@app.command()
-def backup(
-    user_id: str = typer.Argument(..., help="FilmAffinity user ID"),
-    skip_lists: bool = typer.Option(
-        False, "--skip-lists", help="Skip downloading user lists, only get watched films"
-    ),
-    resume: bool = typer.Option(
-        False, "--resume", help="Resume interrupted session, skip already downloaded lists"
-    ),
-    lang: str = typer.Option(
-        "en",
-        "--lang",
-        help="Language for FilmAffinity (es/en). Default: 'en' for better IMDb matching",
-    ),
-    data_dir: Path = typer.Option(
-        DEFAULT_DATA_DIR, "--data-dir", help="Directory to save CSV files"
-    ),
-    export_format: str = typer.Option(
-        "csv",
-        "--format",
-        help="Export format: 'csv' (default, semicolon-delimited), 'letterboxd' (Letterboxd-compatible CSV), or 'json'",
-        click_type=click.Choice(["csv", "letterboxd", "json"]),
-    ),
-    quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output, only show errors"),
-):
+def load_csv(csv_file: Path) -> Optional[dict[str, list[Any]]]:
+    """Load a previously saved CSV file, or return None if it can't be read."""
+    try:
+        df = pd.read_csv(csv_file, sep=";")
+    except Exception as e:
+        qprint(f"  [yellow]Warning: Could not load {csv_file}: {e}[/yellow]")
+        return None
+    qprint(f"  [dim]Loaded existing: {csv_file.stem} ({len(df)} items)[/dim]")
+    return dict(df.to_dict(orient="list"))  # type: ignore[arg-type]
+
+
+def to_frame(films: Mapping[str, list[Any]]) -> pd.DataFrame:
+    """Build a DataFrame from a movie table or a dict of columns."""
+    if isinstance(films, FilmTable):
+        return pd.DataFrame.from_records(list(films.iter_rows()), columns=list(films.columns))
+    return pd.DataFrame.from_dict(films)  # type: ignore[arg-type]
+
+
+def remove_stale_files(user_dir: Path, keep: set[str]) -> None:
+    """Delete everything in a user directory except the named entries."""
+    for entry in user_dir.iterdir():
+        if entry.name in keep:
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+
+
+def load_saved(csv_file: Path) -> dict[str, list[str]]:
+    """Load a CSV file written by this run, keeping every value as a string."""
+    df = pd.read_csv(csv_file, sep=";", dtype=str, keep_default_na=False)
+    return dict(df.to_dict(orient="list"))  # type: ignore[arg-type]
+
+
+def stream_movies(
+    path: Path,
+    columns: tuple[str, ...],
+    scrape: Callable[..., Any],
+    resume: bool = False,
+    enrich: Optional[Callable[[FilmTable], None]] = None,
+) -> Path:
     """
-    Backup FilmAffinity data (watched movies and lists) to CSV files.
+    Scrape movies straight into a CSV file, one page at a time.
+
+    Pages are appended to a temporary file as they arrive (see CsvSink), so
+    memory use doesn't grow with the number of movies. The CSV only appears at
+    `path` once the last page is in.
+
+    Args:
+        path: CSV file to write.
+        columns: Columns of the scraped table.
+        scrape: Pagination function accepting `start_page` and `on_page`
+            keyword arguments (e.g. scraper.get_watched_movies with its other
+            arguments bound).
+        resume: Continue from the last page checkpointed by an interrupted run.
+        enrich: Optional function filling in each page's movies before they
+            are written (e.g. original titles).
+
+    Returns:
+        Path of the written CSV file.
+    """
+    sink = CsvSink(path, columns, resume=resume)
+    if sink.last_page:
+        qprint(f"  [dim]Resuming from page {sink.next_page} ({sink.rows} items saved)[/dim]")
 
-    To find your user_id, go to 'Mis votaciones' and copy the ID from the URL:
-    https://www.filmaffinity.com/es/userratings.php?user_id={YOUR_ID}
+    def write_page(page: int, films: FilmTable) -> None:
+        if enrich is not None:
+            enrich(films)
+        sink.write_page(page, films)
+
+    try:
+        scrape(start_page=sink.next_page, on_page=write_page)
+    finally:
+        sink.close()
+    return sink.commit()
+
+
+def _run_lists(
+    lists: dict[str, str], workers: int, task: Callable[[str, str], _T]
+) -> dict[str, _T]:
+    """Run task(name, url) for each list, up to `workers` at a time, keeping list order."""
+    if workers <= 1 or len(lists) <= 1:
+        return {name: task(name, url) for name, url in lists.items()}
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fa-list")
+    try:
+        futures = {name: executor.submit(task, name, url) for name, url in lists.items()}
+        return {name: future.result() for name, future in futures.items()}
+    finally:
+        # Don't start pending lists if one of them failed
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _fetch_list(name: str, url: str, lang: str, fetch_original_title: bool = True) -> FilmTable:
+    """Scrape a single user list and return its movie data."""
+    qprint(f"Parsing list: [turquoise4 bold]{name}[/turquoise4 bold]")
+    _, info = scraper.get_list_movies(url, lang=lang, fetch_original_title=fetch_original_title)
+    return info
+
+
+def scrape_lists(
+    lists: dict[str, str],
+    lang: str = "en",
+    workers: int = 1,
+    fetch_original_title: bool = True,
+) -> dict[str, FilmTable]:
     """
-    global _quiet_mode
-    _quiet_mode = quiet
+    Scrape several user lists, up to `workers` of them at a time.
 
-    data: dict[str, dict[str, list[Any]]] = {}
-    user_dir = data_dir / user_id
+    Concurrent workers share the scraper's global rate limiter, so the total
+    request rate stays bounded regardless of the number of workers.
+
+    Args:
+        lists: Mapping of list names to list URLs.
+        lang: Language version ('es' or 'en').
+        workers: Maximum number of lists scraped concurrently.
+        fetch_original_title: Whether to fetch original titles while scraping.
 
-    # Validate language
+    Returns:
+        Mapping of list names to movie data, in the same order as `lists`.
+
+    Raises:
+        ScraperError: The first error raised while scraping any list.
+    """
+    return _run_lists(
+        lists, workers, lambda name, url: _fetch_list(name, url, lang, fetch_original_title)
+    )
+
+
+def stream_lists(
+    lists: dict[str, str],
+    user_dir: Path,
+    lang: str = "en",
+    workers: int = 1,
+    resume: bool = False,
+    enrich: Optional[Callable[[FilmTable], None]] = None,
+) -> dict[str, Path]:
+    """
+    Scrape several user lists straight into their CSV files (see stream_movies).
+
+    Args:
+        lists: Mapping of list names to list URLs.
+        user_dir: Directory of the CSV files ('list - <name>.csv').
+        lang: Language version ('es' or 'en').
+        workers: Maximum number of lists scraped concurrently, and of pages
+            fetched concurrently within each list.
+        resume: Continue interrupted lists from their last checkpointed page.
+        enrich: Optional function filling in each page's movies before they
+            are written.
+
+    Returns:
+        Mapping of list names to CSV paths, in the same order as `lists`.
+
+    Raises:
+        ScraperError: The first error raised while scraping any list.
+    """
+
+    def stream_list(name: str, url: str) -> Path:
+        qprint(f"Parsing list: [turquoise4 bold]{name}[/turquoise4 bold]")
+        return stream_movies(
+            user_dir / f"list - {name}.csv",
+            scraper.LIST_COLUMNS,
+            partial(
+                scraper.get_list_movies,
+                url,
+                lang=lang,
+                fetch_original_title=False,
+                workers=workers,
+            ),
+            resume=resume,
+            enrich=enrich,
+        )
+
+    return _run_lists(lists, workers, stream_list)
+
+
+async def scrape_async(
+    user_id: str,
+    lists: dict[str, str],
+    lang: str = "en",
+    fetch_watched: bool = True,
+    concurrency: int = async_scraper.DEFAULT_CONCURRENCY,
+    max_rps: float = scraper.DEFAULT_MAX_RPS,
+    fetch_original_title: bool = True,
+    checkpoint: Optional[PageJournal] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+) -> tuple[dict[str, FilmTable], Optional[FilmTable]]:
+    """
+    Scrape user lists and watched movies with the asynchronous engine.
+
+    All lists and the watched movies are fetched inside one event loop through
+    a single pooled client, so their page and detail requests overlap.
+
+    Args:
+        user_id: FilmAffinity user ID.
+        lists: Mapping of list names to list URLs.
+        lang: Language version ('es' or 'en').
+        fetch_watched: Whether to scrape the watched movies too.
+        concurrency: Maximum number of requests in flight.
+        max_rps: Global requests per second ceiling.
+        fetch_original_title: Whether to fetch original titles while scraping.
+        checkpoint: Optional journal of completed pages, used to continue
+            interrupted lists and watched movies from their next page.
+        rate_limiter: Optional limiter to use instead of a fixed `max_rps` one.
+
+    Returns:
+        Tuple of (list name -> movie data, watched movie data or None).
+    """
+    async with async_scraper.AsyncScraper(
+        concurrency=concurrency, max_rps=max_rps, rate_limiter=rate_limiter
+    ) as fa:
+
+        async def fetch_list(name: str, url: str) -> FilmTable:
+            qprint(f"Parsing list: [turquoise4 bold]{name}[/turquoise4 bold]")
+            _, info = await fa.get_list_movies(
+                url, lang=lang, fetch_original_title=fetch_original_title, checkpoint=checkpoint
+            )
+            return info
+
+        tasks = [fetch_list(name, url) for name, url in lists.items()]
+        if fetch_watched:
+            qprint("Parsing [green bold]watched[/green bold] movies")
+            tasks.append(
+                fa.get_watched_movies(
+                    user_id,
+                    lang=lang,
+                    fetch_original_title=fetch_original_title,
+                    checkpoint=checkpoint,
+                )
+            )
+        results = await asyncio.gather(*tasks)
+
+    scraped_lists = dict(zip(lists, results[: len(lists)]))
+    watched = results[len(lists)] if fetch_watched else None
+    return scraped_lists, watched
+
+
+def _open_caches(
+    data_dir: Path, lang: str, use_cache: bool, cache_ttl: float, refresh_cache: bool
+) -> tuple[Optional[DetailCache], Optional[ResponseCache]]:
+    """Open the caches of the data directory and hand them to the scraper."""
+    cache = None
+    if lang == "es" and use_cache:
+        cache = DetailCache(data_dir / CACHE_FILENAME, ttl=cache_ttl * 86400, refresh=refresh_cache)
+    scraper.set_detail_cache(cache)
+
+    # Unchanged pages are revalidated with conditional requests instead of downloaded
+    page_cache = None
+    if use_cache:
+        page_cache = ResponseCache(data_dir / RESPONSE_CACHE_FILENAME, refresh=refresh_cache)
+    scraper.set_response_cache(page_cache)
+    return cache, page_cache
+
+
+def _close_caches(
+    data_dir: Path,
+    cache: Optional[DetailCache],
+    page_cache: Optional[ResponseCache],
+    limiter: Optional[AdaptiveRateLimiter],
+) -> None:
+    """Close the caches opened by _open_caches and save the learned request rate."""
+    scraper.set_detail_cache(None)
+    if cache is not None:
+        cache.close()
+    scraper.set_response_cache(None)
+    if page_cache is not None:
+        page_cache.close()
+    if limiter is not None:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        limiter.save(data_dir / RATE_STATE_FILENAME)
+
+
+def _report_page_cache(page_cache: Optional[ResponseCache]) -> None:
+    """Print how many pages the page cache saved."""
+    if page_cache is not None and (page_cache.not_modified or page_cache.unchanged):
+        qprint(
+            f"  [dim]Page cache: {page_cache.not_modified} pages not modified, "
+            f"{page_cache.unchanged} not parsed again[/dim]"
+        )
+
+
+def _check_options(lang: str, engine: str) -> None:
+    """Exit with an error message if the language or engine can't be used."""
     if lang not in ("es", "en"):
         print(f"[red]Error: Invalid language '{lang}'. Use 'es' or 'en'.[/red]")
         raise typer.Exit(1)
@@ -189,6 +453,90 @@ def backup(
             "[yellow]Using Spanish version of FilmAffinity. Consider using --lang en for better IMDb matching.[/yellow]"
         )
 
+    if engine == "async" and async_scraper.httpx is None:
+        print("[red]Error: --engine async requires httpx. Install with: pip install httpx[/red]")
+        raise typer.Exit(1)
+
+
+def _start_rate_limiter(
+    data_dir: Path, adaptive_rate: bool, max_rps: float, concurrent: bool
+) -> Optional[AdaptiveRateLimiter]:
+    """
+    Set up the scraper's global rate limiter.
+
+    Args:
+        data_dir: Data directory holding the state of the adaptive rate.
+        adaptive_rate: Use an AdaptiveRateLimiter instead of fixed pauses.
+        max_rps: Ceiling of the adaptive rate, or the fixed rate.
+        concurrent: Whether several requests may run at once (a fixed rate
+            limiter replaces the pauses between pages).
+
+    Returns:
+        The adaptive limiter (to save its state when done), or None.
+    """
+    if not adaptive_rate:
+        scraper.set_rate_limit(max_rps if concurrent else None)
+        return None
+
+    # The adaptive rate starts from the one learned by the previous run
+    limiter = AdaptiveRateLimiter.load(
+        data_dir / RATE_STATE_FILENAME, rate=min(1 / DEFAULT_COOLDOWN, max_rps), max_rate=max_rps
+    )
+    scraper.set_rate_limiter(limiter)
+    return limiter
+
+
+def backup_user(
+    user_id: str,
+    data_dir: Path,
+    lang: str = "en",
+    skip_lists: bool = False,
+    resume: bool = False,
+    export_format: str = "csv",
+    workers: int = 1,
+    engine: str = "sync",
+    max_rps: float = scraper.DEFAULT_MAX_RPS,
+    since: bool = False,
+    rate_limiter: Optional[TokenBucket] = None,
+    detail_cache: Optional[DetailCache] = None,
+    interactive: bool = True,
+) -> int:
+    """
+    Back up one user's lists and watched movies to `data_dir/<user_id>`.
+
+    Requests go through the scraper's shared session, rate limiter and caches
+    (see set_rate_limiter, set_detail_cache and set_response_cache), so
+    several users can be backed up one after the other or side by side.
+
+    Args:
+        user_id: FilmAffinity user ID.
+        data_dir: Directory holding one subdirectory per user.
+        lang: Language version ('es' or 'en').
+        skip_lists: Only back up the watched movies.
+        resume: Skip files already downloaded and continue interrupted ones.
+        export_format: 'csv', 'letterboxd' or 'json'.
+        workers: Maximum number of lists (and pages, and original titles)
+            scraped concurrently; with engine 'async', requests in flight.
+        engine: 'sync' or 'async'.
+        max_rps: Requests per second of the async engine when no
+            `rate_limiter` is given.
+        since: Only fetch ratings added or changed since the previous
+            watched.csv and merge them into it.
+        rate_limiter: Limiter shared with the async engine.
+        detail_cache: Cache of movie details, only used to report its hits.
+        interactive: Ask before continuing when the user has no public lists
+            (otherwise continue with a warning).
+
+    Returns:
+        Number of movie tables saved.
+
+    Raises:
+        ScraperError: If the user doesn't exist or FilmAffinity can't be scraped.
+    """
+    # File name -> movie data, or path of a CSV file already written
+    data: dict[str, Union[Mapping[str, list[Any]], Path]] = {}
+    user_dir = data_dir / user_id
+
     # Load existing data if resuming
     existing_data = {}
     if resume and user_dir.exists():
@@ -196,10 +544,7 @@ def backup(
         existing_data = load_existing_data(user_dir)
 
     # Check user exists
-    try:
-        scraper.check_user(user_id, lang=lang)
-    except ScraperError as e:
-        _handle_scraper_error(e)
+    scraper.check_user(user_id, lang=lang)
 
     # Download lists
     if skip_lists:
@@ -207,10 +552,7 @@ def backup(
         lists = {}
     else:
         qprint("Retrieving [hot_pink3 bold]user lists[/hot_pink3 bold]")
-        try:
-            lists = scraper.get_user_lists(user_id, lang=lang)
-        except ScraperError as e:
-            _handle_scraper_error(e)
+        lists = scraper.get_user_lists(user_id, lang=lang)
 
         if not lists:
             qprint(
@@ -218,69 +560,458 @@ def backup(
                 "Make sure to mark your lists as :earth_americas: [b u]public[/b u] to "
                 "be able to backup them."
             )
-            inp = input(
-                "   Do you want to continue with watched movies and erase previous list data (if any)? [y/n]"
-            )
-            if inp != "y":
-                raise typer.Exit(0)
+            if interactive:
+                inp = input(
+                    "   Do you want to continue with watched movies and erase previous list data (if any)? [y/n]"
+                )
+                if inp != "y":
+                    raise typer.Exit(0)
 
     # Process each list
+    pending_lists = {}
     for name, url in lists.items():
-        list_key = f"list - {name}"
-
-        if resume and list_key in existing_data:
+        if resume and f"list - {name}" in existing_data:
             qprint(
                 f"[dim]Skipping list (already downloaded): [turquoise4]{name}[/turquoise4][/dim]"
             )
-            data[list_key] = existing_data[list_key]
             continue
+        pending_lists[name] = url
+
+    # Incremental mode starts from the previous watched.csv, if there is one
+    previous_watched = None
+    if since:
+        previous_watched = existing_data.get("watched")
+        if previous_watched is None and (user_dir / "watched.csv").exists():
+            previous_watched = load_csv(user_dir / "watched.csv")
+        if previous_watched is None:
+            qprint("[yellow]No previous watched.csv found, downloading all ratings[/yellow]")
+
+    fetch_watched = previous_watched is None and not (resume and "watched" in existing_data)
+    if not fetch_watched and previous_watched is None:
+        qprint("[dim]Skipping watched movies (already downloaded)[/dim]")
 
-        qprint(f"Parsing list: [turquoise4 bold]{name}[/turquoise4 bold]")
-        try:
-            _, info = scraper.get_list_movies(url, lang=lang)
-            data[list_key] = info
-        except ScraperError as e:
-            _handle_scraper_error(e)
+    # Files are written as they are scraped, so the user directory must exist
+    user_dir.mkdir(parents=True, exist_ok=True)
 
-    # Download watched movies
-    if resume and "watched" in existing_data:
-        qprint("[dim]Skipping watched movies (already downloaded)[/dim]")
-        data["watched"] = existing_data["watched"]
+    # Streamed pages get their original titles before being written
+    titles: dict[str, str] = {}
+    enrich: Optional[Callable[[FilmTable], None]] = None
+    if lang == "es":
+        enrich = partial(enrichment.enrich_table, titles=titles, workers=workers)
+
+    scraped_lists: dict[str, FilmTable] = {}
+    streamed: dict[str, Path] = {}
+    watched = None
+    checked = 0
+    if engine == "async":
+        # Pages are kept in memory, so completed ones are journaled instead
+        checkpoint_path = user_dir / CHECKPOINT_FILENAME
+        if not resume:
+            checkpoint_path.unlink(missing_ok=True)
+        concurrency = workers if workers > 1 else async_scraper.DEFAULT_CONCURRENCY
+        scraped_lists, watched = asyncio.run(
+            scrape_async(
+                user_id,
+                pending_lists,
+                lang=lang,
+                fetch_watched=fetch_watched,
+                concurrency=concurrency,
+                max_rps=max_rps,
+                fetch_original_title=False,
+                checkpoint=PageJournal(checkpoint_path),
+                rate_limiter=rate_limiter,
+            )
+        )
     else:
-        qprint("Parsing [green bold]watched[/green bold] movies")
-        try:
-            data["watched"] = scraper.get_watched_movies(user_id, lang=lang)
-        except ScraperError as e:
-            _handle_scraper_error(e)
+        for name, path in stream_lists(
+            pending_lists, user_dir, lang=lang, workers=workers, resume=resume, enrich=enrich
+        ).items():
+            streamed[f"list - {name}"] = path
+        if fetch_watched:
+            qprint("Parsing [green bold]watched[/green bold] movies")
+            streamed["watched"] = stream_movies(
+                user_dir / "watched.csv",
+                scraper.WATCHED_COLUMNS,
+                partial(
+                    scraper.get_watched_movies,
+                    user_id,
+                    lang=lang,
+                    fetch_original_title=False,
+                    workers=workers,
+                ),
+                resume=resume,
+                enrich=enrich,
+            )
 
-    # Clear previous user data (only if not resuming)
-    if not resume:
-        if user_dir.exists():
-            shutil.rmtree(user_dir)
-    if not user_dir.exists():
-        user_dir.mkdir(parents=True)
+    if previous_watched is not None:
+        qprint("Checking for new [green bold]watched[/green bold] movies")
+        watched = scraper.get_new_watched_movies(
+            user_id,
+            scraper.index_ratings(previous_watched),
+            lang=lang,
+            fetch_original_title=False,
+        )
+        qprint(f"  [dim]{len(watched['FA movie ID'])} new or changed ratings[/dim]")
+
+    # Original titles of tables kept in memory are fetched once per distinct
+    # movie, after all cards are in
+    scraped = list(scraped_lists.values()) + ([watched] if watched is not None else [])
+    if lang == "es" and scraped:
+        qprint("Fetching [bold]original titles[/bold]")
+        checked = enrichment.enrich_original_titles(
+            scraped, workers=workers, journal_path=user_dir / enrichment.JOURNAL_FILENAME
+        )
+
+    if lang == "es":
+        cached = f", {detail_cache.hits} from cache" if detail_cache is not None else ""
+        qprint(f"  [dim]Checked {checked + len(titles)} distinct movies{cached}[/dim]")
+
+    for name in lists:
+        list_key = f"list - {name}"
+        if list_key in streamed:
+            data[list_key] = streamed[list_key]
+        elif name in scraped_lists:
+            data[list_key] = scraped_lists[name]
+        else:
+            data[list_key] = existing_data[list_key]
+
+    # Watched movies are saved after the lists
+    if previous_watched is not None:
+        data["watched"] = scraper.merge_movie_info(watched, previous_watched)
+    elif "watched" in streamed:
+        data["watched"] = streamed["watched"]
+    else:
+        data["watched"] = watched if fetch_watched else existing_data["watched"]
 
-    # Save data to files
+    # Save data to files (streamed ones are already on disk)
     qprint(f"Saving files to [bold]{user_dir}[/bold]")
+    written = {enrichment.JOURNAL_FILENAME, CHECKPOINT_FILENAME}
     for k, v in data.items():
         csv_path = user_dir / f"{k}.csv"
+        written.add(csv_path.name)
 
         # Always save the standard CSV (semicolon-delimited)
-        df = pd.DataFrame.from_dict(v)
-        df.to_csv(csv_path, sep=";", index=False)
+        if isinstance(v, Path):
+            films: Mapping[str, list[Any]] = load_saved(csv_path) if export_format != "csv" else {}
+        else:
+            films = v
+            df = to_frame(films)
+            df.to_csv(csv_path, sep=";", index=False)
         qprint(f"  [green]✓ Saved: {csv_path}[/green]")
 
         # Additionally save other formats if requested
         if export_format == "letterboxd":
             letterboxd_path = user_dir / f"{k}_letterboxd.csv"
-            export_to_letterboxd(v, letterboxd_path)
+            export_to_letterboxd(films, letterboxd_path)
+            written.add(letterboxd_path.name)
             qprint(f"  [green]✓ Saved Letterboxd CSV: {letterboxd_path}[/green]")
         elif export_format == "json":
             json_path = user_dir / f"{k}.json"
-            export_to_json(v, json_path)
+            export_to_json(films, json_path)
+            written.add(json_path.name)
             qprint(f"  [green]✓ Saved JSON: {json_path}[/green]")
 
-    qprint(f"[green]✅ Backup complete! {len(data)} files saved.[/green]")
+    # Clear previous user data (only if not resuming)
+    if not resume:
+        remove_stale_files(user_dir, keep=written)
+
+    # Original titles and scraped pages are safely in the CSV files now
+    (user_dir / enrichment.JOURNAL_FILENAME).unlink(missing_ok=True)
+    (user_dir / CHECKPOINT_FILENAME).unlink(missing_ok=True)
+
+    return len(data)
+
+
+# Options shared by the backup and batch commands
+_SkipListsOption = Annotated[
+    bool,
+    typer.Option("--skip-lists", help="Skip downloading user lists, only get watched films"),
+]
+_ResumeOption = Annotated[
+    bool,
+    typer.Option("--resume", help="Resume interrupted session, skip already downloaded lists"),
+]
+_LangOption = Annotated[
+    str,
+    typer.Option(
+        "--lang",
+        help="Language for FilmAffinity (es/en). Default: 'en' for better IMDb matching",
+    ),
+]
+_DataDirOption = Annotated[Path, typer.Option("--data-dir", help="Directory to save CSV files")]
+_FormatOption = Annotated[
+    str,
+    typer.Option(
+        "--format",
+        help="Export format: 'csv' (default, semicolon-delimited), 'letterboxd' (Letterboxd-compatible CSV), or 'json'",
+        click_type=click.Choice(["csv", "letterboxd", "json"]),
+    ),
+]
+_QuietOption = Annotated[
+    bool, typer.Option("--quiet", "-q", help="Minimal output, only show errors")
+]
+_WorkersOption = Annotated[
+    int,
+    typer.Option(
+        "--workers",
+        "-j",
+        min=1,
+        help="Number of lists, and of pages of each list, to scrape concurrently "
+        "(all workers share one global rate limit). "
+        "With --engine async: maximum requests in flight",
+    ),
+]
+_MaxRpsOption = Annotated[
+    float,
+    typer.Option(
+        "--max-rps",
+        min=0.01,
+        help="Global requests per second allowed to filmaffinity.com (the ceiling of the "
+        "adaptive rate, or the fixed rate when --workers > 1 or --engine async)",
+    ),
+]
+_AdaptiveRateOption = Annotated[
+    bool,
+    typer.Option(
+        "--adaptive-rate/--fixed-rate",
+        help="Adapt the request rate to how FilmAffinity responds, up to --max-rps, "
+        "instead of fixed pauses between pages",
+    ),
+]
+_EngineOption = Annotated[
+    str,
+    typer.Option(
+        "--engine",
+        help="HTTP engine: 'sync' (default, requests) or 'async' (asyncio + httpx, overlaps requests)",
+        click_type=click.Choice(["sync", "async"]),
+    ),
+]
+_CacheOption = Annotated[
+    bool,
+    typer.Option(
+        "--cache/--no-cache",
+        help="Cache list and ratings pages (revalidated on each run) and movie details "
+        "(original titles, --lang es) in the data directory",
+    ),
+]
+_RefreshCacheOption = Annotated[
+    bool,
+    typer.Option(
+        "--refresh-cache", help="Ignore cached pages and movie details and fetch them again"
+    ),
+]
+_CacheTtlOption = Annotated[
+    float,
+    typer.Option(
+        "--cache-ttl", min=0, help="Days after which cached movie details are fetched again"
+    ),
+]
+_SinceOption = Annotated[
+    bool,
+    typer.Option(
+        "--since",
+        help="Incremental backup: only fetch ratings added or changed since the previous "
+        "watched.csv and merge them into it",
+    ),
+]
+
+
+@app.command()
+def backup(
+    user_id: str = typer.Argument(..., help="FilmAffinity user ID"),
+    skip_lists: _SkipListsOption = False,
+    resume: _ResumeOption = False,
+    lang: _LangOption = "en",
+    data_dir: _DataDirOption = DEFAULT_DATA_DIR,
+    export_format: _FormatOption = "csv",
+    quiet: _QuietOption = False,
+    workers: _WorkersOption = 1,
+    max_rps: _MaxRpsOption = scraper.DEFAULT_MAX_RPS,
+    adaptive_rate: _AdaptiveRateOption = True,
+    engine: _EngineOption = "sync",
+    use_cache: _CacheOption = True,
+    refresh_cache: _RefreshCacheOption = False,
+    cache_ttl: _CacheTtlOption = DEFAULT_CACHE_TTL_DAYS,
+    since: _SinceOption = False,
+):
+    """
+    Backup FilmAffinity data (watched movies and lists) to CSV files.
+
+    To find your user_id, go to 'Mis votaciones' and copy the ID from the URL:
+    https://www.filmaffinity.com/es/userratings.php?user_id={YOUR_ID}
+    """
+    global _quiet_mode
+    _quiet_mode = quiet
+
+    _check_options(lang, engine)
+    limiter = _start_rate_limiter(data_dir, adaptive_rate, max_rps, concurrent=workers > 1)
+    cache, page_cache = _open_caches(data_dir, lang, use_cache, cache_ttl, refresh_cache)
+
+    try:
+        saved = backup_user(
+            user_id,
+            data_dir,
+            lang=lang,
+            skip_lists=skip_lists,
+            resume=resume,
+            export_format=export_format,
+            workers=workers,
+            engine=engine,
+            max_rps=max_rps,
+            since=since,
+            rate_limiter=limiter,
+            detail_cache=cache,
+        )
+    except ScraperError as e:
+        _handle_scraper_error(e)
+    finally:
+        _close_caches(data_dir, cache, page_cache, limiter)
+
+    qprint(f"[green]✅ Backup complete! {saved} files saved.[/green]")
+
+
+def read_user_ids(path: Path) -> list[str]:
+    """
+    Read the user IDs of a batch file.
+
+    One ID per line; blank lines and lines starting with '#' are skipped, and
+    repeated IDs are only kept once.
+    """
+    user_ids: dict[str, None] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            user_ids[line] = None
+    return list(user_ids)
+
+
+def _describe_error(error: Exception) -> str:
+    """One-line description of the error of a failed user for the batch report.
+
+    Errors other than scraper errors are unexpected, so their type is named.
+    """
+    if isinstance(error, UserNotFoundError):
+        return "User not found"
+    if isinstance(error, RateLimitError):
+        return "Rate limited"
+    message = str(error).splitlines()[0] if str(error) else ""
+    if isinstance(error, ScraperError):
+        return message or type(error).__name__
+    return f"{type(error).__name__}: {message}" if message else type(error).__name__
+
+
+@app.command()
+def batch(
+    users_file: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="File with one FilmAffinity user ID per line ('#' starts a comment)",
+    ),
+    concurrent_users: int = typer.Option(
+        1,
+        "--users",
+        "-u",
+        min=1,
+        help="Number of users backed up at the same time (all share one rate limit)",
+    ),
+    report: Optional[Path] = typer.Option(
+        None,
+        "--report",
+        help=f"CSV file for the summary report (default: {BATCH_REPORT_FILENAME} in the data directory)",
+    ),
+    skip_lists: _SkipListsOption = False,
+    resume: _ResumeOption = False,
+    lang: _LangOption = "en",
+    data_dir: _DataDirOption = DEFAULT_DATA_DIR,
+    export_format: _FormatOption = "csv",
+    quiet: _QuietOption = False,
+    workers: _WorkersOption = 1,
+    max_rps: _MaxRpsOption = scraper.DEFAULT_MAX_RPS,
+    adaptive_rate: _AdaptiveRateOption = True,
+    engine: _EngineOption = "sync",
+    use_cache: _CacheOption = True,
+    refresh_cache: _RefreshCacheOption = False,
+    cache_ttl: _CacheTtlOption = DEFAULT_CACHE_TTL_DAYS,
+    since: _SinceOption = False,
+):
+    """
+    Back up several FilmAffinity users listed in a file.
+
+    Each user is saved to its own directory inside the data directory, as
+    with the backup command. All users share one connection pool, one rate
+    limiter and the same caches, and a failed user doesn't stop the others.
+    """
+    global _quiet_mode
+    _quiet_mode = quiet
+
+    user_ids = read_user_ids(users_file)
+    if not user_ids:
+        print(f"[red]Error: No user IDs found in {users_file}[/red]")
+        raise typer.Exit(1)
+
+    _check_options(lang, engine)
+    limiter = _start_rate_limiter(
+        data_dir, adaptive_rate, max_rps, concurrent=workers > 1 or concurrent_users > 1
+    )
+    cache, page_cache = _open_caches(data_dir, lang, use_cache, cache_ttl, refresh_cache)
+
+    def backup_one(user_id: str) -> dict[str, Any]:
+        qprint(f"[bold]User {user_id}[/bold]")
+        started = time.monotonic()
+        result: dict[str, Any] = {"user_id": user_id, "status": "ok", "files": 0, "error": ""}
+        try:
+            result["files"] = backup_user(
+                user_id,
+                data_dir,
+                lang=lang,
+                skip_lists=skip_lists,
+                resume=resume,
+                export_format=export_format,
+                workers=workers,
+                engine=engine,
+                max_rps=max_rps,
+                since=since,
+                rate_limiter=limiter,
+                detail_cache=cache,
+                interactive=False,
+            )
+        except Exception as e:
+            # Any failure (network, disk, CSV export) is isolated to this user;
+            # KeyboardInterrupt is not an Exception and still stops the batch
+            result.update(status="failed", error=_describe_error(e))
+            print(f"[red]✗ User {user_id}: {result['error']}[/red]")
+        result["seconds"] = round(time.monotonic() - started, 1)
+        return result
+
+    try:
+        if concurrent_users > 1 and len(user_ids) > 1:
+            with ThreadPoolExecutor(
+                max_workers=concurrent_users, thread_name_prefix="fa-user"
+            ) as executor:
+                results = list(executor.map(backup_one, user_ids))
+        else:
+            results = [backup_one(user_id) for user_id in user_ids]
+    finally:
+        _close_caches(data_dir, cache, page_cache, limiter)
+
+    _report_page_cache(page_cache)
+
+    report_path = report or data_dir / BATCH_REPORT_FILENAME
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(results, columns=["user_id", "status", "files", "seconds", "error"]).to_csv(
+        report_path, sep=";", index=False
+    )
+
+    failed = [result for result in results if result["status"] != "ok"]
+    qprint(f"Report saved to [bold]{report_path}[/bold]")
+    if failed:
+        print(
+            f"[yellow]⚠ Batch finished: {len(results) - len(failed)} of {len(results)} users "
+            f"backed up, {len(failed)} failed[/yellow]"
+        )
+        raise typer.Exit(1)
+    qprint(f"[green]✅ Batch complete! {len(results)} users backed up.[/green]")
 
 
 def main():
@@ -0,0 +1,203 @@
+"""
+Original title enrichment for scraped FilmAffinity data.
+
+The Spanish site only shows localized titles in list and ratings pages, so the
+original title has to be read from each movie's detail page. Instead of doing
+that while paginating (one extra request per card), this module runs it as a
+separate stage: movie IDs are de-duplicated across watched movies and all
+lists, fetched once each with bounded concurrency, and written back into every
+dataset.
+
+Fetched titles are appended to a small JSON Lines journal as they arrive, so an
+interrupted run can pick up where it left off without re-fetching them.
+"""
+
+import json
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from filmaffinity import scraper
+from filmaffinity.records import FilmTable
+
+JOURNAL_FILENAME = ".original_titles.jsonl"
+
+
+def collect_movie_ids(datasets: Iterable[Mapping[str, list[Any]]]) -> list[str]:
+    """
+    Collect the unique FA movie IDs of several datasets, in first-seen order.
+
+    Args:
+        datasets: Movie tables (as returned by get_list_movies/get_watched_movies).
+
+    Returns:
+        List of distinct movie IDs (as strings).
+    """
+    seen: dict[str, None] = {}
+    for info in datasets:
+        for movie_id in info.get("FA movie ID", []):
+            if movie_id:
+                seen.setdefault(str(movie_id), None)
+    return list(seen)
+
+
+def load_journal(journal_path: Path) -> dict[str, str]:
+    """
+    Load original titles recorded by a previous (possibly interrupted) run.
+
+    Unreadable lines, such as one truncated by a crash, are ignored.
+    """
+    titles: dict[str, str] = {}
+    if not journal_path.exists():
+        return titles
+
+    with open(journal_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                titles[str(entry["id"])] = entry["original_title"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+    return titles
+
+
+def fetch_original_titles(
+    movie_ids: Iterable[str],
+    workers: int = 1,
+    journal_path: Optional[Path] = None,
+    fetch: Optional[Callable[[str], str]] = None,
+) -> dict[str, str]:
+    """
+    Fetch the original title of each movie, skipping those already journaled.
+
+    With more than one worker, detail pages are fetched concurrently and are
+    paced by the scraper's global rate limiter (see scraper.set_rate_limit).
+    Otherwise they are fetched one by one with a short cooldown in between.
+
+    Args:
+        movie_ids: Movie IDs to fetch.
+        workers: Maximum number of detail pages fetched concurrently.
+        journal_path: Optional JSON Lines file used to persist progress.
+        fetch: Function returning the original title for a movie ID
+            (default: scraper.get_original_title).
+
+    Returns:
+        Mapping of movie ID to original title ('' when not available).
+    """
+    fetch = fetch or scraper.get_original_title
+    titles = load_journal(journal_path) if journal_path else {}
+    pending = [movie_id for movie_id in dict.fromkeys(movie_ids) if movie_id not in titles]
+    if not pending:
+        return titles
+
+    journal = open(journal_path, "a", encoding="utf-8") if journal_path else None
+
+    def record(movie_id: str, original_title: str) -> None:
+        titles[movie_id] = original_title
+        # Empty results may be transient failures, so they are retried on resume
+        if journal is not None and original_title:
+            journal.write(json.dumps({"id": movie_id, "original_title": original_title}) + "\n")
+            journal.flush()
+
+    # Movies in the detail cache need no request (and no cooldown)
+    not_cached = []
+    for movie_id in pending:
+        cached = scraper.get_cached_original_title(movie_id)
+        if cached is None:
+            not_cached.append(movie_id)
+        else:
+            titles[movie_id] = cached
+    pending = not_cached
+
+    try:
+        if workers <= 1 or len(pending) <= 1:
+            for movie_id in pending:
+                record(movie_id, fetch(movie_id))
+                scraper.page_cooldown(scraper.DETAIL_COOLDOWN)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="fa-detail"
+            ) as executor:
+                futures = {executor.submit(fetch, movie_id): movie_id for movie_id in pending}
+                # Results are recorded from this thread only, so the journal needs no lock
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+    finally:
+        if journal is not None:
+            journal.close()
+
+    return titles
+
+
+def apply_original_titles(info: Mapping[str, list[Any]], titles: dict[str, str]) -> None:
+    """
+    Fill the 'original title' column of a movie table (or data dict) in place.
+
+    The original title is left empty when it matches the localized title, as
+    done by parse_movie_card.
+    """
+    if "original title" not in info:
+        return
+
+    if isinstance(info, FilmTable):
+        for record in info.records:
+            original_title = titles.get(str(record.fa_movie_id))
+            if original_title:
+                record.original_title = scraper.distinct_original_title(
+                    original_title, record.title
+                )
+        return
+
+    for row, movie_id in enumerate(info["FA movie ID"]):
+        original_title = titles.get(str(movie_id))
+        if original_title:
+            info["original title"][row] = scraper.distinct_original_title(
+                original_title, info["title"][row]
+            )
+
+
+def enrich_original_titles(
+    datasets: Iterable[Mapping[str, list[Any]]],
+    workers: int = 1,
+    journal_path: Optional[Path] = None,
+) -> int:
+    """
+    Fetch and fill original titles for several datasets at once.
+
+    Each distinct movie is fetched a single time, however many datasets it
+    appears in.
+
+    Args:
+        datasets: Movie tables to enrich in place.
+        workers: Maximum number of detail pages fetched concurrently.
+        journal_path: Optional JSON Lines file used to persist progress.
+
+    Returns:
+        Number of distinct movies enriched.
+    """
+    datasets = list(datasets)
+    movie_ids = collect_movie_ids(datasets)
+    titles = fetch_original_titles(movie_ids, workers=workers, journal_path=journal_path)
+    for info in datasets:
+        apply_original_titles(info, titles)
+    return len(movie_ids)
+
+
+def enrich_table(info: FilmTable, titles: dict[str, str], workers: int = 1) -> None:
+    """
+    Fill original titles of a single table, such as one scraped page.
+
+    Used when pages are written out as they are scraped. Titles already in
+    `titles` are reused and newly fetched ones are added to it, so a movie
+    shared by several pages or lists is only fetched once per run.
+
+    Args:
+        info: Movie table to enrich in place.
+        titles: Movie ID -> original title fetched so far (updated in place).
+        workers: Maximum number of detail pages fetched concurrently.
+    """
+    missing = [movie_id for movie_id in collect_movie_ids([info]) if movie_id not in titles]
+    if missing:
+        titles.update(fetch_original_titles(missing, workers=workers))
+    apply_original_titles(info, titles)
@@ -2,18 +2,21 @@
 
 import csv
 import json
+from collections.abc import Mapping
 from itertools import zip_longest
 from pathlib import Path
 from typing import Any, TextIO, Union
 
+from filmaffinity.records import FilmTable
 
-def export_to_letterboxd(films: dict[str, list[Any]], output: Union[str, Path, TextIO]) -> None:
+
+def export_to_letterboxd(films: Mapping[str, list[Any]], output: Union[str, Path, TextIO]) -> None:
     """Export films dict to Letterboxd-compatible CSV.
 
     Letterboxd import format: https://letterboxd.com/about/importing-data/
 
     Args:
-        films: Dict with keys 'title', 'year', 'user score', 'original title'
+        films: FilmTable or dict with keys 'title', 'year', 'user score', 'original title'
         output: File path or file-like object
     """
     fh: TextIO
@@ -28,14 +31,19 @@ def export_to_letterboxd(films: dict[str, list[Any]], output: Union[str, Path, T
         writer = csv.writer(fh)
         writer.writerow(["Title", "Year", "Rating10", "WatchedDate"])
 
-        titles = films.get("title", [])
-        original_titles = films.get("original title", [])
-        years = films.get("year", [])
-        scores = films.get("user score", [])
+        rows: Any
+        if isinstance(films, FilmTable):
+            rows = films.iter_rows("title", "original title", "year", "user score")
+        else:
+            rows = zip_longest(
+                films.get("title", []),
+                films.get("original title", []),
+                films.get("year", []),
+                films.get("user score", []),
+                fillvalue="",
+            )
 
-        for local, original, year, score in zip_longest(
-            titles, original_titles, years, scores, fillvalue=""
-        ):
+        for local, original, year, score in rows:
             # Prefer original title if non-empty after stripping whitespace
             original_clean = original.strip() if original else ""
             title = original_clean if original_clean else local
@@ -47,11 +55,11 @@ def export_to_letterboxd(films: dict[str, list[Any]], output: Union[str, Path, T
             fh.close()
 
 
-def export_to_json(films: dict[str, list[Any]], output: Union[str, Path, TextIO]) -> None:
+def export_to_json(films: Mapping[str, list[Any]], output: Union[str, Path, TextIO]) -> None:
     """Export films dict to JSON format.
 
     Args:
-        films: Dict with film data where keys are column names and values are lists
+        films: FilmTable, or dict with film data where keys are column names and values are lists
         output: File path or file-like object
     """
     fh: TextIO
@@ -65,7 +73,9 @@ def export_to_json(films: dict[str, list[Any]], output: Union[str, Path, TextIO]
     try:
         # Convert the films dict to a list of film objects
         film_list = []
-        if films:
+        if isinstance(films, FilmTable):
+            film_list = list(films.rows())
+        elif films:
             # Get the length of the longest list to know how many films we have
             max_len = max(len(values) for values in films.values()) if films else 0
 
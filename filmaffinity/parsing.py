@@ -0,0 +1,247 @@
+"""
+HTML parsing backends for the FilmAffinity scraper.
+
+Two backends are available:
+
+- ``lxml``: pages are parsed with lxml and the fields are read with
+  precompiled XPath expressions. Used by default when lxml is installed
+  (``pip install filmaffinity-backup[fast]``).
+- ``html.parser``: pages are parsed with BeautifulSoup and Python's built-in
+  parser. Only the part of each page the scraper reads is turned into a tree
+  (see the *_PAGE strainers).
+
+parse_page returns an opaque page object; the parse_* functions of
+filmaffinity.scraper accept pages of either backend and produce the same data.
+"""
+
+from typing import Any, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None  # type: ignore[assignment]
+
+PARSERS = ("lxml", "html.parser")
+DEFAULT_PARSER = "lxml" if lxml is not None else "html.parser"
+
+# Parts of each page read by the scraper (html.parser backend only)
+USER_LISTS_PAGE = SoupStrainer(class_="fa-list-group")
+LIST_PAGE = SoupStrainer(class_=["fa-list-group", "fs-5"])
+WATCHED_PAGE = SoupStrainer("div", class_="user-ratings-list-resp")
+DETAIL_PAGE = SoupStrainer("dl", class_="movie-info")
+
+_parser = DEFAULT_PARSER
+
+
+def set_parser(name: Optional[str]) -> None:
+    """
+    Select the parsing backend used for every page.
+
+    Args:
+        name: 'lxml' or 'html.parser', or None for the default (lxml when
+            installed).
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If 'lxml' is requested but not installed.
+    """
+    global _parser
+    if name is None:
+        _parser = DEFAULT_PARSER
+        return
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser '{name}'. Use one of: {', '.join(PARSERS)}")
+    if name == "lxml" and lxml is None:
+        raise ImportError("The lxml parser requires lxml. Install with: pip install lxml")
+    _parser = name
+
+
+def get_parser() -> str:
+    """Return the name of the parsing backend in use."""
+    return _parser
+
+
+def parse_page(markup: str, strainer: Optional[SoupStrainer] = None) -> Any:
+    """
+    Parse a page with the configured backend.
+
+    Args:
+        markup: Page HTML.
+        strainer: Part of the page to keep with the html.parser backend (one
+            of the *_PAGE constants of this module). Ignored by lxml, which
+            builds the whole tree faster than BeautifulSoup filters it.
+
+    Returns:
+        A BeautifulSoup document or an lxml element, to be passed to the
+        scraper's parse_* functions.
+    """
+    if _parser == "lxml":
+        return _lxml_document(markup)
+    return BeautifulSoup(markup, "html.parser", parse_only=strainer)
+
+
+def is_lxml(page: Any) -> bool:
+    """Return whether a page was parsed by the lxml backend."""
+    return lxml is not None and isinstance(page, etree._Element)
+
+
+# =============================================================================
+# lxml backend
+# =============================================================================
+
+
+def _lxml_document(markup: str) -> Any:
+    if not markup.strip():
+        markup = "<html></html>"
+    try:
+        return lxml.html.document_fromstring(markup)
+    except ValueError:
+        # Unicode strings with an encoding declaration must be given as bytes
+        return lxml.html.document_fromstring(markup.encode("utf-8"))
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements with the given class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if lxml is not None:
+    _USER_LISTS_CONTAINER = etree.XPath(f"(//*[{_has_class('fa-list-group')}])[1]")
+    _LIST_CONTAINER = etree.XPath(f"(//ul[{_has_class('fa-list-group')}])[1]")
+    _LIST_TITLE = etree.XPath(f"(//span[{_has_class('fs-5')}])[1]")
+    _WATCHED_GROUPS = etree.XPath(f"//div[{_has_class('user-ratings-list-resp')}]")
+    _WATCHED_ROWS = etree.XPath(".//div[@class='row mb-4']")
+    _MOVIE_INFO = etree.XPath(f"(//dl[{_has_class('movie-info')}])[1]")
+    _ITEMS = etree.XPath(".//li")
+    _LINKS = etree.XPath(".//a")
+    _USER_SCORE = etree.XPath(f"(.//*[{_has_class('fa-user-rat-box')}])[1]")
+    _MOVIE_CARD = etree.XPath(f"(.//div[{_has_class('movie-card')}])[1]")
+    _CARD_TITLE_LINK = etree.XPath(f"((.//*[{_has_class('mc-title')}])[1]//a)[1]")
+    _CARD_AVG = etree.XPath(f"(.//*[{_has_class('avg')}])[1]")
+    _CARD_COUNTRY = etree.XPath(f"(.//img[{_has_class('nflag')}])[1]/@alt")
+    _CARD_YEARS = etree.XPath(f".//span[{_has_class('mc-year')}]")
+    _CARD_DIRECTORS = etree.XPath(f"(.//*[{_has_class('mc-director')}])[1]")
+
+
+def _first(elements: list) -> Any:
+    return elements[0] if elements else None
+
+
+def lxml_user_lists(page: Any) -> Optional[dict[str, str]]:
+    """lxml version of scraper.parse_user_lists_page."""
+    container = _first(_USER_LISTS_CONTAINER(page))
+    if container is None:
+        return None
+
+    items = _ITEMS(container)
+    if not items:
+        return None
+
+    found = {}
+    for item in items:
+        for link in _LINKS(item):
+            if link.get("class", "").split() != ["ls-imgs"]:
+                if link.get("href"):
+                    found[link.text_content()] = link.get("href")
+                break
+    return found
+
+
+def lxml_list_title(page: Any) -> str:
+    """lxml version of scraper.parse_list_title."""
+    title = _first(_LIST_TITLE(page))
+    text = title.text_content() if title is not None else ""
+    return text.split(":")[1].strip() if ":" in text else ""
+
+
+def lxml_movie_card(card: Any) -> Optional[dict[str, str]]:
+    """lxml version of scraper.read_movie_card."""
+    movie_id = card.get("data-movie-id")
+    title_link = _first(_CARD_TITLE_LINK(card))
+    if not movie_id or title_link is None:
+        return None
+
+    avg = _first(_CARD_AVG(card))
+    country = _first(_CARD_COUNTRY(card))
+    years = [text for text in (year.text_content() for year in _CARD_YEARS(card)) if text]
+    directors = _first(_CARD_DIRECTORS(card))
+    return {
+        "FA movie ID": movie_id,
+        "full title": title_link.text_content().strip(),
+        "FA score": avg.text_content() if avg is not None else "",
+        "country": country.strip() if country else "",
+        "year": years[0] if years else "",
+        "directors": (
+            ", ".join(link.text_content() for link in _LINKS(directors))
+            if directors is not None
+            else ""
+        ),
+    }
+
+
+def lxml_list_items(page: Any) -> Optional[list[tuple[str, Optional[dict[str, str]]]]]:
+    """
+    Read the movies of a user list page.
+
+    Returns:
+        (user score, card fields or None) for each rated item, or None if the
+        page has no movie container or no items.
+    """
+    container = _first(_LIST_CONTAINER(page))
+    if container is None:
+        return None
+
+    items = _ITEMS(container)
+    if not items:
+        return None
+
+    movies = []
+    for item in items:
+        user_score = _first(_USER_SCORE(item))
+        if user_score is None:
+            continue
+        movies.append((user_score.text_content(), lxml_movie_card(item)))
+    return movies
+
+
+def lxml_watched_items(page: Any) -> Optional[list[tuple[str, Optional[dict[str, str]]]]]:
+    """
+    Read the movies of a user ratings page.
+
+    Returns:
+        (user score, card fields or None) for each rated movie, or None if the
+        page has no rating groups.
+    """
+    groups = _WATCHED_GROUPS(page)
+    if not groups:
+        return None
+
+    movies = []
+    for group in groups:
+        for row in _WATCHED_ROWS(group):
+            user_score = _first(_USER_SCORE(row))
+            card = _first(_MOVIE_CARD(row))
+            if user_score is None or card is None:
+                continue
+            movies.append((user_score.text_content().strip(), lxml_movie_card(card)))
+    return movies
+
+
+def lxml_original_title(page: Any) -> str:
+    """lxml version of scraper.parse_original_title."""
+    movie_info = _first(_MOVIE_INFO(page))
+    if movie_info is None:
+        return ""
+
+    for dt in movie_info.iter("dt"):
+        if "original" in dt.text_content().lower():
+            dd = next(dt.itersiblings("dd"), None)
+            if dd is not None:
+                original_title = "".join(text.strip() for text in dd.itertext() if text.strip())
+                if "aka" in original_title:
+                    original_title = original_title.split("aka")[0].strip()
+                return original_title
+    return ""
@@ -0,0 +1,193 @@
+"""
+Request rate limiting for the FilmAffinity scraper.
+
+A token bucket shared by every worker that talks to filmaffinity.com, so
+that concurrent scrapes respect one global requests-per-second ceiling.
+AdaptiveRateLimiter adjusts that ceiling to how the server is responding.
+"""
+
+import email.utils
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+RATE_STATE_FILENAME = ".rate_limit.json"
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are refilled continuously at ``rate`` tokens per second, up to
+    ``burst`` tokens. Each request consumes one token; callers that find the
+    bucket empty are told how long to wait for their reserved token.
+
+    Args:
+        rate: Sustained number of requests allowed per second.
+        burst: Maximum number of requests that may be issued back-to-back.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one token and return the seconds to wait before using it.
+
+        The token is taken immediately (the balance may go negative), so
+        concurrent callers are queued fairly behind each other.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be issued."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def record(
+        self, status_code: Optional[int], latency: float, retry_after: Optional[float] = None
+    ) -> None:
+        """Report how a request went. A fixed-rate bucket ignores it."""
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """Token bucket whose rate follows the server's health (AIMD).
+
+    Every fast response raises the rate by ``increase`` requests per second,
+    up to ``max_rate``. A 429, a 5xx, a failed request or a latency spike
+    (a response ``latency_factor`` times slower than the running average)
+    multiplies it by ``decrease``, down to ``min_rate``. A ``Retry-After``
+    delay pauses every request until it has passed.
+
+    Args:
+        rate: Initial requests per second.
+        min_rate: Lowest rate the limiter backs off to.
+        max_rate: Highest rate the limiter ramps up to.
+        increase: Requests per second added after each fast response.
+        decrease: Factor applied to the rate when the server struggles.
+        latency_factor: Slowdown relative to the average latency that counts
+            as a spike.
+        burst: Maximum number of requests that may be issued back-to-back.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 0.05,
+        max_rate: float = 1.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0,
+        burst: int = 1,
+    ):
+        if not 0 < min_rate <= max_rate:
+            raise ValueError("min_rate must be greater than zero and at most max_rate")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        super().__init__(min(max(rate, min_rate), max_rate), burst=burst)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.average_latency: Optional[float] = None
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+
+    def reserve(self) -> float:
+        delay = super().reserve()
+        with self._lock:
+            paused = self._paused_until - time.monotonic()
+        return max(delay, paused)
+
+    def record(
+        self, status_code: Optional[int], latency: float, retry_after: Optional[float] = None
+    ) -> None:
+        """Adapt the rate to a response.
+
+        Args:
+            status_code: HTTP status, or None if the request failed.
+            latency: Seconds the request took.
+            retry_after: Seconds the server asked to wait (Retry-After).
+        """
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            failed = status_code is None or status_code == 429 or status_code >= 500
+            spike = (
+                self.average_latency is not None
+                and latency > self.latency_factor * self.average_latency
+            )
+            if failed or spike:
+                # Responses to requests sent at the old rate arrive together,
+                # so back off once per request interval
+                if now - self._last_decrease >= 1 / self.rate:
+                    self.rate = max(self.min_rate, self.rate * self.decrease)
+                    self._last_decrease = now
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+            if not failed:
+                if self.average_latency is None:
+                    self.average_latency = latency
+                else:
+                    self.average_latency = 0.8 * self.average_latency + 0.2 * latency
+
+    @classmethod
+    def load(cls, path: Path, rate: float, **kwargs: Any) -> "AdaptiveRateLimiter":
+        """Create a limiter starting from the rate saved by a previous run, if any.
+
+        Args:
+            path: State file written by save().
+            rate: Initial rate when there is no usable saved state.
+            **kwargs: Other AdaptiveRateLimiter arguments.
+        """
+        try:
+            rate = float(json.loads(Path(path).read_text(encoding="utf-8"))["rate"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return cls(rate, **kwargs)
+
+    def save(self, path: Path) -> None:
+        """Save the learned rate so the next run starts from it."""
+        Path(path).write_text(json.dumps({"rate": self.rate}), encoding="utf-8")
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Return the delay of a Retry-After header in seconds, or None.
+
+    Both forms of the header are accepted: a number of seconds and an HTTP
+    date.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date is None or date.tzinfo is None:
+        return None
+    return max(0.0, date.timestamp() - time.time())
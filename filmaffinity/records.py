@@ -0,0 +1,141 @@
+"""
+Film record containers for scraped FilmAffinity data.
+
+The scraper stores each movie as one FilmRecord (a compact ``__slots__``
+object) in a FilmTable, so a movie's fields are always added together and
+columns can never get out of step. FilmTable can still be read like the
+column dict used elsewhere (``table["title"]``), which keeps it compatible
+with code that expects a dict of lists.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+# Column name -> FilmRecord attribute
+COLUMN_ATTRIBUTES = {
+    "genre": "genre",
+    "title": "title",
+    "original title": "original_title",
+    "year": "year",
+    "country": "country",
+    "user score": "user_score",
+    "FA score": "fa_score",
+    "FA movie ID": "fa_movie_id",
+    "directors": "directors",
+}
+
+
+class FilmRecord:
+    """One scraped movie. Missing fields are empty strings."""
+
+    __slots__ = (
+        "genre",
+        "title",
+        "original_title",
+        "year",
+        "country",
+        "user_score",
+        "fa_score",
+        "fa_movie_id",
+        "directors",
+    )
+
+    genre: str
+    title: str
+    original_title: str
+    year: Any
+    country: str
+    user_score: Any
+    fa_score: Any
+    fa_movie_id: Any
+    directors: str
+
+    def __init__(self, **fields: Any):
+        for attribute in self.__slots__:
+            setattr(self, attribute, fields.pop(attribute, ""))
+        if fields:
+            raise TypeError(f"Unknown film fields: {', '.join(fields)}")
+
+    def __repr__(self) -> str:
+        return f"FilmRecord(fa_movie_id={self.fa_movie_id!r}, title={self.title!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FilmRecord):
+            return NotImplemented
+        return all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
+
+    def fields(self) -> dict[str, Any]:
+        """Return the non-empty fields as keyword arguments for FilmRecord()."""
+        values = ((attribute, getattr(self, attribute)) for attribute in self.__slots__)
+        return {attribute: value for attribute, value in values if value != ""}
+
+    def get(self, column: str) -> Any:
+        """Return the value of a column (e.g. 'user score')."""
+        return getattr(self, COLUMN_ATTRIBUTES[column])
+
+    def set(self, column: str, value: Any) -> None:
+        """Set the value of a column (e.g. 'original title')."""
+        setattr(self, COLUMN_ATTRIBUTES[column], value)
+
+
+class FilmTable(Mapping):
+    """
+    Ordered collection of FilmRecords exposing a fixed set of columns.
+
+    As a mapping it behaves like a dict of column lists: ``table["title"]``
+    returns the list of titles, iteration yields the column names and
+    ``len(table)`` is the number of columns. Use ``table.records`` or
+    ``table.rows()`` to work with the movies themselves.
+
+    Args:
+        columns: Column names, in output order (keys of COLUMN_ATTRIBUTES).
+        records: Optional initial records.
+    """
+
+    def __init__(self, columns: Iterable[str], records: Iterable[FilmRecord] = ()):
+        self.columns = tuple(columns)
+        unknown = [column for column in self.columns if column not in COLUMN_ATTRIBUTES]
+        if unknown:
+            raise KeyError(f"Unknown film columns: {', '.join(unknown)}")
+        self._attributes = tuple(COLUMN_ATTRIBUTES[column] for column in self.columns)
+        self.records: list[FilmRecord] = list(records)
+
+    def append(self, record: FilmRecord) -> None:
+        """Add a movie."""
+        self.records.append(record)
+
+    def extend(self, records: Iterable[FilmRecord]) -> None:
+        """Add several movies."""
+        self.records.extend(records)
+
+    def __getitem__(self, column: str) -> list[Any]:
+        if column not in self.columns:
+            raise KeyError(column)
+        attribute = COLUMN_ATTRIBUTES[column]
+        return [getattr(record, attribute) for record in self.records]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __repr__(self) -> str:
+        return f"FilmTable(columns={self.columns!r}, films={len(self.records)})"
+
+    def iter_rows(self, *columns: str) -> Iterator[tuple[Any, ...]]:
+        """Yield one tuple of values per movie (all columns by default)."""
+        attributes = (
+            tuple(COLUMN_ATTRIBUTES[column] for column in columns) if columns else self._attributes
+        )
+        for record in self.records:
+            yield tuple(getattr(record, attribute) for attribute in attributes)
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Yield one dict per movie, keyed by column name."""
+        for values in self.iter_rows():
+            yield dict(zip(self.columns, values))
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Return the data as a dict of column lists."""
+        return {column: self[column] for column in self.columns}
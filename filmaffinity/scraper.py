@@ -6,10 +6,12 @@ Functions to parse FilmAffinity webpage and extract movie data.
 
 import re
 import time
-from typing import Any, Optional
+from collections import deque
+from collections.abc import Generator, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 import requests
-from bs4 import BeautifulSoup
 from requests.exceptions import (
     ConnectionError,
     RequestException,
@@ -17,6 +19,12 @@ from requests.exceptions import (
 )
 from rich import print
 
+from filmaffinity import parsing
+from filmaffinity.cache import CachedPage, DetailCache, ResponseCache
+from filmaffinity.checkpoint import PageJournal, watched_key
+from filmaffinity.rate_limit import TokenBucket, parse_retry_after
+from filmaffinity.records import FilmRecord, FilmTable
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -26,6 +34,52 @@ RATE_LIMIT_COOLDOWN = 30  # seconds to wait when rate limited (429)
 MAX_RETRIES = 3  # max retries on rate limit
 MAX_PAGINATION_PAGES = 500  # safety limit to prevent infinite loops
 MAX_CONSECUTIVE_EMPTY_PAGES = 3  # stop after this many empty pages in a row
+DEFAULT_MAX_RPS = 1.0  # global requests per second when scraping concurrently
+DETAIL_COOLDOWN = 0.5  # seconds between movie detail page requests
+
+# Parenthetical suffix of card titles, e.g. "Title (TV Series)"
+_TITLE_SUFFIX_RE = re.compile(r"^(.+?)\s*\(([^)]+)\)\s*$")
+
+# Pager links by page number parameter ('p' for ratings, 'page' for lists),
+# e.g. href="userratings.php?user_id=1&amp;p=12&amp;orderby=8"
+_PAGER_LINK_RES = {
+    param: re.compile(rf"""href=["'][^"']*?[?&;]{param}=(\d+)""") for param in ("p", "page")
+}
+# Opening tag of the pager element, e.g. <div class="pager"> or <ul class="pagination">
+_PAGER_START_RE = re.compile(
+    r"""<(\w+)\b[^>]*\bclass=["'][^"']*\b(?:pager|pagination)\b[^"']*["'][^>]*>""", re.I
+)
+# Movies of a ratings page or list
+_LISTING_ITEM_RE = re.compile(r"""data-movie-id=["']?\d""")
+
+# Columns of the movie data returned for user lists and watched movies
+LIST_COLUMNS = (
+    "title",
+    "original title",
+    "year",
+    "country",
+    "user score",
+    "FA score",
+    "FA movie ID",
+    "directors",
+)
+WATCHED_COLUMNS = ("genre",) + LIST_COLUMNS
+WATCHED_ORDER_BY = 8  # order by genre
+WATCHED_ORDER_BY_DATE = 0  # order by rating date, newest first
+
+# Sort orders accepted by get_list_movies, mapped to FilmAffinity's orderby ids
+LIST_ORDER_CATEGORIES = {
+    "posición": 0,
+    "position": 0,
+    "título": 1,
+    "title": 1,
+    "año": 2,
+    "year": 2,
+    "voto": 3,
+    "rating": 3,
+    "nota media": 4,
+    "avg rating": 4,
+}
 
 
 # =============================================================================
@@ -103,6 +157,99 @@ session.headers.update(
 )
 
 
+# Global rate limiter shared by every thread that talks to FilmAffinity.
+# When unset, the scraper falls back to fixed DEFAULT_COOLDOWN sleeps.
+rate_limiter: Optional[TokenBucket] = None
+
+
+def set_rate_limit(requests_per_second: Optional[float], burst: int = 1) -> None:
+    """
+    Configure the global request rate ceiling for filmaffinity.com.
+
+    Once set, every request made through request_with_retry waits for a token
+    from a shared bucket, and the fixed sleeps between pages are skipped. This
+    allows several lists to be scraped concurrently without exceeding the rate.
+
+    Args:
+        requests_per_second: Allowed requests per second, or None to disable
+            the limiter and restore the fixed per-page cooldowns.
+        burst: Maximum number of requests that may be issued back-to-back.
+    """
+    if requests_per_second is None:
+        set_rate_limiter(None)
+    else:
+        set_rate_limiter(TokenBucket(requests_per_second, burst=burst))
+
+
+def set_rate_limiter(limiter: Optional[TokenBucket]) -> None:
+    """
+    Install the limiter shared by every request to filmaffinity.com.
+
+    Like set_rate_limit, but takes a limiter instance, such as an
+    AdaptiveRateLimiter that adjusts its rate to the server's responses.
+
+    Args:
+        limiter: TokenBucket (or subclass) instance, or None to restore the
+            fixed per-page cooldowns.
+    """
+    global rate_limiter
+    rate_limiter = limiter
+
+
+# Optional on-disk cache of movie detail pages (see set_detail_cache)
+detail_cache: Optional[DetailCache] = None
+
+
+def set_detail_cache(cache: Optional[DetailCache]) -> None:
+    """
+    Configure the cache used for movie detail pages.
+
+    Once set, get_original_title returns cached titles without making a
+    request, and stores the titles it fetches.
+
+    Args:
+        cache: DetailCache instance, or None to always fetch detail pages.
+    """
+    global detail_cache
+    detail_cache = cache
+
+
+# Optional on-disk HTTP cache of list and ratings pages (see set_response_cache)
+response_cache: Optional[ResponseCache] = None
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """
+    Configure the HTTP cache used by request_with_retry.
+
+    Once set, pages are requested with the ETag/Last-Modified validators of
+    their cached copy, and a 304 response is answered from the cache. Pages
+    whose body is byte-identical to the cached one are not parsed again by
+    the pagination functions.
+
+    Args:
+        cache: ResponseCache instance, or None to always download pages.
+    """
+    global response_cache
+    response_cache = cache
+
+
+def page_cooldown(seconds: float = DEFAULT_COOLDOWN) -> None:
+    """
+    Pause between two requests to filmaffinity.com.
+
+    Callers fetching several pages in a row (lists, ratings, movie details)
+    wait here between them. Nothing is done when a global rate limiter is
+    installed (see set_rate_limiter), as it already paces every request.
+
+    Args:
+        seconds: Pause without a rate limiter, e.g. DETAIL_COOLDOWN between
+            detail pages.
+    """
+    if rate_limiter is None:
+        time.sleep(seconds)
+
+
 # =============================================================================
 # HTTP Request Helpers
 # =============================================================================
@@ -110,64 +257,95 @@ session.headers.update(
 
 def _format_network_error(error: Exception, url: str) -> str:
     """Format a network error with user-friendly guidance."""
-    error_str = str(error).lower()
-
     if isinstance(error, ConnectionError):
-        if "name or service not known" in error_str or "getaddrinfo failed" in error_str:
-            return (
-                f"DNS resolution failed - unable to resolve 'filmaffinity.com'.\n"
-                f"  Possible causes:\n"
-                f"    • No internet connection\n"
-                f"    • DNS server is unreachable\n"
-                f"    • FilmAffinity domain is blocked\n"
-                f"  URL: {url}"
-            )
-        elif "connection refused" in error_str:
-            return (
-                f"Connection refused by FilmAffinity server.\n"
-                f"  Possible causes:\n"
-                f"    • FilmAffinity is down or under maintenance\n"
-                f"    • Your IP may be blocked\n"
-                f"    • Firewall blocking the connection\n"
-                f"  URL: {url}"
-            )
-        else:
-            return (
-                f"Unable to connect to FilmAffinity.\n"
-                f"  Possible causes:\n"
-                f"    • No internet connection\n"
-                f"    • FilmAffinity is temporarily unavailable\n"
-                f"    • Network firewall blocking access\n"
-                f"  URL: {url}\n"
-                f"  Details: {error}"
-            )
-
+        return _format_connection_error(error, url)
     elif isinstance(error, Timeout):
+        return _format_timeout_error(url)
+    else:
         return (
-            f"Request timed out while connecting to FilmAffinity.\n"
+            f"Network error while accessing FilmAffinity.\n" f"  URL: {url}\n" f"  Error: {error}"
+        )
+
+
+def _format_connection_error(error: Exception, url: str) -> str:
+    """Format a failure to connect, whichever HTTP library raised it."""
+    error_str = str(error).lower()
+
+    if "name or service not known" in error_str or "getaddrinfo failed" in error_str:
+        return (
+            f"DNS resolution failed - unable to resolve 'filmaffinity.com'.\n"
             f"  Possible causes:\n"
-            f"    • Slow or unstable internet connection\n"
-            f"    • FilmAffinity server is overloaded\n"
-            f"  Try again in a few minutes.\n"
+            f"    • No internet connection\n"
+            f"    • DNS server is unreachable\n"
+            f"    • FilmAffinity domain is blocked\n"
+            f"  URL: {url}"
+        )
+    elif "connection refused" in error_str:
+        return (
+            f"Connection refused by FilmAffinity server.\n"
+            f"  Possible causes:\n"
+            f"    • FilmAffinity is down or under maintenance\n"
+            f"    • Your IP may be blocked\n"
+            f"    • Firewall blocking the connection\n"
             f"  URL: {url}"
         )
-
     else:
         return (
-            f"Network error while accessing FilmAffinity.\n" f"  URL: {url}\n" f"  Error: {error}"
+            f"Unable to connect to FilmAffinity.\n"
+            f"  Possible causes:\n"
+            f"    • No internet connection\n"
+            f"    • FilmAffinity is temporarily unavailable\n"
+            f"    • Network firewall blocking access\n"
+            f"  URL: {url}\n"
+            f"  Details: {error}"
         )
 
 
+def _format_timeout_error(url: str) -> str:
+    """Format a request timeout, whichever HTTP library raised it."""
+    return (
+        f"Request timed out while connecting to FilmAffinity.\n"
+        f"  Possible causes:\n"
+        f"    • Slow or unstable internet connection\n"
+        f"    • FilmAffinity server is overloaded\n"
+        f"  Try again in a few minutes.\n"
+        f"  URL: {url}"
+    )
+
+
+def _cached_response(url: str, cached: CachedPage) -> requests.Response:
+    """Build a 200 response from a cached page."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = cached.body.encode("utf-8")
+    response.digest = cached.digest  # type: ignore[attr-defined]
+    return response
+
+
+def _response_digest(response: Any) -> Optional[str]:
+    """Digest of a response body stored in the response cache, if any."""
+    digest = getattr(response, "digest", None)
+    return digest if isinstance(digest, str) else None
+
+
 def request_with_retry(
-    url: str, max_retries: int = MAX_RETRIES, timeout: int = 30
+    url: str, max_retries: int = MAX_RETRIES, timeout: int = 30, use_cache: bool = True
 ) -> requests.Response:
     """
     Make a request with retry logic for rate limiting (429 errors).
 
+    When a response cache is configured (see set_response_cache), the request
+    is made conditional on the cached copy of the page, and 200 responses are
+    stored in the cache. Responses coming from or stored in the cache carry
+    the SHA-256 digest of their body in a `digest` attribute.
+
     Args:
         url: URL to request.
         max_retries: Maximum number of retries on rate limiting.
         timeout: Request timeout in seconds.
+        use_cache: Whether to use the response cache for this URL.
 
     Returns:
         Response object.
@@ -179,22 +357,48 @@ def request_with_retry(
         NetworkError: For other network-related errors.
     """
     cooldown = RATE_LIMIT_COOLDOWN
+    cache = response_cache if use_cache else None
+    cached = cache.get(url) if cache is not None else None
+    headers = cached.validators() if cached is not None else None
 
     for attempt in range(max_retries):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        started = time.monotonic()
         try:
-            response = session.get(url, verify=True, timeout=timeout)
-
-            if response.status_code == 429:
+            response = session.get(url, verify=True, timeout=timeout, headers=headers or None)
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if rate_limiter is not None:
+                rate_limiter.record(response.status_code, time.monotonic() - started, retry_after)
+
+            # A 503 is only retried when the server says when to come back
+            if response.status_code == 429 or (
+                response.status_code == 503 and retry_after is not None
+            ):
+                wait = retry_after if retry_after is not None else cooldown
                 print(
-                    f"  [yellow]⚠️  Rate limited (429). Waiting {cooldown}s before retry ({attempt + 1}/{max_retries})...[/yellow]"
+                    f"  [yellow]⚠️  Rate limited ({response.status_code}). Waiting {wait:g}s before retry ({attempt + 1}/{max_retries})...[/yellow]"
                 )
-                time.sleep(cooldown)
+                time.sleep(wait)
                 cooldown = min(cooldown * 2, 120)  # Exponential backoff
                 continue
 
+            if cache is not None:
+                if response.status_code == 304 and cached is not None:
+                    cache.touch(url)
+                    return _cached_response(url, cached)
+                if response.status_code == 200:
+                    response.digest = cache.put(  # type: ignore[attr-defined]
+                        url,
+                        response.text,
+                        etag=response.headers.get("ETag", ""),
+                        last_modified=response.headers.get("Last-Modified", ""),
+                    )
             return response
 
         except ConnectionError as e:
+            if rate_limiter is not None:
+                rate_limiter.record(None, time.monotonic() - started)
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 5
                 print(
@@ -205,6 +409,8 @@ def request_with_retry(
             raise ConnectionFailedError(_format_network_error(e, url), url=url, cause=e)
 
         except Timeout as e:
+            if rate_limiter is not None:
+                rate_limiter.record(None, time.monotonic() - started)
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 5
                 print(
@@ -264,6 +470,36 @@ def check_user(user_id: str, lang: str = "en") -> None:
         )
 
 
+def parse_user_lists_page(soup: Any) -> Optional[dict[str, str]]:
+    """
+    Extract the lists shown on one page of a user's lists.
+
+    Args:
+        soup: Parsed userlists.php page (BeautifulSoup or parsing.parse_page result).
+
+    Returns:
+        Dictionary mapping list names to their URLs, or None if the page has
+        no list container or no list items (an empty page).
+    """
+    if parsing.is_lxml(soup):
+        return parsing.lxml_user_lists(soup)
+
+    lists_container = soup.find(attrs={"class": "fa-list-group"})
+    if not lists_container:
+        return None
+
+    list_items = lists_container.find_all("li")  # type: ignore[union-attr]
+    if not list_items:
+        return None
+
+    found = {}
+    for tmp in list_items:
+        ele = tmp.find(lambda tag: tag.name == "a" and tag.get("class", []) != ["ls-imgs"])
+        if ele and ele.get("href"):
+            found[ele.text] = ele["href"]
+    return found
+
+
 def get_user_lists(
     user_id: str,
     max_page: Optional[int] = None,
@@ -293,11 +529,11 @@ def get_user_lists(
             break
 
         print(f"  [grey50]Parsing page {page}[/grey50]")
-        soup = BeautifulSoup(response.text, "html.parser")
-        lists_container = soup.find(attrs={"class": "fa-list-group"})
+        soup = parsing.parse_page(response.text, parsing.USER_LISTS_PAGE)
+        found = parse_user_lists_page(soup)
 
         # Handle empty or missing container
-        if not lists_container:
+        if found is None:
             consecutive_empty_pages += 1
             if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
                 print(
@@ -305,38 +541,20 @@ def get_user_lists(
                 )
                 break
             page += 1
-            time.sleep(DEFAULT_COOLDOWN)
-            continue
-
-        list_items = lists_container.find_all("li")  # type: ignore[union-attr]
-        if not list_items:
-            consecutive_empty_pages += 1
-            if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
-                print(
-                    f"  [yellow]No more lists found after {page - consecutive_empty_pages} pages[/yellow]"
-                )
-                break
-            page += 1
-            time.sleep(DEFAULT_COOLDOWN)
+            page_cooldown()
             continue
 
         # Reset counter on successful page
         consecutive_empty_pages = 0
-        items_found_this_page = 0
-
-        for tmp in list_items:
-            ele = tmp.find(lambda tag: tag.name == "a" and tag.get("class", []) != ["ls-imgs"])
-            if ele and ele.get("href"):
-                user_lists[ele.text] = ele["href"]
-                items_found_this_page += 1
 
         # If page had container but no valid items, might be end
-        if items_found_this_page == 0:
+        if not found:
             print(f"  [yellow]No valid list items on page {page}, stopping pagination[/yellow]")
             break
 
+        user_lists.update(found)
         page += 1
-        time.sleep(DEFAULT_COOLDOWN)
+        page_cooldown()
 
     if page > effective_max_page:
         print(f"  [yellow]Reached maximum page limit ({effective_max_page})[/yellow]")
@@ -349,6 +567,35 @@ def get_user_lists(
 # =============================================================================
 
 
+def parse_original_title(soup: Any) -> str:
+    """
+    Extract the original title from a parsed movie detail page.
+
+    Args:
+        soup: Parsed film{movie_id}.html page (BeautifulSoup or parsing.parse_page result).
+
+    Returns:
+        Original title, or empty string if not found.
+    """
+    if parsing.is_lxml(soup):
+        return parsing.lxml_original_title(soup)
+
+    movie_info = soup.find("dl", attrs={"class": "movie-info"})
+    if not movie_info:
+        return ""
+
+    dt_elements = movie_info.find_all("dt")  # type: ignore[union-attr]
+    for dt in dt_elements:
+        if "original" in dt.text.lower():
+            dd = dt.find_next_sibling("dd")
+            if dd:
+                original_title = dd.get_text(strip=True)
+                if "aka" in original_title:
+                    original_title = original_title.split("aka")[0].strip()
+                return original_title
+    return ""
+
+
 def get_original_title(movie_id: str) -> str:
     """
     Fetch the original title from the movie's detail page.
@@ -359,126 +606,543 @@ def get_original_title(movie_id: str) -> str:
     Returns:
         Original title, or empty string if same as local title or not found.
     """
+    cached = get_cached_original_title(movie_id)
+    if cached is not None:
+        return cached
+
     url = f"https://www.filmaffinity.com/es/film{movie_id}.html"
     try:
-        response = request_with_retry(url)
+        # Detail pages have their own cache of parsed fields (see set_detail_cache)
+        response = request_with_retry(url, use_cache=False)
         if response.status_code != 200:
             return ""
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        movie_info = soup.find("dl", attrs={"class": "movie-info"})
-        if not movie_info:
-            return ""
-
-        dt_elements = movie_info.find_all("dt")  # type: ignore[union-attr]
-        for dt in dt_elements:
-            if "original" in dt.text.lower():
-                dd = dt.find_next_sibling("dd")
-                if dd:
-                    original_title = dd.get_text(strip=True)
-                    if "aka" in original_title:
-                        original_title = original_title.split("aka")[0].strip()
-                    return original_title
-        return ""
+        original_title = parse_original_title(
+            parsing.parse_page(response.text, parsing.DETAIL_PAGE)
+        )
     except Exception:
         return ""
 
+    if detail_cache is not None:
+        detail_cache.put(movie_id, {"original title": original_title})
+    return original_title
 
-def parse_movie_card(
-    movie,
-    info: dict,
-    fetch_original_title: bool = True,
-    lang: str = "en",
-) -> dict:
+
+def get_cached_original_title(movie_id: str) -> Optional[str]:
+    """Return the original title from the detail cache, or None if not cached."""
+    if detail_cache is None:
+        return None
+    fields = detail_cache.get(movie_id)
+    if fields is None:
+        return None
+    return fields.get("original title", "")
+
+
+def distinct_original_title(original_title: str, local_title: str) -> str:
+    """Return the original title only if it differs from the local title."""
+    if original_title and original_title.lower() != local_title.lower():
+        return original_title
+    return ""
+
+
+def read_movie_card(movie) -> Optional[dict[str, str]]:
     """
-    Parse a movie card element and add data to info dict.
+    Read the raw fields of a movie card element.
 
     Args:
         movie: BeautifulSoup element for the movie card.
-        info: Dictionary to append movie data to.
-        fetch_original_title: Whether to fetch original title (extra request).
-        lang: Language version ('es' or 'en').
 
     Returns:
-        Updated info dictionary.
-
-    Note:
-        If essential elements are missing, the movie is skipped and info
-        is returned unchanged.
+        Dictionary with the 'FA movie ID', 'full title', 'FA score', 'country',
+        'year' and 'directors' fields, or None if essential elements are missing.
     """
     # Validate essential data exists
     movie_id = movie.get("data-movie-id") if movie else None
     if not movie_id:
-        return info
+        return None
 
     title_elem = movie.find(attrs={"class": "mc-title"})
     title_link = title_elem.find("a") if title_elem else None
     if not title_link:
-        return info
-
-    # Now we can safely add data
-    info["FA movie ID"].append(movie_id)
+        return None
 
     # FA score (may be missing)
     avg_elem = movie.find(attrs={"class": "avg"})
-    info["FA score"].append(avg_elem.text if avg_elem else "")
 
-    # Get full title text
-    full_title = title_link.text.strip()
+    # Country (may be missing)
+    country_flag = movie.find("img", attrs={"class": "nflag"})
+
+    # Year - keep first non-zero year (may be missing)
+    years = movie.find_all("span", attrs={"class": "mc-year"})
+    year_texts = [i.text for i in years if i.text]
+
+    # Directors (may be missing)
+    directors_elem = movie.find(attrs={"class": "mc-director"})
+
+    return {
+        "FA movie ID": movie_id,
+        "full title": title_link.text.strip(),
+        "FA score": avg_elem.text if avg_elem else "",
+        "country": country_flag["alt"].strip() if country_flag and country_flag.get("alt") else "",
+        "year": year_texts[0] if year_texts else "",
+        "directors": (
+            ", ".join([i.text for i in directors_elem.find_all("a")]) if directors_elem else ""
+        ),
+    }
+
+
+def add_movie(
+    info: FilmTable,
+    fields: dict[str, str],
+    fetch_original_title: bool = True,
+    lang: str = "en",
+    user_score: str = "",
+) -> None:
+    """
+    Add a movie card (see read_movie_card) to the info table as one record.
+
+    Args:
+        info: Table to append the movie to.
+        fields: Raw movie card fields.
+        fetch_original_title: Whether to fetch original title (extra request).
+        lang: Language version ('es' or 'en').
+        user_score: The user's rating of the movie, if any.
+    """
+    movie_id = fields["FA movie ID"]
 
     # Extract title - remove parenthetical part if present
-    match = re.search(r"^(.+?)\s*\(([^)]+)\)\s*$", full_title)
+    full_title = fields["full title"]
+    match = _TITLE_SUFFIX_RE.search(full_title)
     if match:
         local_title = match.group(1).strip()
     else:
         local_title = full_title
 
-    info["title"].append(local_title)
-
     # Fetch original title (only needed for Spanish version)
+    original_title = ""
     if fetch_original_title and lang == "es":
-        original_title = get_original_title(movie_id)
-        if original_title and original_title.lower() != local_title.lower():
-            info["original title"].append(original_title)
-        else:
-            info["original title"].append("")
-        time.sleep(0.5)
-    else:
-        info["original title"].append("")
-
-    # Country (may be missing)
-    country_flag = movie.find("img", attrs={"class": "nflag"})
-    info["country"].append(
-        country_flag["alt"].strip() if country_flag and country_flag.get("alt") else ""
+        cached = get_cached_original_title(movie_id)
+        if cached is None:
+            cached = get_original_title(movie_id)
+            page_cooldown(DETAIL_COOLDOWN)
+        original_title = distinct_original_title(cached, local_title)
+
+    info.append(
+        FilmRecord(
+            title=local_title,
+            original_title=original_title,
+            year=fields["year"],
+            country=fields["country"],
+            user_score=user_score,
+            fa_score=fields["FA score"],
+            fa_movie_id=movie_id,
+            directors=fields["directors"],
+        )
     )
 
-    # Year - keep first non-zero year (may be missing)
-    years = movie.find_all("span", attrs={"class": "mc-year"})
-    year_texts = [i.text for i in years if i.text]
-    info["year"].append(year_texts[0] if year_texts else "")
 
-    # Directors (may be missing)
-    directors_elem = movie.find(attrs={"class": "mc-director"})
-    if directors_elem:
-        director_links = directors_elem.find_all("a")
-        info["directors"].append(", ".join([i.text for i in director_links]))
-    else:
-        info["directors"].append("")
+def parse_movie_card(
+    movie,
+    info: FilmTable,
+    fetch_original_title: bool = True,
+    lang: str = "en",
+    user_score: str = "",
+) -> FilmTable:
+    """
+    Parse a movie card element and add it to the info table.
 
+    Args:
+        movie: BeautifulSoup element for the movie card.
+        info: Table to append the movie to.
+        fetch_original_title: Whether to fetch original title (extra request).
+        lang: Language version ('es' or 'en').
+        user_score: The user's rating of the movie, if any.
+
+    Returns:
+        Updated info table.
+
+    Note:
+        If essential elements are missing, the movie is skipped and info
+        is returned unchanged.
+    """
+    fields = read_movie_card(movie)
+    if fields is not None:
+        add_movie(
+            info,
+            fields,
+            fetch_original_title=fetch_original_title,
+            lang=lang,
+            user_score=user_score,
+        )
     return info
 
 
+def new_movie_info(columns: tuple[str, ...]) -> FilmTable:
+    """Create an empty movie table with the given columns."""
+    return FilmTable(columns)
+
+
+def index_ratings(info: Mapping[str, list[Any]]) -> dict[str, str]:
+    """
+    Map each FA movie ID of a movie table or data dict to its user score.
+
+    IDs and scores are compared as strings, so data loaded back from a CSV
+    file (where pandas turns them into numbers) matches freshly scraped data.
+    """
+    return {
+        str(movie_id): str(score)
+        for movie_id, score in zip(info.get("FA movie ID", []), info.get("user score", []))
+    }
+
+
+def merge_movie_info(
+    delta: Mapping[str, list[Any]], existing: Mapping[str, list[Any]]
+) -> dict[str, list[Any]]:
+    """
+    Merge newly scraped rows into previously saved movie data.
+
+    Rows of `delta` come first (they are the most recent ratings) and replace
+    the rows of `existing` with the same FA movie ID.
+
+    Args:
+        delta: New or changed rows.
+        existing: Previously saved rows.
+
+    Returns:
+        Merged movie data with the columns of `delta`.
+    """
+    replaced = {str(movie_id) for movie_id in delta.get("FA movie ID", [])}
+    merged: dict[str, list[Any]] = {column: list(values) for column, values in delta.items()}
+    existing_ids = existing.get("FA movie ID", [])
+    for row, movie_id in enumerate(existing_ids):
+        if str(movie_id) in replaced:
+            continue
+        for column in merged:
+            values = existing.get(column)
+            merged[column].append(values[row] if values is not None else "")
+    return merged
+
+
+def parse_list_title(soup: Any) -> str:
+    """Extract the list name from the first page of a user list."""
+    if parsing.is_lxml(soup):
+        return parsing.lxml_list_title(soup)
+
+    title_ele = soup.find("span", attrs={"class": "fs-5"})
+    if title_ele and ":" in title_ele.text:
+        return title_ele.text.split(":")[1].strip()
+    return ""
+
+
+def parse_list_page(
+    soup: Any,
+    info: FilmTable,
+    lang: str = "en",
+    fetch_original_title: bool = True,
+) -> Optional[int]:
+    """
+    Parse the movies of one user list page into the info table.
+
+    Args:
+        soup: Parsed list page (BeautifulSoup or parsing.parse_page result).
+        info: Table to append the movies to.
+        lang: Language version ('es' or 'en').
+        fetch_original_title: Whether to fetch original titles (extra requests).
+
+    Returns:
+        Number of movies found, or None if the page has no movie container
+        or no movie items (an empty page).
+    """
+    if parsing.is_lxml(soup):
+        items = parsing.lxml_list_items(soup)
+        if items is None:
+            return None
+        for user_score, fields in items:
+            if fields is not None:
+                add_movie(
+                    info,
+                    fields,
+                    fetch_original_title=fetch_original_title,
+                    lang=lang,
+                    user_score=user_score,
+                )
+        return len(items)
+
+    movies_container = soup.find("ul", attrs={"class": "fa-list-group"})
+    if not movies_container:
+        return None
+
+    movie_items = movies_container.find_all("li")  # type: ignore[union-attr]
+    if not movie_items:
+        return None
+
+    movies_found = 0
+    for movie in movie_items:
+        user_score_ele = movie.find(attrs={"class": "fa-user-rat-box"})
+        if not user_score_ele:
+            continue
+        parse_movie_card(
+            movie,
+            info,
+            fetch_original_title=fetch_original_title,
+            lang=lang,
+            user_score=user_score_ele.text,
+        )
+        movies_found += 1
+    return movies_found
+
+
+def parse_watched_page(
+    soup: Any,
+    info: FilmTable,
+    lang: str = "en",
+    fetch_original_title: bool = True,
+) -> Optional[int]:
+    """
+    Parse the movies of one user ratings page into the info table.
+
+    Args:
+        soup: Parsed userratings.php page (BeautifulSoup or parsing.parse_page result).
+        info: Table to append the movies to.
+        lang: Language version ('es' or 'en').
+        fetch_original_title: Whether to fetch original titles (extra requests).
+
+    Returns:
+        Number of movies found, or None if the page has no rating groups.
+    """
+    if parsing.is_lxml(soup):
+        items = parsing.lxml_watched_items(soup)
+        if items is None:
+            return None
+        for user_score, fields in items:
+            if fields is not None:
+                add_movie(
+                    info,
+                    fields,
+                    fetch_original_title=fetch_original_title,
+                    lang=lang,
+                    user_score=user_score,
+                )
+        return len(items)
+
+    groups = soup.find_all("div", attrs={"class": "user-ratings-list-resp"})
+    if not groups:
+        return None
+
+    movies_found = 0
+    for group in groups:
+        # Genre field is no longer present, so it is left empty
+        movies = group.find_all("div", class_="row mb-4")
+        for movie in movies:
+            user_score_ele = movie.find(attrs={"class": "fa-user-rat-box"})
+            movie_card = movie.find("div", attrs={"class": "movie-card"})
+
+            # Skip if essential elements are missing
+            if not user_score_ele or not movie_card:
+                continue
+
+            parse_movie_card(
+                movie_card,
+                info,
+                fetch_original_title=fetch_original_title,
+                lang=lang,
+                user_score=user_score_ele.text.strip(),
+            )
+            movies_found += 1
+    return movies_found
+
+
 # =============================================================================
 # List/Watched Movie Functions
 # =============================================================================
 
 
+def _parse_movies_page(
+    url: str,
+    response: Any,
+    strainer: Any,
+    parse: Callable[..., Optional[int]],
+    columns: tuple[str, ...],
+    lang: str = "en",
+    fetch_original_title: bool = True,
+    read_title: bool = False,
+) -> tuple[Optional[int], FilmTable, str]:
+    """
+    Parse a list or ratings page with parse_list_page or parse_watched_page.
+
+    If the response cache holds data parsed from a byte-identical copy of the
+    page (same body digest), it is reused instead of parsing the page again.
+
+    Returns:
+        Tuple of (parse result, movies of the page, list title or '').
+    """
+    digest = _response_digest(response) if response_cache is not None else None
+    if digest is not None:
+        stored = response_cache.get_parsed(url, digest)
+        if stored is not None and stored.get("original titles") == fetch_original_title:
+            records = (FilmRecord(**fields) for fields in stored["rows"])
+            return stored["found"], FilmTable(columns, records), stored["title"]
+
+    soup = parsing.parse_page(response.text, strainer)
+    title = parse_list_title(soup) if read_title else ""
+    info = new_movie_info(columns)
+    found = parse(soup, info, lang=lang, fetch_original_title=fetch_original_title)
+    if digest is not None:
+        response_cache.put_parsed(
+            url,
+            digest,
+            {
+                "found": found,
+                "title": title,
+                "original titles": fetch_original_title,
+                "rows": [record.fields() for record in info.records],
+            },
+        )
+    return found, info, title
+
+
+def _collect_page(
+    page: int,
+    page_info: FilmTable,
+    info: FilmTable,
+    on_page: Optional[Callable[[int, FilmTable], None]],
+    movies_found: Optional[int],
+    checkpoint: Optional[PageJournal] = None,
+    key: str = "",
+) -> None:
+    """Hand a parsed page to on_page, or add its movies to the collected table."""
+    if movies_found is None:
+        return
+    if on_page is not None:
+        on_page(page, page_info)
+    else:
+        info.extend(page_info.records)
+    if checkpoint is not None:
+        checkpoint.record(key, page, page_info.records)
+
+
+def parse_page_count(markup: str, page_param: str) -> Optional[int]:
+    """
+    Return the number of pages of a listing, read from the pager of one page.
+
+    The pager under a ratings page or list links the last page along with the
+    ones around the current page, so the highest page number linked in it is
+    the total. Links outside the pager element are ignored. A page with movies
+    and no page links at all is the only page. The raw markup is searched
+    instead of the parsed page because the page strainers drop everything
+    outside the movie listing.
+
+    Args:
+        markup: HTML of any page of the listing.
+        page_param: Query parameter holding the page number ('p' for ratings,
+            'page' for lists).
+
+    Returns:
+        Number of pages, or None for markup this function doesn't recognise
+        (page links outside any known pager element, or no movies).
+    """
+    link_re = _PAGER_LINK_RES[page_param]
+    pagers = list(_pager_markup(markup))
+    if pagers:
+        pages = [int(number) for pager in pagers for number in link_re.findall(pager)]
+        return max(pages, default=1)
+    if link_re.search(markup) is None and _LISTING_ITEM_RE.search(markup):
+        return 1
+    return None
+
+
+def _pager_markup(markup: str) -> Iterator[str]:
+    """Yield the markup of every pager element, nested tags of its type included."""
+    for start in _PAGER_START_RE.finditer(markup):
+        tag = start.group(1).lower()
+        tag_re = re.compile(rf"<(/?){tag}\b", re.I)
+        depth = 1
+        for tag_match in tag_re.finditer(markup, start.end()):
+            depth += -1 if tag_match.group(1) else 1
+            if depth == 0:
+                yield markup[start.end() : tag_match.start()]
+                break
+        else:
+            yield markup[start.end() :]
+
+
+def _iter_pages(
+    page_url: Callable[[int], str],
+    page_param: str,
+    start_page: int,
+    max_page: int,
+    workers: int = 1,
+) -> Generator[tuple[int, str, requests.Response], None, None]:
+    """
+    Fetch the pages of a listing in order, yielding (page, url, response).
+
+    The first page is fetched alone and its pager gives the number of pages
+    (see parse_page_count), so pagination ends exactly at the last page. When
+    `workers` > 1 and a global rate limiter paces requests (see
+    set_rate_limiter), the remaining pages are then fetched up to `workers` at
+    a time. If the number of pages is unknown, pages are fetched one by one
+    until `max_page` or until the caller stops on empty pages.
+
+    Close the generator when stopping early so pending requests are cancelled.
+
+    Args:
+        page_url: Function returning the URL of a page number.
+        page_param: Query parameter holding the page number in pager links.
+        start_page: First page to fetch.
+        max_page: Last page to fetch at most.
+        workers: Maximum number of pages fetched concurrently.
+    """
+    if start_page > max_page:
+        print(f"  [yellow]Reached maximum page limit ({max_page})[/yellow]")
+        return
+
+    url = page_url(start_page)
+    response = request_with_retry(url)
+    yield start_page, url, response
+
+    page_count = None
+    if response.status_code == 200:
+        page_count = parse_page_count(response.text, page_param)
+    if page_count is not None and page_count < start_page:
+        # The pager contradicts the page just fetched: probe for the end instead
+        page_count = None
+    last_page = max_page if page_count is None else min(page_count, max_page)
+
+    if page_count is not None and workers > 1 and rate_limiter is not None:
+        pending: deque[tuple[int, str, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fa-page") as executor:
+            try:
+                page = start_page + 1
+                while pending or page <= last_page:
+                    while page <= last_page and len(pending) < workers:
+                        url = page_url(page)
+                        pending.append((page, url, executor.submit(request_with_retry, url)))
+                        page += 1
+                    done_page, url, future = pending.popleft()
+                    yield done_page, url, future.result()
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+    else:
+        for page in range(start_page + 1, last_page + 1):
+            url = page_url(page)
+            yield page, url, request_with_retry(url)
+
+    if page_count is None or page_count > max_page:
+        print(f"  [yellow]Reached maximum page limit ({max_page})[/yellow]")
+
+
 def get_list_movies(
     base_url: str,
     order_by: str = "voto",
     max_page: Optional[int] = None,
     lang: str = "en",
-) -> tuple[str, dict]:
+    fetch_original_title: bool = True,
+    start_page: int = 1,
+    on_page: Optional[Callable[[int, FilmTable], None]] = None,
+    checkpoint: Optional[PageJournal] = None,
+    workers: int = 1,
+) -> tuple[str, FilmTable]:
     """
     Retrieve all movies from a user list.
 
@@ -487,103 +1151,82 @@ def get_list_movies(
         order_by: Sort order ('voto', 'titulo', 'año', etc.).
         max_page: Maximum number of pages to retrieve (None = all).
         lang: Language version ('es' or 'en').
+        fetch_original_title: Whether to fetch original titles while paginating
+            (Spanish only). Pass False to enrich them later in one batch with
+            filmaffinity.enrichment.
+        start_page: First page to retrieve (to continue an interrupted run).
+        on_page: Optional function called with (page number, movies) after
+            each page. When given, movies are passed to it instead of being
+            collected, so the returned table is empty.
+        checkpoint: Optional journal of completed pages, keyed by `base_url`.
+            Movies of pages completed by a previous run are restored from it
+            and pagination continues from the next page.
+        workers: Maximum number of pages fetched concurrently once the number
+            of pages is known (see _iter_pages). Pages are still handed to
+            `on_page` and `checkpoint` in order.
 
     Returns:
-        Tuple of (list_title, info_dict).
-    """
-    categories = {
-        "posición": 0,
-        "position": 0,
-        "título": 1,
-        "title": 1,
-        "año": 2,
-        "year": 2,
-        "voto": 3,
-        "rating": 3,
-        "nota media": 4,
-        "avg rating": 4,
-    }
-    order_id = categories.get(order_by, 3)
-
-    info: dict[str, list[Any]] = {
-        "title": [],
-        "original title": [],
-        "year": [],
-        "country": [],
-        "user score": [],
-        "FA score": [],
-        "FA movie ID": [],
-        "directors": [],
-    }
+        Tuple of (list_title, FilmTable of movies). The title is only read
+        from page 1.
+    """
+    order_id = LIST_ORDER_CATEGORIES.get(order_by, 3)
+
+    info = new_movie_info(LIST_COLUMNS)
+    if checkpoint is not None:
+        next_page, info = checkpoint.restore(base_url, LIST_COLUMNS)
+        start_page = max(start_page, next_page)
 
-    page = 1
     title = ""
     consecutive_empty_pages = 0
-    effective_max_page = max_page or MAX_PAGINATION_PAGES
-
-    while page <= effective_max_page:
-        url = f"{base_url}&page={page}&orderby={order_id}"
+    pages = _iter_pages(
+        lambda page: f"{base_url}&page={page}&orderby={order_id}",
+        "page",
+        start_page,
+        max_page or MAX_PAGINATION_PAGES,
+        workers,
+    )
 
-        response = request_with_retry(url)
+    for page, url, response in pages:
         if response.status_code != 200:
             break
 
         print(f"  [grey50]Parsing page {page}[/grey50]")
-        soup = BeautifulSoup(response.text, "html.parser")
-
+        movies_found_this_page, page_info, page_title = _parse_movies_page(
+            url,
+            response,
+            parsing.LIST_PAGE,
+            parse_list_page,
+            LIST_COLUMNS,
+            lang=lang,
+            fetch_original_title=fetch_original_title,
+            read_title=page == 1,
+        )
         if page == 1:
-            title_ele = soup.find("span", attrs={"class": "fs-5"})
-            if title_ele and ":" in title_ele.text:
-                title = title_ele.text.split(":")[1].strip()
+            title = page_title
 
-        movies_container = soup.find("ul", attrs={"class": "fa-list-group"})
+        _collect_page(page, page_info, info, on_page, movies_found_this_page, checkpoint, base_url)
 
         # Handle empty or missing container
-        if not movies_container:
+        if movies_found_this_page is None:
             consecutive_empty_pages += 1
             if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
                 print(
                     f"  [yellow]No more movies found after {page - consecutive_empty_pages} pages[/yellow]"
                 )
                 break
-            page += 1
-            time.sleep(DEFAULT_COOLDOWN)
-            continue
-
-        movie_items = movies_container.find_all("li")  # type: ignore[union-attr]
-        if not movie_items:
-            consecutive_empty_pages += 1
-            if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
-                print(
-                    f"  [yellow]No more movies found after {page - consecutive_empty_pages} pages[/yellow]"
-                )
-                break
-            page += 1
-            time.sleep(DEFAULT_COOLDOWN)
+            page_cooldown()
             continue
 
         # Reset counter on successful page
         consecutive_empty_pages = 0
-        movies_found_this_page = 0
-
-        for movie in movie_items:
-            user_score_ele = movie.find(attrs={"class": "fa-user-rat-box"})
-            if not user_score_ele:
-                continue
-            info["user score"].append(user_score_ele.text)
-            info = parse_movie_card(movie, info, lang=lang)
-            movies_found_this_page += 1
 
         # If page had container but no valid items, might be end
         if movies_found_this_page == 0:
             print(f"  [yellow]No valid movie items on page {page}, stopping pagination[/yellow]")
             break
 
-        page += 1
-        time.sleep(DEFAULT_COOLDOWN)
-
-    if page > effective_max_page:
-        print(f"  [yellow]Reached maximum page limit ({effective_max_page})[/yellow]")
+        page_cooldown()
+    pages.close()
 
     return title, info
 
@@ -592,7 +1235,12 @@ def get_watched_movies(
     user_id: str,
     max_page: Optional[int] = None,
     lang: str = "en",
-) -> dict:
+    fetch_original_title: bool = True,
+    start_page: int = 1,
+    on_page: Optional[Callable[[int, FilmTable], None]] = None,
+    checkpoint: Optional[PageJournal] = None,
+    workers: int = 1,
+) -> FilmTable:
     """
     Retrieve all watched (rated) movies from a user.
 
@@ -600,70 +1248,70 @@ def get_watched_movies(
         user_id: FilmAffinity user ID.
         max_page: Maximum number of pages to retrieve (None = all).
         lang: Language version ('es' or 'en').
+        fetch_original_title: Whether to fetch original titles while paginating
+            (Spanish only). Pass False to enrich them later in one batch with
+            filmaffinity.enrichment.
+        start_page: First page to retrieve (to continue an interrupted run).
+        on_page: Optional function called with (page number, movies) after
+            each page. When given, movies are passed to it instead of being
+            collected, so the returned table is empty.
+        checkpoint: Optional journal of completed pages (see
+            checkpoint.watched_key). Movies of pages completed by a previous
+            run are restored from it and pagination continues from the next
+            page.
+        workers: Maximum number of pages fetched concurrently once the number
+            of pages is known (see _iter_pages). Pages are still handed to
+            `on_page` and `checkpoint` in order.
 
     Returns:
-        Dictionary with movie data.
-    """
-    info: dict[str, list[Any]] = {
-        "genre": [],
-        "title": [],
-        "original title": [],
-        "year": [],
-        "country": [],
-        "user score": [],
-        "FA score": [],
-        "FA movie ID": [],
-        "directors": [],
-    }
-    orderby = 8  # order by genre
+        FilmTable with movie data.
+    """
+    info = new_movie_info(WATCHED_COLUMNS)
+    orderby = WATCHED_ORDER_BY
+    key = watched_key(user_id, lang)
+    if checkpoint is not None:
+        next_page, info = checkpoint.restore(key, WATCHED_COLUMNS)
+        start_page = max(start_page, next_page)
 
-    page = 1
-    consecutive_empty_pages = 0
-    effective_max_page = max_page or MAX_PAGINATION_PAGES
+    def page_url(page: int) -> str:
+        return f"https://www.filmaffinity.com/{lang}/userratings.php?user_id={user_id}&p={page}&orderby={orderby}&chv=list"
 
-    while page <= effective_max_page:
-        url = f"https://www.filmaffinity.com/{lang}/userratings.php?user_id={user_id}&p={page}&orderby={orderby}&chv=list"
+    consecutive_empty_pages = 0
+    pages = _iter_pages(
+        page_url,
+        "p",
+        start_page,
+        max_page or MAX_PAGINATION_PAGES,
+        workers,
+    )
 
-        response = request_with_retry(url)
+    for page, url, response in pages:
         if response.status_code != 200:
             break
 
         print(f"  [grey50]Parsing page {page}[/grey50]")
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        groups = soup.find_all("div", attrs={"class": "user-ratings-list-resp"})
+        movies_found_this_page, page_info, _ = _parse_movies_page(
+            url,
+            response,
+            parsing.WATCHED_PAGE,
+            parse_watched_page,
+            WATCHED_COLUMNS,
+            lang=lang,
+            fetch_original_title=fetch_original_title,
+        )
+        _collect_page(page, page_info, info, on_page, movies_found_this_page, checkpoint, key)
 
         # Handle empty page
-        if not groups:
+        if movies_found_this_page is None:
             consecutive_empty_pages += 1
             if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY_PAGES:
                 print(
                     f"  [yellow]No more movies found after {page - consecutive_empty_pages} pages[/yellow]"
                 )
                 break
-            page += 1
-            time.sleep(DEFAULT_COOLDOWN)
+            page_cooldown()
             continue
 
-        movies_found_this_page = 0
-
-        for group in groups:
-            genre = ""  # Genre field is no longer present
-
-            movies = group.find_all("div", class_="row mb-4")
-            for movie in movies:
-                user_score_ele = movie.find(attrs={"class": "fa-user-rat-box"})
-                movie_card = movie.find("div", attrs={"class": "movie-card"})
-
-                # Skip if essential elements are missing
-                if not user_score_ele or not movie_card:
-                    continue
-
-                info["genre"].append(genre)
-                info["user score"].append(user_score_ele.text.strip())
-                info = parse_movie_card(movie_card, info, lang=lang)
-                movies_found_this_page += 1
-
         # If page had groups but no valid movies, might be end
         if movies_found_this_page == 0:
             consecutive_empty_pages += 1
@@ -676,10 +1324,75 @@ def get_watched_movies(
             # Reset counter on successful page
             consecutive_empty_pages = 0
 
-        page += 1
-        time.sleep(DEFAULT_COOLDOWN)
+        page_cooldown()
+    pages.close()
 
-    if page > effective_max_page:
-        print(f"  [yellow]Reached maximum page limit ({effective_max_page})[/yellow]")
+    return info
+
+
+def get_new_watched_movies(
+    user_id: str,
+    known_ratings: dict[str, str],
+    max_page: Optional[int] = None,
+    lang: str = "en",
+    fetch_original_title: bool = True,
+) -> FilmTable:
+    """
+    Retrieve only the ratings added or changed since a previous backup.
+
+    Ratings are requested newest first, and pagination stops at the first
+    page whose movies are all already known with the same score. Ratings
+    removed on FilmAffinity since the previous backup are not detected.
+
+    Args:
+        user_id: FilmAffinity user ID.
+        known_ratings: FA movie ID -> user score of the previous backup
+            (see index_ratings).
+        max_page: Maximum number of pages to retrieve (None = all).
+        lang: Language version ('es' or 'en').
+        fetch_original_title: Whether to fetch original titles while paginating
+            (Spanish only).
+
+    Returns:
+        Table with the new or changed movies, newest first
+        (see merge_movie_info to combine it with the previous backup).
+    """
+    info = new_movie_info(WATCHED_COLUMNS)
+    effective_max_page = max_page or MAX_PAGINATION_PAGES
+
+    page = 1
+    while page <= effective_max_page:
+        url = f"https://www.filmaffinity.com/{lang}/userratings.php?user_id={user_id}&p={page}&orderby={WATCHED_ORDER_BY_DATE}&chv=list"
+
+        response = request_with_retry(url)
+        if response.status_code != 200:
+            break
+
+        print(f"  [grey50]Parsing page {page}[/grey50]")
+        movies_found_this_page, page_info, _ = _parse_movies_page(
+            url,
+            response,
+            parsing.WATCHED_PAGE,
+            parse_watched_page,
+            WATCHED_COLUMNS,
+            lang=lang,
+            fetch_original_title=fetch_original_title,
+        )
+        if not movies_found_this_page:
+            break
+
+        new_rows = 0
+        for record in page_info.records:
+            if known_ratings.get(str(record.fa_movie_id)) == str(record.user_score):
+                continue
+            info.append(record)
+            new_rows += 1
+
+        if new_rows == 0:
+            print(f"  [grey50]Page {page} has no new ratings, stopping pagination[/grey50]")
+            break
+
+        page += 1
+        page_cooldown()
 
     return info
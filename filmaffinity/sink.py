@@ -0,0 +1,112 @@
+"""
+Streaming CSV output for backups.
+
+CsvSink writes a movie table to disk one scraped page at a time instead of
+keeping it in memory until the end of the backup. Rows are appended to
+``<name>.csv.part``, which is renamed to ``<name>.csv`` once the last page
+is in, so an interrupted run never leaves a truncated CSV behind (and never
+overwrites the previous one).
+
+After each page the sink records a checkpoint (``<name>.csv.checkpoint``)
+with the page number and the size of the part file. A sink opened with
+``resume=True`` drops anything written after the last checkpoint and
+continues from the next page.
+"""
+
+import csv
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+from filmaffinity.records import FilmTable
+
+CSV_SEPARATOR = ";"
+PART_SUFFIX = ".part"
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+
+class CsvSink:
+    """
+    Semicolon-delimited CSV file written page by page.
+
+    Args:
+        path: Final CSV path.
+        columns: Column names, in output order.
+        resume: Continue an interrupted part file from its last checkpoint
+            instead of starting over.
+    """
+
+    def __init__(self, path: Path, columns: Iterable[str], resume: bool = False):
+        self.path = Path(path)
+        self.columns = tuple(columns)
+        self.part_path = self.path.with_name(self.path.name + PART_SUFFIX)
+        self.checkpoint_path = self.path.with_name(self.path.name + CHECKPOINT_SUFFIX)
+        self.last_page = 0
+        self.rows = 0
+
+        checkpoint = self._read_checkpoint() if resume else None
+        if checkpoint is not None:
+            self.last_page = checkpoint["page"]
+            self.rows = checkpoint["rows"]
+            self._file = open(self.part_path, "r+", encoding="utf-8", newline="")
+            # Rows written after the last checkpoint belong to an unfinished page
+            self._file.truncate(checkpoint["offset"])
+            self._file.seek(checkpoint["offset"])
+            self._writer = csv.writer(self._file, delimiter=CSV_SEPARATOR, lineterminator="\n")
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.part_path, "w", encoding="utf-8", newline="")
+            self._writer = csv.writer(self._file, delimiter=CSV_SEPARATOR, lineterminator="\n")
+            self._writer.writerow(self.columns)
+            self._checkpoint()
+
+    def __enter__(self) -> "CsvSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def next_page(self) -> int:
+        """Number of the first page not written yet."""
+        return self.last_page + 1
+
+    def write_page(self, page: int, films: FilmTable) -> None:
+        """Append the movies of a scraped page and checkpoint it."""
+        self._writer.writerows(films.iter_rows(*self.columns))
+        self.last_page = page
+        self.rows += len(films.records)
+        self._checkpoint()
+
+    def commit(self) -> Path:
+        """Finish the file and move it to its final path."""
+        self.close()
+        os.replace(self.part_path, self.path)
+        self.checkpoint_path.unlink(missing_ok=True)
+        return self.path
+
+    def close(self) -> None:
+        """Close the part file, keeping it and its checkpoint for a later resume."""
+        if not self._file.closed:
+            self._file.close()
+
+    def _checkpoint(self) -> None:
+        self._file.flush()
+        checkpoint = {"page": self.last_page, "rows": self.rows, "offset": self._file.tell()}
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _read_checkpoint(self) -> Optional[dict[str, int]]:
+        """Return the last checkpoint, or None if there is no usable one."""
+        try:
+            checkpoint = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            if set(checkpoint) != {"page", "rows", "offset"}:
+                return None
+            if self.part_path.stat().st_size < checkpoint["offset"]:
+                return None
+        except (OSError, ValueError, TypeError):
+            return None
+        return checkpoint
@@ -4,6 +4,7 @@ IMDb Uploader Package
 Upload movie ratings from FilmAffinity CSV to IMDb using Selenium.
 """
 
+from imdb_uploader.browser_pool import BrowserPool
 from imdb_uploader.config import (
     SessionState,
     create_default_config,
@@ -24,6 +25,8 @@ from imdb_uploader.constants import (
     SkippedEntry,
     Stats,
 )
+from imdb_uploader.directors import DirectorResolver
+from imdb_uploader.match_cache import MatchCache
 from imdb_uploader.prompts import (
     beep,
     is_beep_enabled,
@@ -34,6 +37,9 @@ from imdb_uploader.prompts import (
     prompt_select_candidate,
     set_beep_enabled,
 )
+from imdb_uploader.query_planner import QueryPlanner
+from imdb_uploader.search_cache import CachingIMDbClient
+from imdb_uploader.title_index import TitleIndex, build_title_index
 from imdb_uploader.uploader import (
     BrowserStartError,
     CSVParseError,
@@ -68,6 +74,16 @@ __all__ = [
     "create_default_config",
     "SessionState",
     "retry_on_http_error",
+    # Caches
+    "MatchCache",
+    "CachingIMDbClient",
+    "DirectorResolver",
+    "QueryPlanner",
+    # Offline title index
+    "TitleIndex",
+    "build_title_index",
+    # Browsers
+    "BrowserPool",
     # Prompts
     "beep",
     "set_beep_enabled",
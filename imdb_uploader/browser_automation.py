@@ -127,6 +127,50 @@ def wait_for_login_manual(driver: WebDriver) -> None:
     input()
 
 
+def export_login_cookies(driver: WebDriver) -> list[dict]:
+    """Return the IMDb cookies of a logged-in browser.
+
+    Args:
+        driver: The WebDriver instance signed in to IMDb.
+
+    Returns:
+        List of cookie dictionaries, as accepted by ``add_cookie``.
+    """
+    return [
+        cookie
+        for cookie in driver.get_cookies()
+        if cookie.get("domain", "").lstrip(".").endswith("imdb.com")
+    ]
+
+
+def import_login_cookies(
+    driver: WebDriver, cookies: list[dict], page_load_wait: float = PAGE_LOAD_WAIT
+) -> int:
+    """Sign a fresh browser in to IMDb with cookies exported from another one.
+
+    Args:
+        driver: The WebDriver instance to sign in.
+        cookies: Cookies returned by export_login_cookies.
+        page_load_wait: Seconds to wait for IMDb pages to load.
+
+    Returns:
+        Number of cookies the browser accepted.
+    """
+    # Cookies can only be set for the domain of the open page
+    driver.get("https://www.imdb.com/")
+    time.sleep(page_load_wait)
+    added = 0
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+            added += 1
+        except Exception:
+            continue
+    driver.refresh()
+    time.sleep(page_load_wait)
+    return added
+
+
 def try_automated_login(
     driver: WebDriver,
     username: str,
@@ -0,0 +1,205 @@
+"""Parallel rating on several logged-in browsers.
+
+Rating a movie is mostly waiting: the movie page loads, the existing rating
+is read, the star dialog opens and the rating is submitted, several seconds
+per movie with the browser idle most of the time. In unattended auto-rate
+mode nothing needs the terminal once the IMDb ID of a movie is known, so
+several browsers can rate at once.
+
+BrowserPool runs one worker thread per browser. The browsers share the login
+of the first one, whose cookies are copied into the others (see
+export_login_cookies and import_login_cookies), so the user signs in once.
+The main thread keeps matching the movies and deciding what to rate; it
+submits (index, item, IMDb ID) jobs to a bounded queue and collects the
+outcome of every job, with the statistics and skipped items it produced, to
+merge them into the session state. Jobs finish out of order, so
+ProgressTracker only moves the resume point past items that all finished.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .constants import SKIP_AUTO_RATE_FAILED, MovieItem, SkippedEntry, Stats
+from .reporting import create_stats
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+# rate(driver, item, imdb_id, stats, skipped_items) -> 'ok', 'continue' or 'break'
+RateFunction = Callable[..., str]
+
+
+@dataclass
+class RatingResult:
+    """Outcome of rating one movie on a pool browser.
+
+    Attributes:
+        index: Position of the item in the run, as given to submit.
+        item: The movie item.
+        outcome: Value returned by the rate function.
+        stats: Statistics of this movie alone, to be added to the session's.
+        skipped_items: Skipped entries of this movie alone.
+    """
+
+    index: int
+    item: MovieItem
+    outcome: str
+    stats: Stats = field(default_factory=create_stats)
+    skipped_items: list[SkippedEntry] = field(default_factory=list)
+
+    def apply(self, stats: Stats, skipped_items: list[SkippedEntry]) -> None:
+        """Add this result to the statistics and skipped items of the session."""
+        for key, value in self.stats.items():
+            if isinstance(value, bool):
+                stats[key] = bool(stats.get(key)) or value
+            elif value:
+                stats[key] = stats.get(key, 0) + value
+        skipped_items.extend(self.skipped_items)
+
+
+class BrowserPool:
+    """Rate movies on several logged-in browsers at once.
+
+    Each browser is driven by its own worker thread, which takes jobs from a
+    queue holding at most one waiting job per browser, so submit blocks while
+    every browser is busy. Results are only collected when the caller asks,
+    on the caller's thread.
+
+    Args:
+        drivers: Logged-in WebDriver instances, one worker each. The pool
+            does not quit them.
+        rate: Function rating one movie on a browser. It may print but must
+            not prompt; it is called with fresh stats and skipped-items
+            containers, reported back in the RatingResult.
+    """
+
+    def __init__(self, drivers: Sequence[WebDriver], rate: RateFunction):
+        if not drivers:
+            raise ValueError("BrowserPool needs at least one browser")
+        self.size = len(drivers)
+        self._rate = rate
+        self._jobs: queue.Queue[tuple[int, MovieItem, str | None] | None] = queue.Queue(
+            maxsize=self.size
+        )
+        self._results: queue.Queue[RatingResult] = queue.Queue()
+        self._outstanding = 0
+        self._threads = [
+            threading.Thread(
+                target=self._work, args=(driver,), name=f"imdb-browser-{n}", daemon=True
+            )
+            for n, driver in enumerate(drivers, start=1)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> BrowserPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def outstanding(self) -> int:
+        """Number of submitted jobs whose result has not been collected yet."""
+        return self._outstanding
+
+    def submit(self, index: int, item: MovieItem, imdb_id: str | None) -> None:
+        """Queue a movie for rating, waiting while every browser is busy.
+
+        Args:
+            index: Position of the item in the run, reported back in the result.
+            item: The movie item.
+            imdb_id: IMDb ID of the movie, or None to search IMDb for it.
+        """
+        self._jobs.put((index, item, imdb_id))
+        self._outstanding += 1
+
+    def results(self, wait: bool = False) -> list[RatingResult]:
+        """Collect the results of finished jobs.
+
+        Args:
+            wait: Wait until every submitted job has finished.
+
+        Returns:
+            Results in completion order.
+        """
+        collected = []
+        while self._outstanding:
+            try:
+                result = self._results.get(block=wait)
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            collected.append(result)
+        return collected
+
+    def close(self) -> list[RatingResult]:
+        """Drop the jobs no browser has started, and wait for the running ones.
+
+        Returns:
+            Results not collected yet. Dropped jobs have none.
+        """
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                self._outstanding -= 1
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        return self.results()
+
+    def _work(self, driver: WebDriver) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            index, item, imdb_id = job
+            result = RatingResult(index, item, "continue")
+            try:
+                result.outcome = self._rate(
+                    driver, item, imdb_id, result.stats, result.skipped_items
+                )
+            except Exception as e:
+                # A crashed or disconnected browser fails its jobs, which can
+                # be retried later with --retry auto_rate_failed
+                logger.warning(f"  [{threading.current_thread().name}] {item['title']}: {e}")
+                result.stats["skipped_auto_rate_failed"] += 1
+                result.skipped_items.append({"item": item, "reason": SKIP_AUTO_RATE_FAILED})
+            self._results.put(result)
+
+
+class ProgressTracker:
+    """Resume point of a run whose items finish out of order.
+
+    Args:
+        start: Number of items finished before the run (the start index).
+    """
+
+    def __init__(self, start: int = 0):
+        self.index = start
+        self._finished: set[int] = set()
+
+    def finish(self, index: int) -> int:
+        """Mark the item at 1-based `index` finished.
+
+        Returns:
+            Number of leading items that are all finished, which is where a
+            resumed run starts.
+        """
+        self._finished.add(index)
+        while self.index + 1 in self._finished:
+            self._finished.remove(self.index + 1)
+            self.index += 1
+        return self.index
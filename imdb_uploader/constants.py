@@ -32,6 +32,13 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "unattended": False,
     "skipped_dir": "skipped",
     "session_file": ".upload_imdb_session.json",
+    "match_cache": ".imdb_match_cache.sqlite",
+    "search_cache": ".imdb_search_cache.sqlite",
+    "title_index": ".imdb_title_index.sqlite",
+    "jobs": 1,
+    "max_rps": 4.0,
+    "prefetch": 2,
+    "browsers": 1,
     "debug": False,
     "verbose": False,
     "no_beep": False,
@@ -59,6 +66,53 @@ DEFAULT_CONFIDENCE_THRESHOLD = 0.75
 DIRECTOR_LOOKUP_THRESHOLD = 0.85
 DIRECTOR_FETCH_CANDIDATE_MIN_SCORE = 0.4
 DIRECTOR_FETCH_LIMIT = 3
+# Lead of the best candidate over the runner-up that ends the search; larger
+# than any director boost, so no other candidate could overtake the leader
+QUERY_DECISIVE_MARGIN = 0.4
+# Best candidates attached to a match for user selection
+SELECTION_CANDIDATES = 10
+# Movies whose directors are kept in memory by a DirectorResolver
+DIRECTOR_CACHE_MAX_ENTRIES = 100000
+
+# Distinct strings whose normalised form is memoised (see normalize_text)
+NORMALIZE_CACHE_SIZE = 65536
+
+
+# =============================================================================
+# Match Cache
+# =============================================================================
+
+MATCH_CACHE_FILE = ".imdb_match_cache.sqlite"
+MATCH_CACHE_NOT_FOUND_TTL_DAYS = 30
+# Bump when the scoring in find_imdb_match changes, to invalidate cached matches
+MATCH_SCORING_VERSION = 3
+
+
+# =============================================================================
+# Search Cache
+# =============================================================================
+
+SEARCH_CACHE_FILE = ".imdb_search_cache.sqlite"
+SEARCH_CACHE_TTL_DAYS = 30
+SEARCH_CACHE_MAX_ENTRIES = 50000
+
+
+# =============================================================================
+# Offline Title Index
+# =============================================================================
+
+TITLE_INDEX_FILE = ".imdb_title_index.sqlite"
+# IMDb dataset title types kept in the index, with their IMDbPY kind
+TITLE_INDEX_KINDS = {
+    "movie": "movie",
+    "tvMovie": "tv movie",
+    "tvSeries": "tv series",
+    "tvMiniSeries": "tv mini series",
+    "tvSpecial": "tv special",
+    "video": "video movie",
+    "short": "short",
+    "tvShort": "tv short",
+}
 
 
 # =============================================================================
@@ -68,6 +122,12 @@ DIRECTOR_FETCH_LIMIT = 3
 RATE_LIMIT_COOLDOWN_INITIAL = 5
 RATE_LIMIT_COOLDOWN_MAX = 60
 MAX_RETRIES = 3
+# Ceiling on IMDb requests per second shared by the dry-run workers (--jobs)
+IMDB_MAX_RPS = 4.0
+# Movies matched ahead of the one being rated by the uploader (--prefetch)
+DEFAULT_PREFETCH = 2
+# Logged-in browsers rating in parallel in unattended auto-rate mode (--browsers)
+DEFAULT_BROWSERS = 1
 
 
 # =============================================================================
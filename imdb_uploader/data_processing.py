@@ -6,9 +6,11 @@ This module handles CSV reading, text normalization, and IMDb matching logic.
 from __future__ import annotations
 
 import csv
-import difflib
+import functools
+import heapq
 import unicodedata
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 try:
     # Cinemagoer is the modern fork/rename of IMDbPY
@@ -20,14 +22,24 @@ except ImportError:
         IMDbPYClient = None
 
 from .constants import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
     DIRECTOR_FETCH_CANDIDATE_MIN_SCORE,
-    DIRECTOR_FETCH_LIMIT,
     DIRECTOR_LOOKUP_THRESHOLD,
     MAX_RETRIES,
+    NORMALIZE_CACHE_SIZE,
+    QUERY_DECISIVE_MARGIN,
     RATE_LIMIT_COOLDOWN_INITIAL,
     RATE_LIMIT_COOLDOWN_MAX,
+    SELECTION_CANDIDATES,
     MovieItem,
 )
+from .scoring import director_boosts, similarities, year_adjustments
+
+if TYPE_CHECKING:
+    from .directors import DirectorResolver
+    from .match_cache import MatchCache
+    from .query_planner import QueryPlanner
+    from .title_index import TitleIndex
 
 
 def read_csv(path: str) -> list[MovieItem]:
@@ -96,9 +108,42 @@ def read_csv(path: str) -> list[MovieItem]:
     return items
 
 
+def _normalize_char(ch: str) -> str:
+    """Return a character without accents, or a space if it is punctuation."""
+    return "".join(
+        c if c.isalnum() or c.isspace() else " "
+        for c in unicodedata.normalize("NFD", ch)
+        if unicodedata.category(c) != "Mn"
+    )
+
+
+class _NormalizeTable(dict):
+    """str.translate table of _normalize_char, filled in for unseen characters."""
+
+    def __missing__(self, code: int) -> str:
+        value = self[code] = _normalize_char(chr(code))
+        return value
+
+
+# Latin-1, Latin Extended-A/B and the combining diacritical marks are
+# precomputed; any other character is added the first time it is seen
+_NORMALIZE_TABLE = _NormalizeTable(
+    (code, _normalize_char(chr(code))) for code in (*range(0x80, 0x250), *range(0x300, 0x370))
+)
+_ASCII_NORMALIZE_TABLE = bytes(
+    code if code >= 0x80 or chr(code).isalnum() or chr(code).isspace() else ord(" ")
+    for code in range(256)
+)
+_LEADING_ARTICLES = ("el ", "la ", "los ", "las ", "un ", "una ")
+
+
 def normalize_text(s: str) -> str:
     """Normalize text for fuzzy matching.
 
+    Accents and punctuation are removed with a translation table (a byte
+    table for ASCII strings) and results are memoised, since the same titles
+    and directors are normalised many times per search.
+
     Args:
         s: Input string to normalize.
 
@@ -114,19 +159,62 @@ def normalize_text(s: str) -> str:
     """
     if not s:
         return ""
+    return _normalize_text(s)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_text(s: str) -> str:
     s = s.strip().lower()
-    # remove accents
-    s = unicodedata.normalize("NFD", s)
-    s = "".join(ch for ch in s if unicodedata.category(ch) != "Mn")
-    # remove punctuation
-    s = "".join(ch if ch.isalnum() or ch.isspace() else " " for ch in s)
+    if s.isascii():
+        s = s.encode("ascii").translate(_ASCII_NORMALIZE_TABLE).decode("ascii")
+    else:
+        # Per-character NFD decomposition; the marks canonical ordering would
+        # move are all removed, so the result matches normalising the whole string
+        s = s.translate(_NORMALIZE_TABLE)
     # remove common Spanish leading articles to help matching
-    for prefix in ("el ", "la ", "los ", "las ", "un ", "una "):
+    for prefix in _LEADING_ARTICLES:
         if s.startswith(prefix):
             s = s[len(prefix) :]
             break
-    s = " ".join(s.split())
-    return s
+    return " ".join(s.split())
+
+
+def match_cache_key(
+    title: str,
+    year: str | None = None,
+    director: str | None = None,
+    original_title: str | None = None,
+    topn: int = 6,
+) -> str:
+    """Return the MatchCache key of a movie lookup.
+
+    Titles and director are normalised (see normalize_text), so spelling
+    variants that find_imdb_match treats alike share one entry.
+    """
+    parts = [
+        normalize_text(title or ""),
+        str(year or "").strip(),
+        normalize_text(original_title or ""),
+        normalize_text(director or ""),
+        str(topn),
+    ]
+    return "\x1f".join(parts)
+
+
+def director_names(movie: Any) -> list[str]:
+    """Return the director names included in an IMDbPY movie (possibly none)."""
+    names: list[str] = []
+    try:
+        d = movie.get("director") or movie.get("directors") or None
+        if d:
+            if isinstance(d, list):
+                for person in d:
+                    names.append(person.get("name") if hasattr(person, "get") else str(person))
+            else:
+                names.append(d.get("name") if hasattr(d, "get") else str(d))
+    except Exception:
+        return []
+    return names
 
 
 def find_imdb_match(
@@ -136,6 +224,10 @@ def find_imdb_match(
     director: str | None = None,
     original_title: str | None = None,
     topn: int = 6,
+    cache: MatchCache | None = None,
+    index: TitleIndex | None = None,
+    director_resolver: DirectorResolver | None = None,
+    query_planner: QueryPlanner | None = None,
 ) -> dict[str, Any] | None:
     """Use IMDbPY (if available) to search `title` and return the best candidate.
     This version minimizes network calls: it computes title+year confidence first and
@@ -145,48 +237,137 @@ def find_imdb_match(
     If original_title is provided (e.g., English title), it will be searched first
     as it often provides better matches on IMDb.
 
+    If a MatchCache is given, a movie looked up before is answered from it without
+    any network call. Results are only cached when every IMDb request succeeded.
+
+    If a TitleIndex is given, it is searched first (by year blocks when the
+    year is known, see TitleIndex.candidates) and IMDb is only queried
+    when the index has no match of at least DEFAULT_CONFIDENCE_THRESHOLD (the
+    better of both matches is returned). Without `ia`, such an inconclusive
+    index result is not cached, so a later online lookup still searches IMDb.
+
+    Candidate directors are read through a DirectorResolver and the search
+    queries are chosen by a QueryPlanner; pass ones shared by every lookup of
+    a run so resolved directors and query hit rates are reused. Otherwise
+    they are created for this call.
+
     Returns dict with keys: movieID, title, year, score (0..1), candidates (list) or None if no results.
     The 'candidates' list contains top matches for user selection in ambiguous cases.
     """
-    if ia is None:
+    if ia is None and index is None:
         return None
 
-    # Try multiple query variants to handle localized titles and parentheticals
-    queries = []
-
-    # Prioritize original title (usually English/international) as it matches better on IMDb
-    if original_title:
-        queries.append(original_title)
-        if year:
-            queries.append(f"{original_title} {year}")
-
-    raw = title or ""
-    queries.append(raw)
-    # remove parenthetical parts: e.g. 'Pride (Orgullo)' -> 'Pride'
-    if "(" in raw:
-        queries.append(raw.split("(")[0].strip())
-    # normalized (no accents)
-    norm = normalize_text(raw)
-    if norm and norm != raw:
-        queries.append(norm)
-    # add year to queries to prioritize correct release
-    if year:
-        if raw:
-            queries.append(f"{raw} {year}")
-        if norm:
-            queries.append(f"{norm} {year}")
-
-    seen = set()
+    key = ""
+    if cache is not None:
+        key = match_cache_key(title, year, director, original_title, topn)
+        found, cached = cache.get(key)
+        if found:
+            return cached
+
+    if director_resolver is None:
+        from .directors import DirectorResolver
+
+        director_resolver = DirectorResolver(ia, index)
+    if query_planner is None:
+        from .query_planner import QueryPlanner
+
+        query_planner = QueryPlanner()
+
+    # Try multiple query variants to handle localized titles and parentheticals,
+    # in the order and without the duplicates decided by the query planner
+    queries = query_planner.plan(title, year, original_title)
+    failures: list[str] = []
+    best = None
+    if index is not None:
+        best = _search_title_index(
+            index, queries, title, year, original_title, director, topn, failures, director_resolver
+        )
+    # Only IMDb searches are recorded, once per lookup
+    searched: list[str] = []
+    hit = None
+    if ia is not None and (best is None or best["score"] < DEFAULT_CONFIDENCE_THRESHOLD):
+        online = _search_imdb_match(
+            queries, year, ia.search_movie, director, topn, failures, director_resolver, searched
+        )
+        if online is not None and (best is None or online["score"] > best["score"]):
+            best = online
+            hit = next(variant for variant, query in queries if query == online["query"])
+    query_planner.record(searched, hit)
+    # An index-only miss or weak match says nothing about what IMDb would find
+    conclusive = ia is not None or (
+        best is not None and best["score"] >= DEFAULT_CONFIDENCE_THRESHOLD
+    )
+    if cache is not None and not failures and conclusive:
+        cache.put(key, best)
+    return best
+
+
+def _search_title_index(
+    index: TitleIndex,
+    queries: list[tuple[str, str]],
+    title: str,
+    year: str | None,
+    original_title: str | None,
+    director: str | None,
+    topn: int,
+    failures: list[str],
+    director_resolver: DirectorResolver,
+) -> dict[str, Any] | None:
+    """Search a TitleIndex for find_imdb_match.
+
+    With a known year, the original title and the title are looked up first
+    among the titles of that year (see TitleIndex.candidates), a short list
+    of candidates for full scoring. The text queries are only searched when
+    that gives no confident match, e.g. for a movie dated another year.
+    """
     best = None
-    all_candidates: list[dict[str, Any]] = []  # Store all candidates for user selection
+    if year and year.isdigit():
+        block_year = int(year)
+        blocks = [("original", original_title)] if original_title else []
+        if title != original_title:
+            blocks.append(("title", title))
+        best = _search_imdb_match(
+            blocks,
+            year,
+            lambda q: index.candidates(q, block_year),
+            director,
+            topn,
+            failures,
+            director_resolver,
+            [],
+        )
+    if best is None or best["score"] < DEFAULT_CONFIDENCE_THRESHOLD:
+        found = _search_imdb_match(
+            queries, year, index.search_movie, director, topn, failures, director_resolver, []
+        )
+        if found is not None and (best is None or found["score"] > best["score"]):
+            best = found
+    return best
+
+
+def _search_imdb_match(
+    queries: list[tuple[str, str]],
+    year: str | None,
+    search: Callable[[str], Any],
+    director: str | None,
+    topn: int,
+    failures: list[str],
+    director_resolver: DirectorResolver,
+    searched: list[str],
+) -> dict[str, Any] | None:
+    """Search IMDb (or a title index) for find_imdb_match.
+
+    `search` returns the movies found for a query, like ``ia.search_movie``.
+    Failed requests are appended to `failures` and the variant type of every
+    query searched to `searched`.
+    """
+    best = None
+    # Best-scoring entry of every candidate by movieID, for user selection
+    all_candidates: dict[str, dict[str, Any]] = {}
     cooldown_seconds = RATE_LIMIT_COOLDOWN_INITIAL
 
-    for q in queries:
-        if not q:
-            continue
-        if q in seen:
-            continue
-        seen.add(q)
+    for variant, q in queries:
+        searched.append(variant)
 
         # Retry loop for handling HTTP errors with cooldown
         for attempt in range(MAX_RETRIES):
@@ -195,7 +376,7 @@ def find_imdb_match(
 
                 logger = logging.getLogger(__name__)
                 logger.info(f"[imdbpy] searching for: {q!r}")
-                results = ia.search_movie(q) or []
+                results = search(q) or []
                 logger.info(f"[imdbpy] -> {len(results)} results for query: {q!r}")
                 if results:
                     sample = []
@@ -235,68 +416,54 @@ def find_imdb_match(
                 else:
                     logger.warning(f"[imdbpy] search exception for query {q!r}: {e}")
                 results = []
+        else:
+            failures.append(q)
 
         if not results:
             continue
 
         qnorm = normalize_text(q)
 
-        # First pass: compute base score using title (and year boost) only
+        # First pass: score every candidate at once using title (and year boost) only
         candidates = []  # list of dicts: {cand, cand_title, cand_year, base_score, has_director_info}
-        for cand in results[: max(topn, 10)]:
+        scored = results[: max(topn, 10)]
+        cand_titles = []
+        cand_years = []
+        for cand in scored:
             try:
                 cand_title = cand.get("title") or ""
                 cand_year = str(cand.get("year") or "")
             except Exception:
                 cand_title = ""
                 cand_year = ""
-            cnorm = normalize_text(cand_title)
-            base_score = difflib.SequenceMatcher(None, qnorm, cnorm).ratio()
-            # boost if year matches
-            if year and cand_year and year == cand_year:
-                base_score += 0.8
-            # penalize if year does not match for 2 years
-            elif year and cand_year:
-                try:
-                    ydiff = abs(int(year) - int(cand_year))
-                    if ydiff >= 2:
-                        base_score -= 0.6
-                except Exception:
-                    pass
-
+            cand_titles.append(cand_title)
+            cand_years.append(cand_year)
+        base_scores = similarities(qnorm, [normalize_text(t) for t in cand_titles])
+        base_scores += year_adjustments(year, cand_years)
+
+        for cand, cand_title, cand_year, base_score in zip(
+            scored, cand_titles, cand_years, base_scores.tolist()
+        ):
             # detect if search result already includes director info (avoid update)
-            has_director_info = False
-            cand_directors_list = []
-            try:
-                d = cand.get("director") or cand.get("directors") or None
-                if d:
-                    has_director_info = True
-                    if isinstance(d, list):
-                        for person in d:
-                            cand_directors_list.append(
-                                person.get("name") if hasattr(person, "get") else str(person)
-                            )
-                    else:
-                        cand_directors_list.append(d.get("name") if hasattr(d, "get") else str(d))
-            except Exception:
-                has_director_info = False
+            cand_directors_list = director_names(cand)
 
             candidate_entry = {
                 "cand": cand,
                 "title": cand_title,
                 "year": cand_year,
                 "base_score": base_score,
-                "has_dir": has_director_info,
+                "has_dir": bool(cand_directors_list),
                 "directors": ", ".join(cand_directors_list) if cand_directors_list else "",
                 "movieID": cand.movieID if hasattr(cand, "movieID") else None,
             }
             candidates.append(candidate_entry)
 
-            # Also add to all_candidates for user selection (avoid duplicates by movieID)
-            if candidate_entry["movieID"] and not any(
-                c["movieID"] == candidate_entry["movieID"] for c in all_candidates
-            ):
-                all_candidates.append(candidate_entry)
+            # Also add to all_candidates for user selection (one entry per movieID)
+            movie_id = candidate_entry["movieID"]
+            if movie_id:
+                known = all_candidates.get(movie_id)
+                if known is None or base_score > known["base_score"]:
+                    all_candidates[movie_id] = candidate_entry
 
             # keep a quick best based on base_score
             if best is None or base_score > best["score"]:
@@ -317,108 +484,58 @@ def find_imdb_match(
             logger.info(
                 f"[imdbpy] high confidence ({best['score']:.3f}) from title+year; skipping director fetchs"
             )
-            best["candidates"] = sorted(
-                all_candidates, key=lambda x: x["base_score"], reverse=True
-            )[:10]
-            return best
+            break
 
-        # If director is provided, try to improve score by fetching directors for top candidates
+        # A best candidate leading the runner-up by more than any director
+        # boost can't be overtaken, so the remaining queries are not worth it.
+        # Its own director boost is still applied below, so the returned
+        # confidence is the same as without this shortcut.
+        decisive = None
+        if best and best["score"] >= DEFAULT_CONFIDENCE_THRESHOLD:
+            runner_up = max(
+                (
+                    c["base_score"]
+                    for c in all_candidates.values()
+                    if c["movieID"] != best["movieID"]
+                ),
+                default=0.0,
+            )
+            if best["score"] - runner_up >= QUERY_DECISIVE_MARGIN:
+                decisive = (best["score"], runner_up)
+
+        # If director is provided, try to improve score with the directors of the top candidates
         if director:
             dnorm = normalize_text(director)
-            # sort candidates by base_score desc and fetch limited number
-            candidates_sorted = sorted(candidates, key=lambda x: x["base_score"], reverse=True)
-            fetch_count = 0
-            for entry in candidates_sorted:
-                if fetch_count >= DIRECTOR_FETCH_LIMIT:
-                    break
-                if entry["base_score"] < DIRECTOR_FETCH_CANDIDATE_MIN_SCORE:
-                    break
-                cand = entry["cand"]
-                cand_directors = []
-
-                # if search result already included directors, use them first
-                try:
-                    d = cand.get("director") or cand.get("directors") or None
-                    if d:
-                        if isinstance(d, list):
-                            for person in d:
-                                cand_directors.append(
-                                    person.get("name") if hasattr(person, "get") else str(person)
-                                )
-                        else:
-                            cand_directors.append(d.get("name") if hasattr(d, "get") else str(d))
-                    else:
-                        # otherwise fetch details (network call) with retry on HTTP errors
-                        for update_attempt in range(2):
-                            try:
-                                import logging
-
-                                logger = logging.getLogger(__name__)
-                                logger.debug(
-                                    f"[imdbpy] fetching details for candidate {getattr(cand, 'movieID', '<unknown>')} to read directors"
-                                )
-                                ia.update(cand)
-                                fetch_count += 1
-                                d2 = cand.get("director") or cand.get("directors")
-                                if d2:
-                                    if isinstance(d2, list):
-                                        for p in d2:
-                                            cand_directors.append(
-                                                p.get("name") if hasattr(p, "get") else str(p)
-                                            )
-                                    else:
-                                        cand_directors.append(
-                                            d2.get("name") if hasattr(d2, "get") else str(d2)
-                                        )
-                                break  # Success
-                            except Exception as update_err:
-                                import logging
-
-                                logger = logging.getLogger(__name__)
-                                error_str = str(update_err).lower()
-                                is_http_error = (
-                                    "http error 5" in error_str
-                                    or "500" in error_str
-                                    or "503" in error_str
-                                    or "httperror" in error_str
-                                )
-                                if is_http_error and update_attempt == 0:
-                                    import logging
-
-                                    logger = logging.getLogger(__name__)
-                                    logger.info(
-                                        "[imdbpy] ⚠️  HTTP error on update, cooling down 5s..."
-                                    )
-                                    import time
-
-                                    time.sleep(5)
-                                else:
-                                    break  # Give up after retry
-                except Exception:
-                    pass
-
-                # compute director boost
-                director_boost = 0.0
-                for cd in cand_directors:
-                    if not cd:
-                        continue
-                    cdnorm = normalize_text(cd)
-                    if dnorm and cdnorm:
-                        if cdnorm.split()[-1] == dnorm.split()[-1]:
-                            director_boost = max(director_boost, 0.35)
-                        else:
-                            sim = difflib.SequenceMatcher(None, dnorm, cdnorm).ratio()
-                            if sim > 0.8:
-                                director_boost = max(director_boost, 0.3)
-                            elif sim > 0.6:
-                                director_boost = max(director_boost, 0.15)
-
+            # candidates worth a director lookup, best first; the resolver only
+            # fetches (network calls) a limited number of them
+            eligible = [
+                entry
+                for entry in sorted(candidates, key=lambda x: x["base_score"], reverse=True)
+                if entry["base_score"] >= DIRECTOR_FETCH_CANDIDATE_MIN_SCORE
+            ]
+            resolved = director_resolver.resolve([entry["cand"] for entry in eligible], failures)
+            fetched = [
+                (entry, cand_directors)
+                for entry, cand_directors in zip(eligible, resolved)
+                if cand_directors is not None
+            ]
+
+            # compute director boosts of every fetched candidate at once
+            boosts = director_boosts(
+                dnorm,
+                [
+                    [normalize_text(cd) for cd in cand_directors if cd]
+                    for _, cand_directors in fetched
+                ],
+            )
+            for (entry, cand_directors), director_boost in zip(fetched, boosts.tolist()):
                 total_score = entry["base_score"] + director_boost
                 # Update entry with director info if we fetched it
                 if cand_directors and not entry["directors"]:
                     entry["directors"] = ", ".join(cand_directors)
 
                 if total_score > best["score"]:
+                    cand = entry["cand"]
                     best = {
                         "movieID": cand.movieID if hasattr(cand, "movieID") else None,
                         "title": entry["title"],
@@ -432,10 +549,19 @@ def find_imdb_match(
         if best and best["score"] >= DIRECTOR_LOOKUP_THRESHOLD:
             break
 
-    # Add candidates to best result for user selection in ambiguous cases
+        if decisive is not None:
+            import logging
+
+            logger = logging.getLogger(__name__)
+            logger.info(
+                f"[imdbpy] decisive match ({decisive[0]:.3f}, runner-up {decisive[1]:.3f}); "
+                "skipping remaining queries"
+            )
+            break
+
     # Add candidates to best result for user selection in ambiguous cases
     if best:
-        best["candidates"] = sorted(all_candidates, key=lambda x: x["base_score"], reverse=True)[
-            :10
-        ]
+        best["candidates"] = heapq.nlargest(
+            SELECTION_CANDIDATES, all_candidates.values(), key=lambda x: x["base_score"]
+        )
     return best
@@ -0,0 +1,196 @@
+"""Director resolution for find_imdb_match.
+
+When title and year alone are not conclusive, find_imdb_match compares the
+local director with the directors of the best candidates. IMDb search
+results rarely include directors, and reading them costs one ``ia.update``
+page load per candidate, repeated for every query variant of a movie and
+for every movie by the same director.
+
+DirectorResolver resolves the directors of all pending candidates of a
+search in one pass, cheapest source first:
+
+1. directors already included in the search result;
+2. credits resolved earlier in the run, shared by every item and thread;
+3. the offline title index, with a single query for all remaining candidates;
+4. ``ia.update``, attempted for at most ``fetch_limit`` candidates.
+
+Resolved credits are also kept as a person -> filmography map, so the
+movies known for a director recurring across the library can be listed
+without any lookup.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from .constants import DIRECTOR_CACHE_MAX_ENTRIES, DIRECTOR_FETCH_LIMIT
+from .data_processing import director_names, normalize_text
+
+if TYPE_CHECKING:
+    from .title_index import TitleIndex
+
+logger = logging.getLogger(__name__)
+
+
+class DirectorResolver:
+    """Resolve and remember the directors of IMDb candidates.
+
+    The resolver may be shared by several threads.
+
+    Args:
+        ia: IMDbPY client used for the candidates no local source knows, or
+            None to never fetch.
+        title_index: Optional offline title index.
+        fetch_limit: Maximum number of ``ia.update`` attempts per resolve
+            call, failed attempts included.
+        max_entries: Maximum number of movies kept in memory; the least
+            recently used ones are forgotten beyond it.
+    """
+
+    def __init__(
+        self,
+        ia: Any = None,
+        title_index: TitleIndex | None = None,
+        fetch_limit: int = DIRECTOR_FETCH_LIMIT,
+        max_entries: int = DIRECTOR_CACHE_MAX_ENTRIES,
+    ):
+        self.ia = ia
+        self.title_index = title_index
+        self.fetch_limit = fetch_limit
+        self.max_entries = max_entries
+        self.hits = 0
+        self.index_hits = 0
+        self.fetches = 0
+        self._credits: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+        self._filmographies: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._credits)
+
+    def resolve(self, movies: Sequence[Any], failures: list[str]) -> list[list[str] | None]:
+        """Return the directors of every movie.
+
+        Args:
+            movies: IMDbPY movies (search results), most promising first;
+                ``ia.update`` is attempted in this order.
+            failures: List the IDs of movies whose details could not be
+                fetched are appended to.
+
+        Returns:
+            List aligned with `movies` of director names, or None for a movie
+            whose directors could not be resolved.
+        """
+        resolved: list[list[str] | None] = [None] * len(movies)
+        # (position, movie ID) of the movies no cheaper source has resolved yet
+        pending: list[tuple[int, str | None]] = []
+        for i, movie in enumerate(movies):
+            movie_id = _movie_id(movie)
+            names = director_names(movie)
+            if names:
+                resolved[i] = names
+                if movie_id:
+                    self.remember(movie_id, names)
+                continue
+            known = self.credits(movie_id) if movie_id else None
+            if known is None:
+                pending.append((i, movie_id))
+                continue
+            resolved[i] = known
+            with self._lock:
+                self.hits += 1
+
+        if pending and self.title_index is not None:
+            found = self.title_index.directors(movie_id for _, movie_id in pending if movie_id)
+            for movie_id, names in found.items():
+                self.remember(movie_id, names)
+            unresolved = []
+            for i, movie_id in pending:
+                if movie_id in found:
+                    resolved[i] = list(found[movie_id])
+                else:
+                    unresolved.append((i, movie_id))
+            with self._lock:
+                self.index_hits += len(pending) - len(unresolved)
+            pending = unresolved
+
+        if self.ia is not None:
+            for i, movie_id in pending[: self.fetch_limit]:
+                # An earlier fetch of this batch may have resolved the same movie
+                known = self.credits(movie_id) if movie_id else None
+                resolved[i] = known if known is not None else self._fetch(movies[i], failures)
+        return resolved
+
+    def credits(self, movie_id: str) -> list[str] | None:
+        """Return the known directors of a movie, or None if it was never resolved."""
+        with self._lock:
+            names = self._credits.get(movie_id)
+            if names is None:
+                return None
+            self._credits.move_to_end(movie_id)
+            return list(names)
+
+    def filmography(self, director: str) -> set[str]:
+        """Return the IDs of the movies known to be directed by `director`."""
+        with self._lock:
+            return set(self._filmographies.get(normalize_text(director), ()))
+
+    def remember(self, movie_id: str, names: Sequence[str]) -> None:
+        """Record the directors of a movie."""
+        with self._lock:
+            self._forget(movie_id)
+            self._credits[movie_id] = tuple(names)
+            for name in names:
+                self._filmographies.setdefault(normalize_text(name), set()).add(movie_id)
+            while len(self._credits) > self.max_entries:
+                self._forget(next(iter(self._credits)))
+
+    def _forget(self, movie_id: str) -> None:
+        for name in self._credits.pop(movie_id, ()):
+            films = self._filmographies.get(normalize_text(name))
+            if films is not None:
+                films.discard(movie_id)
+                if not films:
+                    del self._filmographies[normalize_text(name)]
+
+    def _fetch(self, movie: Any, failures: list[str]) -> list[str] | None:
+        """Read the directors of a movie with ``ia.update``, retrying once on HTTP errors."""
+        movie_id = _movie_id(movie)
+        for update_attempt in range(2):
+            try:
+                logger.debug(
+                    f"[imdbpy] fetching details for candidate {movie_id or '<unknown>'} to read directors"
+                )
+                with self._lock:
+                    self.fetches += 1
+                self.ia.update(movie)
+                names = director_names(movie)
+                if movie_id:
+                    self.remember(movie_id, names)
+                return names
+            except Exception as update_err:
+                error_str = str(update_err).lower()
+                is_http_error = (
+                    "http error 5" in error_str
+                    or "500" in error_str
+                    or "503" in error_str
+                    or "httperror" in error_str
+                )
+                if is_http_error and update_attempt == 0:
+                    logger.info("[imdbpy] ⚠️  HTTP error on update, cooling down 5s...")
+                    time.sleep(5)
+                else:
+                    failures.append(movie_id or "")
+                    break  # Give up after retry
+        return None
+
+
+def _movie_id(movie: Any) -> str | None:
+    movie_id = getattr(movie, "movieID", None)
+    return str(movie_id) if movie_id else None
@@ -0,0 +1,227 @@
+"""Persistent cache of IMDb matches.
+
+find_imdb_match issues several IMDb searches (and detail lookups for
+directors) per movie. MatchCache stores the outcome of each lookup in a small
+SQLite database keyed by the normalised (title, year, original title,
+director) of the movie, so dry runs, retries and resumed sessions over the
+same CSV don't repeat them.
+
+Each entry is stamped with a fingerprint of the scoring constants. Entries
+computed with different constants are dropped when the cache is opened, so
+changing the scoring never serves stale matches.
+
+The same database keeps the hit counts of the IMDb query variants (see
+QueryPlanner), so the search order learnt in one run carries over to the next.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .constants import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DIRECTOR_FETCH_CANDIDATE_MIN_SCORE,
+    DIRECTOR_FETCH_LIMIT,
+    DIRECTOR_LOOKUP_THRESHOLD,
+    MATCH_CACHE_NOT_FOUND_TTL_DAYS,
+    MATCH_SCORING_VERSION,
+    QUERY_DECISIVE_MARGIN,
+    SELECTION_CANDIDATES,
+    IMDbMatch,
+)
+from .scoring import (
+    DIRECTOR_SIMILARITY_BOOSTS,
+    DIRECTOR_SURNAME_BOOST,
+    YEAR_MATCH_BOOST,
+    YEAR_MISMATCH_MIN_DIFF,
+    YEAR_MISMATCH_PENALTY,
+    get_backend,
+)
+
+
+def scoring_fingerprint() -> str:
+    """Return a short hash of the constants that decide which match is chosen.
+
+    Bump MATCH_SCORING_VERSION when the scoring code itself changes. The
+    similarity backend is included since its ratios differ slightly.
+    """
+    scoring = {
+        "version": MATCH_SCORING_VERSION,
+        "confidence_threshold": DEFAULT_CONFIDENCE_THRESHOLD,
+        "director_lookup_threshold": DIRECTOR_LOOKUP_THRESHOLD,
+        "director_fetch_candidate_min_score": DIRECTOR_FETCH_CANDIDATE_MIN_SCORE,
+        "director_fetch_limit": DIRECTOR_FETCH_LIMIT,
+        "query_decisive_margin": QUERY_DECISIVE_MARGIN,
+        "selection_candidates": SELECTION_CANDIDATES,
+        "year_match_boost": YEAR_MATCH_BOOST,
+        "year_mismatch_penalty": YEAR_MISMATCH_PENALTY,
+        "year_mismatch_min_diff": YEAR_MISMATCH_MIN_DIFF,
+        "director_surname_boost": DIRECTOR_SURNAME_BOOST,
+        "director_similarity_boosts": DIRECTOR_SIMILARITY_BOOSTS,
+        "similarity": get_backend(),
+    }
+    return hashlib.sha1(json.dumps(scoring, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def _serializable(match: IMDbMatch | None) -> IMDbMatch | None:
+    """Copy a match without the IMDbPY objects kept in its candidates."""
+    if match is None:
+        return None
+    data = dict(match)
+    if "candidates" in data:
+        data["candidates"] = [
+            {key: value for key, value in candidate.items() if key != "cand"}
+            for candidate in data["candidates"]
+        ]
+    return data
+
+
+class MatchCache:
+    """SQLite-backed cache of find_imdb_match results.
+
+    Movies without any IMDb match are cached too, but only for
+    ``not_found_ttl`` seconds since they may be added to IMDb later. The
+    cache may be shared by several threads.
+
+    Args:
+        path: Database file (created if missing).
+        refresh: Ignore existing entries (but still store new ones).
+        not_found_ttl: Maximum age in seconds of a "no match" entry, or None
+            to keep them forever.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        refresh: bool = False,
+        not_found_ttl: float | None = MATCH_CACHE_NOT_FOUND_TTL_DAYS * 86400,
+    ):
+        self.path = Path(path)
+        self.refresh = refresh
+        self.not_found_ttl = not_found_ttl
+        self.fingerprint = scoring_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            "key TEXT PRIMARY KEY, scoring TEXT NOT NULL, data TEXT, stored_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_stats ("
+            "variant TEXT PRIMARY KEY, searched INTEGER NOT NULL, hits INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+        self.prune()
+
+    def __enter__(self) -> MatchCache:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def get(self, key: str) -> tuple[bool, IMDbMatch | None]:
+        """Look up a movie.
+
+        Args:
+            key: Cache key of the movie (see data_processing.match_cache_key).
+
+        Returns:
+            Tuple of (found, match). The match is None both for a miss and for
+            a cached lookup that found nothing on IMDb.
+        """
+        with self._lock:
+            row = None
+            if not self.refresh:
+                row = self._conn.execute(
+                    "SELECT data, stored_at FROM matches WHERE key = ? AND scoring = ?",
+                    (key, self.fingerprint),
+                ).fetchone()
+            if row is not None and row[0] is None and not self._is_fresh_not_found(row[1]):
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+        return True, json.loads(row[0]) if row[0] is not None else None
+
+    def put(self, key: str, match: IMDbMatch | None) -> None:
+        """Store the result of a lookup (None if IMDb had no match)."""
+        data = _serializable(match)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matches (key, scoring, data, stored_at) VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    self.fingerprint,
+                    json.dumps(data, ensure_ascii=False) if data is not None else None,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def query_stats(self) -> dict[str, tuple[int, int]]:
+        """Return the (searches, hits) per IMDb query variant type of earlier runs."""
+        with self._lock:
+            rows = self._conn.execute("SELECT variant, searched, hits FROM query_stats")
+            return {variant: (searched, hits) for variant, searched, hits in rows}
+
+    def add_query_stats(self, stats: dict[str, tuple[int, int]]) -> None:
+        """Add the (searches, hits) per query variant type of a run (see QueryPlanner.run_stats)."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO query_stats (variant, searched, hits) VALUES (?, ?, ?) "
+                "ON CONFLICT(variant) DO UPDATE SET "
+                "searched = searched + excluded.searched, hits = hits + excluded.hits",
+                [(variant, searched, hits) for variant, (searched, hits) in stats.items()],
+            )
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """Delete entries of other scoring versions and expired "no match" entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM matches WHERE scoring != ?", (self.fingerprint,)
+            ).rowcount
+            if self.not_found_ttl is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM matches WHERE data IS NULL AND stored_at < ?",
+                    (time.time() - self.not_found_ttl,),
+                ).rowcount
+            self._conn.commit()
+            return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM matches")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.close()
+            self._conn = None  # type: ignore[assignment]
+
+    def _is_fresh_not_found(self, stored_at: float) -> bool:
+        return self.not_found_ttl is None or time.time() - stored_at <= self.not_found_ttl
@@ -0,0 +1,152 @@
+"""Query planning for find_imdb_match.
+
+A movie can be searched on IMDb with up to seven query variants: original
+title, original title and year, local title, local title without its
+parenthetical part, normalised title, and the last two followed by the year.
+Each variant costs one search request, while most movies are found by the
+first one or two.
+
+QueryPlanner decides which variants are searched and in which order:
+
+- variants IMDb treats as the same query (differing only in case,
+  punctuation or spacing) are searched once;
+- variant types are ordered by their hit rate so far, that is how often a
+  search of that type produced the final match.
+
+Only IMDb searches are counted: the offline title index costs no request,
+so its misses say nothing about which variants are worth a search. The hit
+counts of earlier runs can be passed in as `history` (MatchCache keeps them
+next to the matches, see MatchCache.query_stats), and run_stats returns the
+counts of this run to be added to them.
+
+find_imdb_match also stops as soon as a candidate leads the runner-up by
+QUERY_DECISIVE_MARGIN. The planner counts the query variants built and the
+searches issued per lookup, so the saving can be reported at the end of a run.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Mapping, Sequence
+
+from .data_processing import normalize_text
+
+# Variant types, in the order they are tried before any statistics exist
+VARIANTS = (
+    "original",
+    "original_year",
+    "title",
+    "title_base",
+    "normalized",
+    "title_year",
+    "normalized_year",
+)
+
+
+def imdb_query_key(query: str) -> str:
+    """Return the form of `query` IMDb searches for (case, punctuation and spacing ignored)."""
+    return " ".join("".join(ch if ch.isalnum() else " " for ch in query.casefold()).split())
+
+
+class QueryPlanner:
+    """Order and deduplicate the search queries of find_imdb_match.
+
+    The planner may be shared by several threads; share one per run so the
+    hit rates of earlier lookups order the variants of the next ones.
+
+    Args:
+        history: (searches, hits) per variant type from earlier runs.
+    """
+
+    def __init__(self, history: Mapping[str, tuple[int, int]] | None = None) -> None:
+        self.lookups = 0
+        self.variants = 0
+        self.searches = 0
+        self._past_searched: Counter[str] = Counter()
+        self._past_hits: Counter[str] = Counter()
+        for variant, (searched, hits) in (history or {}).items():
+            self._past_searched[variant] = searched
+            self._past_hits[variant] = hits
+        self._searched: Counter[str] = Counter()
+        self._hits: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def plan(
+        self, title: str, year: str | None = None, original_title: str | None = None
+    ) -> list[tuple[str, str]]:
+        """Return the (variant type, query) pairs to search, most promising first."""
+        raw = title or ""
+        norm = normalize_text(raw)
+        built = {
+            "original": original_title or "",
+            "original_year": f"{original_title} {year}" if original_title and year else "",
+            "title": raw,
+            # remove parenthetical parts: e.g. 'Pride (Orgullo)' -> 'Pride'
+            "title_base": raw.split("(")[0].strip() if "(" in raw else "",
+            "normalized": norm if norm != raw else "",
+            "title_year": f"{raw} {year}" if raw and year else "",
+            "normalized_year": f"{norm} {year}" if norm and year else "",
+        }
+
+        with self._lock:
+            self.variants += len({query for query in built.values() if query})
+            # Stable sort: variant types without a better hit rate keep their order
+            order = sorted(VARIANTS, key=self._hit_rate, reverse=True)
+
+        plan = []
+        seen = set()
+        for variant in order:
+            query = built[variant]
+            key = imdb_query_key(query)
+            if key and key not in seen:
+                seen.add(key)
+                plan.append((variant, query))
+        return plan
+
+    def record(self, searched: Sequence[str], hit: str | None) -> None:
+        """Record a lookup, once per find_imdb_match call.
+
+        Args:
+            searched: Variant types searched on IMDb, one per search request.
+            hit: Variant type of the IMDb search that produced the match, if any.
+        """
+        with self._lock:
+            self.lookups += 1
+            self.searches += len(searched)
+            self._searched.update(searched)
+            if hit is not None:
+                self._hits[hit] += 1
+
+    def hit_rates(self) -> dict[str, float]:
+        """Return the observed hit rate of every variant type searched so far, history included."""
+        with self._lock:
+            searched = self._past_searched + self._searched
+            hits = self._past_hits + self._hits
+            return {
+                variant: hits[variant] / searched[variant]
+                for variant in VARIANTS
+                if searched[variant]
+            }
+
+    def run_stats(self) -> dict[str, tuple[int, int]]:
+        """Return the (searches, hits) per variant type recorded by this planner."""
+        with self._lock:
+            return {
+                variant: (self._searched[variant], self._hits[variant])
+                for variant in VARIANTS
+                if self._searched[variant]
+            }
+
+    def summary(self) -> str:
+        """Return a one-line report of the searches issued per lookup."""
+        lookups = max(self.lookups, 1)
+        return (
+            f"IMDb searches: {self.searches / lookups:.1f} per lookup "
+            f"(of {self.variants / lookups:.1f} query variants) over {self.lookups} lookups"
+        )
+
+    def _hit_rate(self, variant: str) -> float:
+        # Laplace smoothing: untried variant types start at 0.5
+        hits = self._past_hits[variant] + self._hits[variant]
+        return (hits + 1) / (self._past_searched[variant] + self._searched[variant] + 2)
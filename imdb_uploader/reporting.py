@@ -9,30 +9,96 @@ from __future__ import annotations
 import argparse
 import csv
 import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from selenium.webdriver.chrome.webdriver import WebDriver
 
+    from .match_cache import MatchCache
+    from .title_index import TitleIndex
+
 from .constants import (
     CSV_FIELDNAMES,
     CSV_FIELDNAMES_WITH_REASON,
     SKIP_REASON_TO_FILE,
     Stats,
 )
-from .data_processing import find_imdb_match
+from .directors import DirectorResolver
+from .query_planner import QueryPlanner
+from .workers import MatchPrefetcher
+
+
+def _match_items(
+    items: list[dict[str, Any]],
+    ia: Any,
+    match_cache: MatchCache | None,
+    index: TitleIndex | None,
+    jobs: int,
+    director_resolver: DirectorResolver,
+    query_planner: QueryPlanner,
+) -> Iterator[tuple[dict[str, Any] | None, str | None]]:
+    """Yield (best match, error message) for each item, in input order.
+
+    With jobs > 1 the items are matched ahead by a MatchPrefetcher with jobs
+    threads, so results can be written as soon as the items before them are
+    done.
+    """
+    with MatchPrefetcher(
+        ia,
+        match_cache,
+        lookahead=2 * jobs,
+        title_index=index,
+        director_resolver=director_resolver,
+        query_planner=query_planner,
+        workers=jobs,
+    ) as prefetcher:
+        pairs: Iterable[tuple[dict[str, Any], Future[dict[str, Any] | None] | None]]
+        if jobs > 1:
+            pairs = prefetcher.iter_items(items)
+        else:
+            pairs = ((item, None) for item in items)
+        for item, future in pairs:
+            try:
+                best = future.result() if future is not None else prefetcher.match(item)
+            except Exception as e:
+                yield None, f"{type(e).__name__}: {e}"
+            else:
+                yield best, None
 
 
-def run_dry_run(items: list[dict[str, Any]], ia: Any, output_path: str) -> None:
+def run_dry_run(
+    items: list[dict[str, Any]],
+    ia: Any,
+    output_path: str,
+    match_cache: MatchCache | None = None,
+    jobs: int = 1,
+    title_index: TitleIndex | None = None,
+) -> list[dict[str, str]]:
     """Run dry-run mode: map titles to IMDb IDs without rating.
 
+    An item whose lookup raises is written without a match and reported at
+    the end instead of stopping the run.
+
     Args:
         items: List of movie items to match.
-        ia: IMDbPY client instance.
+        ia: IMDbPY client instance (thread-safe if jobs > 1, see
+            init_imdbpy_client).
         output_path: Path for output CSV file.
+        match_cache: Optional cache of previous IMDb matches.
+        jobs: Number of items matched concurrently. Rows are still written
+            in input order.
+        title_index: Optional offline title index searched before IMDb.
+
+    Returns:
+        List of {"title", "year", "error"} dicts for the items that failed.
     """
     print(f"Running dry-run mapping using IMDbPY; writing results to {output_path}")
+    if jobs > 1:
+        print(f"Matching {jobs} items at a time")
     total_items = len(items)
+    errors: list[dict[str, str]] = []
     with open(output_path, "w", newline="", encoding="utf-8") as fh:
         w = csv.writer(fh)
         w.writerow(
@@ -48,18 +114,27 @@ def run_dry_run(items: list[dict[str, Any]], ia: Any, output_path: str) -> None:
                 "result_count",
             ]
         )
-        for idx, it in enumerate(items, start=1):
+        # One resolver and planner for the whole run: directors recur across
+        # the library and query hit rates improve with every lookup
+        director_resolver = DirectorResolver(ia, title_index)
+        query_planner = QueryPlanner(match_cache.query_stats() if match_cache is not None else None)
+        results = _match_items(
+            items, ia, match_cache, title_index, jobs, director_resolver, query_planner
+        )
+        for idx, (it, (best, error)) in enumerate(zip(items, results), start=1):
             title = it["title"]
             year = it.get("year")
             director = it.get("directors")
-            original_title = it.get("original_title")
             progress_pct = (idx / total_items) * 100
-            best = find_imdb_match(
-                title, year, ia=ia, director=director, original_title=original_title
-            )
-            print(
-                f'[{idx}/{total_items}] ({progress_pct:.1f}%) Best match for "{title}" ({year}): {best.get("title") if best else "None"}'
-            )
+            if error:
+                errors.append({"title": title, "year": year or "", "error": error})
+                print(
+                    f'[{idx}/{total_items}] ({progress_pct:.1f}%) Error matching "{title}" ({year}): {error}'
+                )
+            else:
+                print(
+                    f'[{idx}/{total_items}] ({progress_pct:.1f}%) Best match for "{title}" ({year}): {best.get("title") if best else "None"}'
+                )
             if best:
                 imdb_id = f"tt{best['movieID']}" if best.get("movieID") else ""
                 w.writerow(
@@ -77,7 +152,17 @@ def run_dry_run(items: list[dict[str, Any]], ia: Any, output_path: str) -> None:
                 )
             else:
                 w.writerow([title, year or "", director or "", "", "", "", "0.000", "", 0])
-    print("Dry-run complete.")
+    if errors:
+        print(f"Dry-run complete with {len(errors)} errors:")
+        for entry in errors:
+            print(f"  - {entry['title']} ({entry['year']}): {entry['error']}")
+    else:
+        print("Dry-run complete.")
+    if query_planner.lookups:
+        print(query_planner.summary())
+        if match_cache is not None:
+            match_cache.add_query_stats(query_planner.run_stats())
+    return errors
 
 
 def setup_browser_session(args: argparse.Namespace, config: dict[str, Any]) -> WebDriver:
@@ -0,0 +1,262 @@
+"""Cache of raw IMDb responses underneath the IMDbPY/Cinemagoer client.
+
+The same search queries (a normalised title, or a title followed by its
+year) come up again and again across movies, runs and CSV files, and
+``ia.update(movie)`` downloads the same candidate pages repeatedly.
+CachingIMDbClient wraps the client returned by init_imdbpy_client and
+memoises ``search_movie`` and ``update`` in a small SQLite database, so every
+consumer (dry run, uploader, retries) shares the cached responses without
+knowing about them.
+
+Entries expire after a TTL and the least recently used ones are evicted
+beyond a maximum number of entries. Responses are stored as JSON: the
+IMDbPY objects they hold (movies, people, companies) are saved as their ID
+and data and rebuilt on read, so the cache never runs code from the file
+and survives upgrades of Cinemagoer.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .constants import SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL_DAYS
+
+logger = logging.getLogger(__name__)
+
+# ID attribute of each kind of IMDbPY object stored in the cache
+_ID_ATTRIBUTES = {"movie": "movieID", "person": "personID", "company": "companyID"}
+
+
+def _imdb_classes() -> dict[str, Callable[..., Any]]:
+    """Return the IMDbPY classes used to rebuild cached objects, by kind."""
+    from imdb.Company import Company
+    from imdb.Movie import Movie
+    from imdb.Person import Person
+
+    return {"movie": Movie, "person": Person, "company": Company}
+
+
+def _encode(value: Any) -> Any:
+    """Convert a response to JSON-compatible values.
+
+    Raises:
+        TypeError: If the response holds a value that can't be stored.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    for kind, id_attribute in _ID_ATTRIBUTES.items():
+        data = getattr(value, "data", None)
+        if hasattr(value, id_attribute) and isinstance(data, dict):
+            access_system = getattr(value, "accessSystem", None)
+            return {
+                "__imdb__": kind,
+                "id": getattr(value, id_attribute),
+                "access": access_system if isinstance(access_system, str) else None,
+                "data": _encode_dict(data),
+            }
+    if isinstance(value, dict):
+        return _encode_dict(value)
+    raise TypeError(f"can't store {type(value).__name__}")
+
+
+def _encode_dict(value: dict[Any, Any]) -> dict[str, Any]:
+    if not all(isinstance(key, str) for key in value):
+        raise TypeError("dictionary keys must be strings")
+    return {key: _encode(item) for key, item in value.items()}
+
+
+def _decode(value: Any, classes: dict[str, Callable[..., Any]]) -> Any:
+    """Rebuild a response encoded by _encode."""
+    if isinstance(value, list):
+        return [_decode(item, classes) for item in value]
+    if isinstance(value, dict):
+        kind = value.get("__imdb__")
+        if kind is None:
+            return {key: _decode(item, classes) for key, item in value.items()}
+        return classes[kind](
+            **{_ID_ATTRIBUTES[kind]: value["id"]},
+            data=_decode(value["data"], classes),
+            accessSystem=value["access"],
+        )
+    return value
+
+
+class CachingIMDbClient:
+    """IMDbPY client wrapper caching search results and movie details.
+
+    Only ``search_movie`` and ``update`` are cached; every other attribute is
+    forwarded to the wrapped client. Failed requests are never cached. The
+    wrapper may be shared by several threads.
+
+    Args:
+        client: IMDbPY/Cinemagoer client instance.
+        path: Database file (created if missing).
+        ttl: Maximum age of an entry in seconds, or None to never expire.
+        max_entries: Maximum number of responses kept; the least recently
+            used ones are evicted beyond it.
+        refresh: Ignore existing entries (but still store new ones).
+        classes: Classes rebuilding cached movies, people and companies, by
+            kind; defaults to the IMDbPY ones.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str | Path,
+        ttl: float | None = SEARCH_CACHE_TTL_DAYS * 86400,
+        max_entries: int = SEARCH_CACHE_MAX_ENTRIES,
+        refresh: bool = False,
+        classes: dict[str, Callable[..., Any]] | None = None,
+    ):
+        self.client = client
+        self.classes = classes
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+        self._conn.commit()
+        self.prune()
+
+    def __enter__(self) -> CachingIMDbClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not defined here
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def search_movie(self, title: str, results: int | None = None, **kwargs: Any) -> Any:
+        """Search movies by title, answering repeated queries from the cache."""
+        args = (title,) if results is None else (title, results)
+        if kwargs:
+            return self.client.search_movie(*args, **kwargs)
+
+        key = f"search:{results}:{title}"
+        found, cached = self._get(key)
+        if found:
+            return cached
+        movies = self.client.search_movie(*args)
+        self._put(key, list(movies or []))
+        return movies
+
+    def update(self, movie: Any, info: Any = None, override: int = 0) -> None:
+        """Fetch the details of a movie in place, reusing cached details."""
+        movie_id = getattr(movie, "movieID", None)
+        data = getattr(movie, "data", None)
+        if movie_id is None or not isinstance(data, dict) or override:
+            self._update(movie, info, override)
+            return
+
+        key = f"update:{movie_id}:{info!r}"
+        found, cached = self._get(key)
+        if found:
+            data.update(cached)
+            return
+        self._update(movie, info, override)
+        self._put(key, dict(movie.data))
+
+    def prune(self) -> int:
+        """Delete expired entries and evict the least recently used beyond max_entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            removed = 0
+            if self.ttl is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl,)
+                ).rowcount
+            removed += self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._conn.commit()
+            return removed
+
+    def close(self) -> None:
+        """Evict old entries and close the database."""
+        if self._conn is None:
+            return
+        self.prune()
+        with self._lock:
+            self._conn.close()
+            self._conn = None  # type: ignore[assignment]
+
+    def _update(self, movie: Any, info: Any, override: int) -> None:
+        if info is None and not override:
+            self.client.update(movie)
+        else:
+            self.client.update(movie, info, override)
+
+    def _get(self, key: str) -> tuple[bool, Any]:
+        """Return (found, value) and mark a fresh entry as recently used."""
+        with self._lock:
+            row = None
+            if not self.refresh:
+                row = self._conn.execute(
+                    "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+                self.misses += 1
+                return False, None
+            self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+        try:
+            if self.classes is None:
+                self.classes = _imdb_classes()
+            value = _decode(json.loads(row[0]), self.classes)
+        except Exception as e:
+            logger.debug(f"[imdb cache] discarding unreadable entry {key!r}: {e}")
+            with self._lock:
+                self.misses += 1
+            return False, None
+        with self._lock:
+            self.hits += 1
+        return True, value
+
+    def _put(self, key: str, value: Any) -> None:
+        try:
+            text = json.dumps(_encode(value), ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"[imdb cache] not caching {key!r}: {e}")
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, stored_at, used_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, text, now, now),
+            )
+            self._conn.commit()
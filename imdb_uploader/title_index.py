@@ -0,0 +1,454 @@
+"""Offline IMDb title index built from the public IMDb datasets.
+
+IMDb publishes its catalogue as gzipped TSV files
+(https://developer.imdb.com/non-commercial-datasets/). build_title_index
+ingests ``title.basics``, ``title.akas``, ``title.crew`` and ``name.basics``
+from a local directory into a SQLite database with an FTS5 table of
+normalised primary, original and alternative titles, plus the year, kind and
+directors of every title.
+
+TitleIndex answers ``search_movie`` like an IMDbPY client, with directors
+already included in each result, so find_imdb_match can score candidates
+without any network call and only falls back to IMDb for titles the index
+cannot resolve.
+
+Each name is also indexed with its release year, which gives a blocking
+layer: TitleIndex.candidates returns the titles released within a year of the
+local movie that share a word with its title, a short list for full scoring
+that doesn't grow with the size of the catalogue.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .constants import TITLE_INDEX_KINDS
+from .data_processing import normalize_text
+
+# Rows inserted per executemany batch while building
+_BATCH_SIZE = 10000
+# Rows read between two progress messages
+_PROGRESS_EVERY = 1000000
+# FTS rows examined per search before grouping them by title
+_SEARCH_CANDIDATES = 200
+
+# Bump when the schema changes, so older index files are rebuilt
+TITLE_INDEX_VERSION = 2
+# Candidates of a blocking lookup are released within this many years
+BLOCK_YEAR_WINDOW = 1
+
+DATASET_FILES = {
+    "basics": "title.basics.tsv.gz",
+    "akas": "title.akas.tsv.gz",
+    "crew": "title.crew.tsv.gz",
+    "names": "name.basics.tsv.gz",
+}
+
+
+def _all_words(words: list[str]) -> str:
+    """Return an FTS query matching names that contain every word."""
+    return "name : (" + " ".join(f'"{word}"' for word in words) + ")"
+
+
+class TitleIndexError(Exception):
+    """Raised when the title index cannot be built or opened."""
+
+
+class IndexedTitle(dict):
+    """Search result of a TitleIndex, shaped like an IMDbPY Movie."""
+
+    def __init__(self, movie_id: str, **fields: Any):
+        super().__init__(**fields)
+        self.movieID = movie_id
+
+    @property
+    def data(self) -> dict[str, Any]:
+        return self
+
+
+def _read_tsv(path: Path) -> Iterator[list[str]]:
+    """Yield the rows of a gzipped IMDb TSV file, without its header."""
+    csv.field_size_limit(2**31 - 1)
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh, delimiter="\t", quoting=csv.QUOTE_NONE)
+        next(reader, None)
+        yield from reader
+
+
+def _numeric_id(imdb_id: str) -> int:
+    """Return the number of an IMDb identifier such as tt0133093 or nm0905154."""
+    return int(imdb_id[2:])
+
+
+def _batched(rows: Iterator[tuple[Any, ...]]) -> Iterator[list[tuple[Any, ...]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= _BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_title_index(
+    dataset_dir: str | Path,
+    index_path: str | Path,
+    progress: Callable[[str], None] = print,
+) -> int:
+    """Build a title index from the IMDb dataset files in `dataset_dir`.
+
+    The index is written to a temporary file and moved into place when
+    complete, so an interrupted build leaves any previous index untouched.
+    Episodes and video games are left out.
+
+    Args:
+        dataset_dir: Directory holding the files listed in DATASET_FILES.
+            ``title.akas`` is optional.
+        index_path: Database file to create or replace.
+        progress: Callable receiving progress messages.
+
+    Returns:
+        Number of titles indexed.
+
+    Raises:
+        TitleIndexError: If a required dataset file is missing.
+    """
+    dataset_dir = Path(dataset_dir)
+    files = {name: dataset_dir / filename for name, filename in DATASET_FILES.items()}
+    missing = [str(path) for name, path in files.items() if name != "akas" and not path.exists()]
+    if missing:
+        raise TitleIndexError(f"Missing IMDb dataset files: {', '.join(missing)}")
+
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.executescript(
+            """
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            CREATE TABLE titles (
+                id INTEGER PRIMARY KEY, title TEXT NOT NULL, original_title TEXT,
+                year INTEGER, kind TEXT NOT NULL);
+            CREATE TABLE names (
+                title_id INTEGER NOT NULL, name TEXT NOT NULL, display TEXT NOT NULL,
+                UNIQUE (title_id, name));
+            CREATE TABLE directors (title_id INTEGER NOT NULL, person_id INTEGER NOT NULL);
+            CREATE TABLE people (id INTEGER PRIMARY KEY, name TEXT NOT NULL);
+            """
+        )
+
+        count = _load_basics(conn, files["basics"], progress)
+        if files["akas"].exists():
+            _load_akas(conn, files["akas"], progress)
+        _load_directors(conn, files["crew"], files["names"], progress)
+
+        progress("Building the full-text index...")
+        conn.executescript(
+            """
+            CREATE VIRTUAL TABLE title_names USING fts5(
+                name, era, display UNINDEXED, title_id UNINDEXED);
+            INSERT INTO title_names (name, era, display, title_id)
+                SELECT n.name, COALESCE('y' || t.year, ''), n.display, n.title_id
+                FROM names n JOIN titles t ON t.id = n.title_id;
+            DROP TABLE names;
+            CREATE INDEX directors_title ON directors (title_id);
+            """
+        )
+        conn.execute(f"PRAGMA user_version = {TITLE_INDEX_VERSION}")
+        conn.commit()
+        conn.execute("VACUUM")
+    except BaseException:
+        conn.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    conn.close()
+
+    os.replace(tmp_path, index_path)
+    progress(f"Indexed {count} titles in {index_path}")
+    return count
+
+
+def _load_basics(conn: sqlite3.Connection, path: Path, progress: Callable[[str], None]) -> int:
+    """Load titles and their primary and original names from title.basics."""
+    progress(f"Reading {path.name}...")
+    count = 0
+
+    def rows() -> Iterator[tuple[Any, ...]]:
+        nonlocal count
+        for n, row in enumerate(_read_tsv(path), start=1):
+            if n % _PROGRESS_EVERY == 0:
+                progress(f"  {n} rows read, {count} titles kept")
+            if len(row) < 6 or row[1] not in TITLE_INDEX_KINDS:
+                continue
+            count += 1
+            year = int(row[5]) if row[5].isdigit() else None
+            yield _numeric_id(row[0]), row[2], row[3], year, TITLE_INDEX_KINDS[row[1]]
+
+    for batch in _batched(rows()):
+        conn.executemany("INSERT OR IGNORE INTO titles VALUES (?, ?, ?, ?, ?)", batch)
+        names = []
+        for title_id, title, original_title, _, _ in batch:
+            names.append((title_id, normalize_text(title), title))
+            if original_title and original_title != title:
+                names.append((title_id, normalize_text(original_title), original_title))
+        conn.executemany("INSERT OR IGNORE INTO names VALUES (?, ?, ?)", names)
+    return count
+
+
+def _load_akas(conn: sqlite3.Connection, path: Path, progress: Callable[[str], None]) -> None:
+    """Load the alternative titles of indexed titles from title.akas."""
+    progress(f"Reading {path.name}...")
+    kept = {row[0] for row in conn.execute("SELECT id FROM titles")}
+
+    def rows() -> Iterator[tuple[Any, ...]]:
+        for n, row in enumerate(_read_tsv(path), start=1):
+            if n % _PROGRESS_EVERY == 0:
+                progress(f"  {n} rows read")
+            if len(row) < 3:
+                continue
+            title_id = _numeric_id(row[0])
+            if title_id in kept:
+                name = normalize_text(row[2])
+                if name:
+                    yield title_id, name, row[2]
+
+    for batch in _batched(rows()):
+        conn.executemany("INSERT OR IGNORE INTO names VALUES (?, ?, ?)", batch)
+
+
+def _load_directors(
+    conn: sqlite3.Connection, crew_path: Path, names_path: Path, progress: Callable[[str], None]
+) -> None:
+    """Load the directors of indexed titles from title.crew and name.basics."""
+    progress(f"Reading {crew_path.name}...")
+    kept = {row[0] for row in conn.execute("SELECT id FROM titles")}
+    people: set[int] = set()
+
+    def crew_rows() -> Iterator[tuple[Any, ...]]:
+        for row in _read_tsv(crew_path):
+            if len(row) < 2 or row[1] == "\\N":
+                continue
+            title_id = _numeric_id(row[0])
+            if title_id not in kept:
+                continue
+            for person in row[1].split(","):
+                person_id = _numeric_id(person)
+                people.add(person_id)
+                yield title_id, person_id
+
+    for batch in _batched(crew_rows()):
+        conn.executemany("INSERT INTO directors VALUES (?, ?)", batch)
+
+    progress(f"Reading {names_path.name}...")
+
+    def name_rows() -> Iterator[tuple[Any, ...]]:
+        for row in _read_tsv(names_path):
+            if len(row) >= 2 and _numeric_id(row[0]) in people:
+                yield _numeric_id(row[0]), row[1]
+
+    for batch in _batched(name_rows()):
+        conn.executemany("INSERT OR IGNORE INTO people VALUES (?, ?)", batch)
+
+
+class TitleIndex:
+    """Read-only access to an index built by build_title_index.
+
+    Implements the ``search_movie`` and ``update`` methods find_imdb_match
+    uses, so it can be passed wherever an IMDbPY client is expected. The
+    index may be shared by several threads.
+
+    Args:
+        path: Index database file.
+
+    Raises:
+        TitleIndexError: If the file does not exist or is not a title index.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise TitleIndexError(f"Title index not found: {self.path}")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        try:
+            self._conn.execute("SELECT 1 FROM title_names LIMIT 1")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.Error as e:
+            self._conn.close()
+            raise TitleIndexError(f"Not a title index: {self.path} ({e})") from e
+        if version != TITLE_INDEX_VERSION:
+            self._conn.close()
+            raise TitleIndexError(
+                f"Title index {self.path} was built by another version; "
+                "rebuild it with --build-title-index"
+            )
+
+    def __enter__(self) -> TitleIndex:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+
+    def search_movie(self, title: str, results: int = 20) -> list[IndexedTitle]:
+        """Search titles whose primary, original or alternative title has every word of `title`.
+
+        A trailing year that no title contains is used to rank titles of that
+        year first, as IMDb does for queries such as "The Matrix 1999". If
+        still nothing matches, the titles of that year (see candidates) are
+        returned, so misspelt or partly translated titles get a short list of
+        candidates too.
+
+        Args:
+            title: Search query.
+            results: Maximum number of results.
+
+        Returns:
+            List of IndexedTitle with title (the name that matched), year,
+            kind and directors, best matches first.
+        """
+        words = normalize_text(title).split()
+        if not words:
+            return []
+        found = self._search(_all_words(words), " ".join(words), None, results)
+        if not found and len(words) > 1 and len(words[-1]) == 4 and words[-1].isdigit():
+            year = int(words[-1])
+            words = words[:-1]
+            found = self._search(_all_words(words), " ".join(words), year, results)
+            if not found:
+                found = self._block(words, year, results)
+        return found
+
+    def candidates(self, title: str, year: int, limit: int = 20) -> list[IndexedTitle]:
+        """Return a short list of titles for full scoring (blocking).
+
+        Only titles released within one year of `year` with at least one word
+        in common with `title` are considered, ranked by how many and how
+        rare the shared words are. The word and year lists of the full-text
+        index make this independent of the size of the catalogue.
+
+        Args:
+            title: Title of the local movie.
+            year: Release year of the local movie.
+            limit: Maximum number of titles.
+
+        Returns:
+            List of IndexedTitle, best candidates first.
+        """
+        return self._block(normalize_text(title).split(), year, limit)
+
+    def directors(self, movie_ids: Iterable[str]) -> dict[str, list[str]]:
+        """Return the directors of every indexed title among `movie_ids`.
+
+        Args:
+            movie_ids: IMDb movie IDs without the "tt" prefix, as in
+                ``Movie.movieID``.
+
+        Returns:
+            Dict of movie ID to director names, with an empty list for
+            indexed titles without directors. IDs that are not indexed are
+            left out.
+        """
+        ids = {int(movie_id): str(movie_id) for movie_id in movie_ids if str(movie_id).isdigit()}
+        if not ids:
+            return {}
+        found: dict[str, list[str]] = {}
+        placeholders = ",".join("?" * len(ids))
+        with self._lock:
+            for (title_id,) in self._conn.execute(
+                f"SELECT id FROM titles WHERE id IN ({placeholders})", list(ids)
+            ):
+                found[ids[title_id]] = []
+            for title_id, names in self._directors_of(list(ids)).items():
+                found[ids[title_id]] = names
+        return found
+
+    def update(self, movie: Any, *args: Any, **kwargs: Any) -> None:
+        """No-op: search results already include every indexed field."""
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.close()
+            self._conn = None  # type: ignore[assignment]
+
+    def _block(self, words: list[str], year: int, limit: int) -> list[IndexedTitle]:
+        if not words:
+            return []
+        any_word = " OR ".join(f'"{word}"' for word in dict.fromkeys(words))
+        years = " OR ".join(
+            f'"y{y}"' for y in range(year - BLOCK_YEAR_WINDOW, year + BLOCK_YEAR_WINDOW + 1)
+        )
+        return self._search(
+            f"name : ({any_word}) AND era : ({years})", " ".join(words), year, limit
+        )
+
+    def _directors_of(self, title_ids: list[int]) -> dict[int, list[str]]:
+        """Return the director names of each title; the caller holds the lock."""
+        directors: dict[int, list[str]] = {}
+        placeholders = ",".join("?" * len(title_ids))
+        for title_id, person in self._conn.execute(
+            "SELECT d.title_id, p.name FROM directors d JOIN people p ON p.id = d.person_id "
+            f"WHERE d.title_id IN ({placeholders})",
+            title_ids,
+        ):
+            directors.setdefault(title_id, []).append(person)
+        return directors
+
+    def _search(self, query: str, name: str, year: int | None, limit: int) -> list[IndexedTitle]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT title_id, display FROM title_names WHERE title_names MATCH ? "
+                "ORDER BY name = ? DESC, rank LIMIT ?",
+                (query, name, _SEARCH_CANDIDATES),
+            ).fetchall()
+
+            matched: dict[int, str] = {}
+            for title_id, display in rows:
+                matched.setdefault(title_id, display)
+            if not matched:
+                return []
+
+            placeholders = ",".join("?" * len(matched))
+            details = {
+                row[0]: row[1:]
+                for row in self._conn.execute(
+                    f"SELECT id, year, kind FROM titles WHERE id IN ({placeholders})",
+                    list(matched),
+                )
+            }
+            directors = self._directors_of(list(matched))
+
+        titles = []
+        for title_id, display in matched.items():
+            title_year, kind = details.get(title_id, (None, "movie"))
+            titles.append(
+                IndexedTitle(
+                    f"{title_id:07d}",
+                    title=display,
+                    year=title_year,
+                    kind=kind,
+                    directors=directors.get(title_id, []),
+                )
+            )
+        if year is not None:
+            # Stable sort keeps the text ranking within each group
+            titles.sort(key=lambda t: t.get("year") != year)
+        return titles[:limit]
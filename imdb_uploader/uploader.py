@@ -26,8 +26,11 @@ import argparse
 import json
 import logging
 import os
+import sqlite3
 import sys
 import time
+from collections.abc import Iterable
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any
 
 
@@ -51,23 +54,37 @@ from .config import (
 )
 from .constants import (
     CAPTCHA_WAIT,
+    DEFAULT_BROWSERS,
     DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_PREFETCH,
     ELEMENT_INTERACTION_WAIT,
+    IMDB_MAX_RPS,
     LOGIN_WAIT,
     MANUAL_INTERACTION_WAIT,
+    MATCH_CACHE_FILE,
     PAGE_LOAD_WAIT,
+    SEARCH_CACHE_FILE,
     SKIP_ALREADY_RATED,
     SKIP_AMBIGUOUS,
     SKIP_AUTO_RATE_FAILED,
     SKIP_NOT_FOUND,
     SKIP_SAME_RATING,
     SKIP_USER_CHOICE,
+    TITLE_INDEX_FILE,
     IMDbMatch,
     MovieItem,
     SkippedEntry,
     Stats,
 )
 from .csv_validator import validate_csv_format
+from .match_cache import MatchCache
+from . import scoring
+from .search_cache import CachingIMDbClient
+from .directors import DirectorResolver
+from .query_planner import QueryPlanner
+from .title_index import TitleIndex, TitleIndexError, build_title_index
+from .workers import MatchPrefetcher, PerThreadIMDbClient, RateLimiter
+from .browser_pool import BrowserPool, ProgressTracker
 from .prompts import (
     beep,
     prompt_confirm_match,
@@ -80,8 +97,11 @@ from .data_processing import (
     read_csv,
 )
 from .browser_automation import (
+    export_login_cookies,
     get_existing_rating,
     imdb_search_and_open,
+    import_login_cookies,
+    start_driver,
     try_rate_on_page,
 )
 from .reporting import (
@@ -187,6 +207,33 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--dry-run-output", default="imdb_matches.csv", help="Output path for dry-run CSV mapping"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of movies matched concurrently in --dry-run (default: 1)",
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=IMDB_MAX_RPS,
+        help=f"IMDb requests per second shared by the --jobs workers (default: {IMDB_MAX_RPS})",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=DEFAULT_PREFETCH,
+        help="Number of upcoming movies matched on IMDb in the background while rating "
+        f"(0 = match each movie when it is reached; default: {DEFAULT_PREFETCH})",
+    )
+    parser.add_argument(
+        "--browsers",
+        type=int,
+        default=DEFAULT_BROWSERS,
+        help="Number of logged-in browsers rating movies in parallel, sharing the first "
+        f"one's login (requires --unattended and --auto-rate; default: {DEFAULT_BROWSERS})",
+    )
     parser.add_argument(
         "--validate-only", action="store_true", help="Only validate CSV format and exit"
     )
@@ -236,6 +283,55 @@ def parse_arguments() -> argparse.Namespace:
         ],
         help="Re-run using previously skipped movies from --skipped-dir",
     )
+    parser.add_argument(
+        "--match-cache",
+        default=MATCH_CACHE_FILE,
+        help=f"File caching IMDb matches between runs (default: {MATCH_CACHE_FILE})",
+    )
+    parser.add_argument(
+        "--no-match-cache", action="store_true", help="Don't read or write the IMDb match cache"
+    )
+    parser.add_argument(
+        "--refresh-matches",
+        action="store_true",
+        help="Search IMDb again for every movie, replacing cached matches and searches",
+    )
+    parser.add_argument(
+        "--title-index",
+        default=TITLE_INDEX_FILE,
+        help="Offline IMDb title index searched before IMDb, used if the file exists "
+        f"(default: {TITLE_INDEX_FILE})",
+    )
+    parser.add_argument(
+        "--no-title-index", action="store_true", help="Don't use the offline IMDb title index"
+    )
+    parser.add_argument(
+        "--build-title-index",
+        metavar="DATASET_DIR",
+        help="Build the --title-index file from the IMDb datasets (title.basics.tsv.gz, "
+        "title.akas.tsv.gz, title.crew.tsv.gz, name.basics.tsv.gz) in DATASET_DIR, then exit",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Match movies against the title index only, without querying IMDb",
+    )
+    parser.add_argument(
+        "--scoring",
+        choices=scoring.BACKENDS,
+        help="Title similarity used to score IMDb candidates (default: rapidfuzz if installed, "
+        "otherwise difflib)",
+    )
+    parser.add_argument(
+        "--search-cache",
+        default=SEARCH_CACHE_FILE,
+        help=f"File caching raw IMDb searches and movie details (default: {SEARCH_CACHE_FILE})",
+    )
+    parser.add_argument(
+        "--no-search-cache",
+        action="store_true",
+        help="Don't read or write the IMDb search cache",
+    )
     parser.add_argument(
         "--debug", action="store_true", help="Enable debug output for troubleshooting"
     )
@@ -281,7 +377,7 @@ def parse_arguments() -> argparse.Namespace:
         return args
 
     # Handle --validate-only (requires --csv, handled separately)
-    if args.validate_only:
+    if args.validate_only or args.build_title_index:
         return args
 
     # Validate: either --csv, --retry, or --resume must be provided
@@ -312,6 +408,14 @@ def apply_config_to_args(args: argparse.Namespace, config: dict[str, Any]) -> No
         "low_confidence_only": ("low_confidence_only", False),
         "skipped_dir": ("skipped_dir", "skipped"),
         "session_file": ("session_file", ".upload_imdb_session.json"),
+        "match_cache": ("match_cache", MATCH_CACHE_FILE),
+        "search_cache": ("search_cache", SEARCH_CACHE_FILE),
+        "title_index": ("title_index", TITLE_INDEX_FILE),
+        "scoring": ("scoring", None),
+        "jobs": ("jobs", 1),
+        "max_rps": ("max_rps", IMDB_MAX_RPS),
+        "prefetch": ("prefetch", DEFAULT_PREFETCH),
+        "browsers": ("browsers", DEFAULT_BROWSERS),
         "debug": ("debug", False),
         "verbose": ("verbose", False),
         "no_beep": ("no_beep", False),
@@ -325,12 +429,8 @@ def apply_config_to_args(args: argparse.Namespace, config: dict[str, Any]) -> No
                 setattr(args, arg_attr, config[config_key])
 
 
-def init_imdbpy_client() -> Any:
-    """Initialize IMDbPY client for movie matching.
-
-    Returns:
-        IMDbPY client instance, or None if not available.
-    """
+def _create_imdbpy_client() -> Any:
+    """Create a bare IMDbPY client, or return None if not available."""
     if IMDbPYClient is None:
         return None
     try:
@@ -342,6 +442,107 @@ def init_imdbpy_client() -> Any:
             return None
 
 
+def init_imdbpy_client(
+    cache_path: str | None = None,
+    refresh: bool = False,
+    jobs: int = 1,
+    max_rps: float = IMDB_MAX_RPS,
+) -> Any:
+    """Initialize IMDbPY client for movie matching.
+
+    Args:
+        cache_path: If given, wrap the client in a CachingIMDbClient storing
+            searches and movie details in this file.
+        refresh: Ignore cached responses (but still store new ones).
+        jobs: Number of threads that will use the client. Above 1, each
+            thread gets its own IMDbPY client and requests share a rate limit.
+        max_rps: Requests per second shared by all threads when jobs > 1.
+
+    Returns:
+        IMDbPY client instance, or None if not available.
+    """
+    client = _create_imdbpy_client()
+    if client is None:
+        return None
+    if jobs > 1:
+        client = PerThreadIMDbClient(_create_imdbpy_client, RateLimiter(max_rps), client=client)
+
+    if cache_path:
+        try:
+            return CachingIMDbClient(client, cache_path, refresh=refresh)
+        except sqlite3.Error as e:
+            print(f"Warning: IMDb search cache disabled ({e})")
+    return client
+
+
+def search_cache_path(args: argparse.Namespace) -> str | None:
+    """Return the IMDb search cache file selected by the command line arguments.
+
+    Returns:
+        Path of the cache, or None if disabled with --no-search-cache.
+    """
+    if getattr(args, "no_search_cache", False):
+        return None
+    return getattr(args, "search_cache", None) or SEARCH_CACHE_FILE
+
+
+def close_imdbpy_client(ia: Any) -> None:
+    """Report the IMDb search cache of a client, if any, and close it."""
+    if not isinstance(ia, CachingIMDbClient):
+        return
+    if ia.hits:
+        print(f"IMDb search cache: {ia.hits} requests reused, {ia.misses} sent to IMDb")
+    ia.close()
+
+
+def open_match_cache(args: argparse.Namespace) -> MatchCache | None:
+    """Open the IMDb match cache selected by the command line arguments.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        MatchCache instance, or None if disabled with --no-match-cache.
+    """
+    if getattr(args, "no_match_cache", False):
+        return None
+    path = getattr(args, "match_cache", None) or MATCH_CACHE_FILE
+    return MatchCache(path, refresh=getattr(args, "refresh_matches", False))
+
+
+def open_title_index(args: argparse.Namespace) -> TitleIndex | None:
+    """Open the offline title index selected by the command line arguments.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        TitleIndex instance, or None if disabled with --no-title-index, not
+        built yet, or unreadable.
+    """
+    if getattr(args, "no_title_index", False):
+        return None
+    path = getattr(args, "title_index", None) or TITLE_INDEX_FILE
+    if not os.path.exists(path):
+        if getattr(args, "offline", False):
+            print(f"Warning: title index {path} not found; build it with --build-title-index")
+        return None
+    try:
+        return TitleIndex(path)
+    except TitleIndexError as e:
+        print(f"Warning: {e}")
+        return None
+
+
+def report_match_cache(match_cache: MatchCache | None) -> None:
+    """Print how many IMDb lookups the match cache answered."""
+    if match_cache is not None and match_cache.hits:
+        print(
+            f"IMDb match cache: {match_cache.hits} movies reused, "
+            f"{match_cache.misses} searched on IMDb"
+        )
+
+
 def load_items(args: argparse.Namespace) -> list[MovieItem]:
     """Load items from CSV or retry directory.
 
@@ -426,6 +627,72 @@ def apply_slice(items: list[MovieItem], start: int, limit: int) -> list[MovieIte
     return items[start:]
 
 
+def open_browser_pool(
+    args: argparse.Namespace, config: dict[str, Any], driver: WebDriver
+) -> tuple[BrowserPool | None, list[WebDriver]]:
+    """Start the extra browsers of --browsers and pool them with the logged-in one.
+
+    The extra browsers are signed in with the cookies of `driver`. Browsers
+    that fail to start are left out.
+
+    Args:
+        args: Parsed command line arguments.
+        config: Configuration dictionary (timing settings).
+        driver: WebDriver instance the user is logged in with.
+
+    Returns:
+        The pool, or None to rate with `driver` alone, and the extra
+        browsers, which the caller must quit.
+    """
+    browsers = max(1, getattr(args, "browsers", DEFAULT_BROWSERS))
+    if browsers == 1:
+        return None, []
+    if not (args.unattended and args.auto_rate):
+        print("Warning: --browsers needs --unattended and --auto-rate. Rating with one browser.")
+        return None, []
+
+    page_load_wait = config.get("page_load_wait", PAGE_LOAD_WAIT)
+    element_wait = config.get("element_wait", ELEMENT_INTERACTION_WAIT)
+    rating_wait = config.get("rating_wait", MANUAL_INTERACTION_WAIT)
+
+    cookies = export_login_cookies(driver)
+    extra_drivers = []
+    for n in range(2, browsers + 1):
+        print(f"Starting browser {n}/{browsers}...")
+        try:
+            extra_driver = start_driver(headless=args.headless)
+        except Exception as e:
+            print(f"Warning: Could not start browser {n}: {e}")
+            break
+        extra_drivers.append(extra_driver)
+        import_login_cookies(extra_driver, cookies, page_load_wait)
+    if not extra_drivers:
+        return None, []
+    print(f"Rating with {len(extra_drivers) + 1} browsers.")
+
+    def rate(
+        browser: WebDriver,
+        item: MovieItem,
+        imdb_id: str | None,
+        item_stats: Stats,
+        item_skipped: list[SkippedEntry],
+    ) -> str:
+        print(f"  Rating: {item['title']} ({item.get('year')}) [{imdb_id or 'search'}]")
+        return rate_item(
+            browser,
+            item,
+            imdb_id,
+            args,
+            item_stats,
+            item_skipped,
+            page_load_wait,
+            element_wait,
+            rating_wait,
+        )
+
+    return BrowserPool([driver, *extra_drivers], rate), extra_drivers
+
+
 # =============================================================================
 
 
@@ -439,6 +706,13 @@ def process_single_item(
     page_load_wait: float = PAGE_LOAD_WAIT,
     element_wait: float = ELEMENT_INTERACTION_WAIT,
     rating_wait: float = MANUAL_INTERACTION_WAIT,
+    match_cache: MatchCache | None = None,
+    match_future: Future[IMDbMatch | None] | None = None,
+    title_index: TitleIndex | None = None,
+    director_resolver: DirectorResolver | None = None,
+    query_planner: QueryPlanner | None = None,
+    browser_pool: BrowserPool | None = None,
+    index: int = 0,
 ) -> str:
     """Process a single movie item.
 
@@ -449,14 +723,25 @@ def process_single_item(
         args: Parsed command line arguments.
         stats: Statistics dictionary to update.
         skipped_items: List to append skipped items to.
+        match_cache: Optional cache of previous IMDb matches.
+        match_future: IMDb match already being resolved by a MatchPrefetcher,
+            used instead of calling find_imdb_match.
+        title_index: Optional offline title index searched before IMDb.
+        director_resolver: Optional resolver of candidate directors shared by
+            the whole run.
+        query_planner: Optional planner of IMDb search queries shared by the
+            whole run.
+        browser_pool: Optional pool of browsers the movie is rated on,
+            instead of `driver`.
+        index: Position of the item in the run, reported back by `browser_pool`.
 
     Returns:
-        'continue' to skip to next item, 'break' to stop processing, or 'ok' for success.
+        'continue' to skip to next item, 'break' to stop processing, 'queued'
+        if the movie was handed to `browser_pool`, or 'ok' for success.
     """
     title = item["title"]
     year = item.get("year")
     director = item.get("directors")
-    score = item.get("score")
     original_title = item.get("original_title")
 
     if original_title:
@@ -469,18 +754,28 @@ def process_single_item(
     imdb_title = None
     imdb_year = None
 
-    if ia is not None:
+    if match_future is not None:
+        imdb_match = match_future.result()
+    elif ia is not None or title_index is not None:
         imdb_match = find_imdb_match(
-            title, year, ia=ia, director=director, original_title=original_title
+            title,
+            year,
+            ia=ia,
+            director=director,
+            original_title=original_title,
+            cache=match_cache,
+            index=title_index,
+            director_resolver=director_resolver,
+            query_planner=query_planner,
+        )
+    if imdb_match:
+        confidence = imdb_match.get("score", 0.0)
+        imdb_id = f"tt{imdb_match['movieID']}" if imdb_match.get("movieID") else None
+        imdb_title = imdb_match.get("title")
+        imdb_year = imdb_match.get("year")
+        print(
+            f"  IMDb match: {imdb_title} ({imdb_year}) [{imdb_id}] - confidence: {confidence:.1%}"
         )
-        if imdb_match:
-            confidence = imdb_match.get("score", 0.0)
-            imdb_id = f"tt{imdb_match['movieID']}" if imdb_match.get("movieID") else None
-            imdb_title = imdb_match.get("title")
-            imdb_year = imdb_match.get("year")
-            print(
-                f"  IMDb match: {imdb_title} ({imdb_year}) [{imdb_id}] - confidence: {confidence:.1%}"
-            )
 
     # Check if exact match
     title_matches = imdb_title and title.lower().strip() == imdb_title.lower().strip()
@@ -520,6 +815,51 @@ def process_single_item(
             imdb_title = result.get("imdb_title")
             imdb_year = result.get("imdb_year")
 
+    if browser_pool is not None:
+        browser_pool.submit(index, item, imdb_id)
+        return "queued"
+
+    return rate_item(
+        driver,
+        item,
+        imdb_id,
+        args,
+        stats,
+        skipped_items,
+        page_load_wait,
+        element_wait,
+        rating_wait,
+    )
+
+
+def rate_item(
+    driver: WebDriver,
+    item: MovieItem,
+    imdb_id: str | None,
+    args: argparse.Namespace,
+    stats: Stats,
+    skipped_items: list[SkippedEntry],
+    page_load_wait: float = PAGE_LOAD_WAIT,
+    element_wait: float = ELEMENT_INTERACTION_WAIT,
+    rating_wait: float = MANUAL_INTERACTION_WAIT,
+) -> str:
+    """Open the IMDb page of a matched movie and rate it.
+
+    Args:
+        driver: WebDriver instance.
+        item: Movie item dictionary.
+        imdb_id: IMDb ID of the movie, or None to search IMDb for it.
+        args: Parsed command line arguments.
+        stats: Statistics dictionary to update.
+        skipped_items: List to append skipped items to.
+
+    Returns:
+        'continue' to skip to next item, 'break' to stop processing, or 'ok' for success.
+    """
+    title = item["title"]
+    year = item.get("year")
+    score = item.get("score")
+
     # Navigate to IMDb page
     if imdb_id:
         url = f"https://www.imdb.com/title/{imdb_id}/"
@@ -739,12 +1079,27 @@ def main():
     if args.no_beep:
         set_beep_enabled(False)
 
+    try:
+        scoring.set_backend(getattr(args, "scoring", None))
+    except ImportError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
     # Handle special commands
     if args.show_config:
         print("Current configuration:")
         print(json.dumps(config, indent=2))
         return
 
+    # Handle --build-title-index: ingest the IMDb datasets and exit
+    if args.build_title_index:
+        try:
+            build_title_index(args.build_title_index, args.title_index or TITLE_INDEX_FILE)
+        except (TitleIndexError, OSError, sqlite3.Error) as e:
+            print(f"Error building title index: {e}")
+            sys.exit(1)
+        return
+
     # Handle --validate-only: validate CSV and exit
     if args.validate_only:
         if not args.csv:
@@ -772,6 +1127,14 @@ def main():
             "unattended": args.unattended,
             "skipped_dir": args.skipped_dir,
             "session_file": args.session_file,
+            "match_cache": args.match_cache,
+            "search_cache": args.search_cache,
+            "title_index": args.title_index,
+            "scoring": args.scoring,
+            "jobs": args.jobs,
+            "max_rps": args.max_rps,
+            "prefetch": args.prefetch,
+            "browsers": args.browsers,
             "debug": args.debug,
             "verbose": args.verbose,
             "no_beep": args.no_beep,
@@ -831,20 +1194,58 @@ def main():
     items = apply_slice(items, start_index, args.limit)
 
     # Handle dry-run mode
+    title_index = open_title_index(args)
+    offline = getattr(args, "offline", False)
+
     if args.dry_run:
-        ia = init_imdbpy_client()
-        if ia is None:
-            print("IMDbPY not available. Install with: pip install imdbpy")
-        run_dry_run(items, ia, args.dry_run_output)
+        jobs = max(1, getattr(args, "jobs", 1))
+        ia = None
+        if not offline:
+            ia = init_imdbpy_client(
+                search_cache_path(args),
+                refresh=getattr(args, "refresh_matches", False),
+                jobs=jobs,
+                max_rps=getattr(args, "max_rps", IMDB_MAX_RPS),
+            )
+            if ia is None:
+                print("IMDbPY not available. Install with: pip install imdbpy")
+        match_cache = open_match_cache(args)
+        try:
+            run_dry_run(
+                items,
+                ia,
+                args.dry_run_output,
+                match_cache=match_cache,
+                jobs=jobs,
+                title_index=title_index,
+            )
+        finally:
+            if match_cache is not None:
+                report_match_cache(match_cache)
+                match_cache.close()
+            close_imdbpy_client(ia)
+            if title_index is not None:
+                title_index.close()
         return
 
-    # Initialize IMDbPY client
-    ia = init_imdbpy_client()
-    if ia is None:
+    # Initialize IMDbPY client (thread-safe when matches are prefetched)
+    prefetch = max(0, getattr(args, "prefetch", 0))
+    ia = None
+    if not offline:
+        ia = init_imdbpy_client(
+            search_cache_path(args),
+            refresh=getattr(args, "refresh_matches", False),
+            jobs=prefetch,
+            max_rps=getattr(args, "max_rps", IMDB_MAX_RPS),
+        )
+    if ia is None and title_index is None:
         print("Warning: IMDbPY not available. Confidence-based matching will be disabled.")
 
+    match_cache = open_match_cache(args)
+
     # Set up browser session
     driver = setup_browser_session(args, config)
+    browser_pool, extra_drivers = open_browser_pool(args, config, driver)
 
     # Process items - restore stats from session if resuming
     if args.resume and session.stats:
@@ -862,9 +1263,29 @@ def main():
 
     idx = start_index
     total_items = len(items) + start_index
+    # Items rated by the browser pool finish out of order
+    progress = ProgressTracker(start_index)
+
+    # Resolve the IMDb matches of the next items while the browser rates this one
+    prefetcher = None
+    director_resolver = DirectorResolver(ia, title_index)
+    query_planner = QueryPlanner(match_cache.query_stats() if match_cache is not None else None)
+    pairs: Iterable[tuple[MovieItem, Future[IMDbMatch | None] | None]]
+    if (ia is not None or title_index is not None) and prefetch > 0:
+        prefetcher = MatchPrefetcher(
+            ia,
+            match_cache,
+            lookahead=prefetch,
+            title_index=title_index,
+            director_resolver=director_resolver,
+            query_planner=query_planner,
+        )
+        pairs = prefetcher.iter_items(items)
+    else:
+        pairs = ((item, None) for item in items)
 
     try:
-        for idx, item in enumerate(items, start=start_index + 1):
+        for idx, (item, match_future) in enumerate(pairs, start=start_index + 1):
             title = item["title"]
             year = item.get("year")
             score = item.get("score")
@@ -883,28 +1304,74 @@ def main():
                 config.get("page_load_wait", PAGE_LOAD_WAIT),
                 config.get("element_wait", ELEMENT_INTERACTION_WAIT),
                 config.get("rating_wait", MANUAL_INTERACTION_WAIT),
+                match_cache=match_cache,
+                match_future=match_future,
+                title_index=title_index,
+                director_resolver=director_resolver,
+                query_planner=query_planner,
+                browser_pool=browser_pool,
+                index=idx,
             )
 
             # Update session after each item
-            session.mark_processed(title, idx)
+            finished = [] if result == "queued" else [(idx, title)]
+            if browser_pool is not None:
+                for rating in browser_pool.results():
+                    rating.apply(stats, skipped_items)
+                    finished.append((rating.index, rating.item["title"]))
+            for finished_idx, finished_title in finished:
+                session.mark_processed(finished_title, progress.finish(finished_idx))
             session.stats = stats
             session.skipped_items = skipped_items
             session.save()
 
             if result == "break":
                 break
+
+        # Wait for the movies still being rated
+        if browser_pool is not None:
+            for rating in browser_pool.results(wait=True):
+                rating.apply(stats, skipped_items)
+                session.mark_processed(rating.item["title"], progress.finish(rating.index))
+            session.stats = stats
+            session.skipped_items = skipped_items
+            session.save()
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user. Session saved.")
         session.stats = stats
         session.skipped_items = skipped_items
         session.save()
     finally:
+        if prefetcher is not None:
+            prefetcher.close()
+        if browser_pool is not None:
+            # Movies queued but not started are rated again on --resume
+            for rating in browser_pool.close():
+                rating.apply(stats, skipped_items)
+                session.mark_processed(rating.item["title"], progress.finish(rating.index))
+            session.stats = stats
+            session.skipped_items = skipped_items
+            session.save()
+
         # Print summary and write skipped files
+        idx = progress.index
         print_summary(stats, idx)
         write_skipped_files(skipped_items, args.skipped_dir)
 
+        if query_planner.lookups:
+            print(query_planner.summary())
+        if match_cache is not None:
+            match_cache.add_query_stats(query_planner.run_stats())
+            report_match_cache(match_cache)
+            match_cache.close()
+        close_imdbpy_client(ia)
+        if title_index is not None:
+            title_index.close()
+
         print("=" * 60)
         print("Closing browser.")
+        for extra_driver in extra_drivers:
+            extra_driver.quit()
         driver.quit()
 
         # Clear session if completed successfully without quit_early
@@ -0,0 +1,196 @@
+"""Concurrent IMDb lookups for the dry run and the uploader.
+
+IMDbPY/Cinemagoer clients keep per-instance HTTP state and are not meant to be
+shared between threads, so PerThreadIMDbClient gives every worker thread its
+own client. All of them draw from one RateLimiter so that ``--jobs N`` spreads
+the same request budget over N connections instead of multiplying it.
+
+MatchPrefetcher pipelines the uploader and the dry run: while the browser
+rates one movie (or a row is written), background workers already search
+IMDb for the next ones.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from .constants import IMDB_MAX_RPS, IMDbMatch, MovieItem
+from .data_processing import find_imdb_match
+from .directors import DirectorResolver
+from .query_planner import QueryPlanner
+
+if TYPE_CHECKING:
+    from .match_cache import MatchCache
+    from .title_index import TitleIndex
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing requests at least 1 / max_rps seconds apart.
+
+    Args:
+        max_rps: Maximum requests per second, or 0 for no limit.
+    """
+
+    def __init__(self, max_rps: float = IMDB_MAX_RPS):
+        self.interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may send its next request."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class PerThreadIMDbClient:
+    """IMDbPY client proxy creating one client per thread on first use.
+
+    ``search_movie`` and ``update`` wait for the shared rate limiter; every
+    other attribute is forwarded to the calling thread's client.
+
+    Args:
+        factory: Callable returning a new IMDbPY client.
+        limiter: Rate limiter shared by every thread, or None for no limit.
+        client: Optional existing client to use for the calling thread.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        limiter: RateLimiter | None = None,
+        client: Any = None,
+    ):
+        self.factory = factory
+        self.limiter = limiter
+        self._local = threading.local()
+        if client is not None:
+            self._local.client = client
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not defined here
+        if name in ("factory", "limiter", "_local"):
+            raise AttributeError(name)
+        return getattr(self._client(), name)
+
+    def search_movie(self, *args: Any, **kwargs: Any) -> Any:
+        """Search movies with the calling thread's client."""
+        client = self._client()
+        if self.limiter is not None:
+            self.limiter.wait()
+        return client.search_movie(*args, **kwargs)
+
+    def update(self, *args: Any, **kwargs: Any) -> Any:
+        """Fetch movie details with the calling thread's client."""
+        client = self._client()
+        if self.limiter is not None:
+            self.limiter.wait()
+        return client.update(*args, **kwargs)
+
+    def _client(self) -> Any:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self.factory()
+            if client is None:
+                raise RuntimeError("Could not create an IMDbPY client")
+            self._local.client = client
+        return client
+
+
+class MatchPrefetcher:
+    """Resolve the IMDb matches of upcoming items on background threads.
+
+    ``iter_items`` yields each item with a future of its find_imdb_match
+    result, in input order, while at most ``lookahead`` later items are being
+    resolved. The consumer stays on the calling thread, so prompts and
+    browser actions keep their order.
+
+    Args:
+        ia: Thread-safe IMDbPY client (see init_imdbpy_client ``jobs``).
+        match_cache: Optional cache of previous IMDb matches.
+        title_index: Optional offline title index searched before IMDb.
+        director_resolver: Resolver shared by every lookup; one is created
+            if not given.
+        query_planner: Planner shared by every lookup; one is created if not
+            given.
+        lookahead: Number of items resolved ahead of the current one.
+        workers: Number of worker threads; defaults to `lookahead`.
+    """
+
+    def __init__(
+        self,
+        ia: Any,
+        match_cache: MatchCache | None = None,
+        lookahead: int = 2,
+        title_index: TitleIndex | None = None,
+        director_resolver: DirectorResolver | None = None,
+        query_planner: QueryPlanner | None = None,
+        workers: int | None = None,
+    ):
+        self.ia = ia
+        self.match_cache = match_cache
+        self.title_index = title_index
+        self.director_resolver = director_resolver or DirectorResolver(ia, title_index)
+        self.query_planner = query_planner or QueryPlanner()
+        self.lookahead = max(1, lookahead)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, workers or self.lookahead), thread_name_prefix="imdb-prefetch"
+        )
+        self._pending: deque[tuple[MovieItem, Future[IMDbMatch | None]]] = deque()
+
+    def __enter__(self) -> MatchPrefetcher:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def iter_items(
+        self, items: Iterable[MovieItem]
+    ) -> Iterator[tuple[MovieItem, Future[IMDbMatch | None]]]:
+        """Yield (item, future match) pairs in input order."""
+        queued = iter(items)
+        for item in islice(queued, self.lookahead + 1):
+            self._pending.append((item, self._submit(item)))
+        while self._pending:
+            current = self._pending.popleft()
+            for item in islice(queued, 1):
+                self._pending.append((item, self._submit(item)))
+            yield current
+
+    def close(self) -> None:
+        """Cancel the lookups that have not started and wait for the running ones.
+
+        Waiting lets the caller close the caches and the client afterwards.
+        """
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+    def match(self, item: MovieItem) -> IMDbMatch | None:
+        """Resolve the IMDb match of an item on the calling thread."""
+        return find_imdb_match(
+            item["title"],
+            item.get("year"),
+            ia=self.ia,
+            director=item.get("directors"),
+            original_title=item.get("original_title"),
+            cache=self.match_cache,
+            index=self.title_index,
+            director_resolver=self.director_resolver,
+            query_planner=self.query_planner,
+        )
+
+    def _submit(self, item: MovieItem) -> Future[IMDbMatch | None]:
+        return self._executor.submit(self.match, item)
@@ -2,12 +2,15 @@
 Pytest configuration and global fixtures for FilmAffinity backup tests.
 
 This file is automatically loaded by pytest and provides global setup
-for all test modules, including mocking of external dependencies.
+for all test modules, including mocking of external dependencies, plus
+stand-ins for IMDbPY movies, people and clients shared by the IMDb tests.
 """
 
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 
 def _setup_selenium_mocking():
     """Set up comprehensive selenium mocking for all tests."""
@@ -64,3 +67,51 @@ def _setup_selenium_mocking():
 # Always mock selenium to prevent import errors during test collection
 # Integration tests don't actually use selenium, so this is safe
 _setup_selenium_mocking()
+
+
+class FakeMovie(dict):
+    """Stand-in for an IMDbPY Movie, built like one."""
+
+    def __init__(self, movieID=None, data=None, accessSystem=None, **fields):  # noqa: N803
+        super().__init__(data or {}, **fields)
+        self.movieID = movieID
+        self.accessSystem = accessSystem
+
+    @property
+    def data(self):
+        return self
+
+
+class FakePerson(dict):
+    """Stand-in for an IMDbPY Person, built like one."""
+
+    def __init__(self, personID=None, data=None, accessSystem=None):  # noqa: N803
+        super().__init__(data or {})
+        self.personID = personID
+        self.accessSystem = accessSystem
+
+    @property
+    def data(self):
+        return self
+
+
+@pytest.fixture
+def make_client():
+    """Return a factory of mock IMDbPY clients.
+
+    The factory takes the results of every search and, optionally, the
+    directors ``update`` adds to each movie by movieID.
+    """
+
+    def make(results=(), credits=None):
+        client = MagicMock()
+        client.search_movie.return_value = list(results)
+        if credits is not None:
+
+            def update(movie, *args):
+                movie.data["directors"] = list(credits.get(movie.movieID, []))
+
+            client.update.side_effect = update
+        return client
+
+    return make
@@ -0,0 +1,285 @@
+"""
+Unit tests for filmaffinity/async_scraper.py
+
+Tests for the asyncio-based scraper engine, using an in-memory httpx transport.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+httpx = pytest.importorskip("httpx")
+
+from filmaffinity.async_scraper import AsyncScraper  # noqa: E402
+from filmaffinity.cache import DetailCache  # noqa: E402
+from filmaffinity.scraper import (  # noqa: E402
+    ConnectionFailedError,
+    RateLimitError,
+    TimeoutError,
+    UserNotFoundError,
+)
+
+LIST_PAGE = """
+<html><body>
+<span class="fs-5">List: Favourites</span>
+<ul class="fa-list-group">
+    <li data-movie-id="111">
+        <div class="fa-user-rat-box">9</div>
+        <div class="movie-card">
+            <div class="mc-title"><a href="/film111.html">El Padrino (The Godfather)</a></div>
+            <span class="mc-year">1972</span>
+        </div>
+    </li>
+    <li data-movie-id="222">
+        <div class="fa-user-rat-box">7</div>
+        <div class="movie-card">
+            <div class="mc-title"><a href="/film222.html">Amélie</a></div>
+            <span class="mc-year">2001</span>
+        </div>
+    </li>
+</ul>
+</body></html>
+"""
+
+DETAIL_PAGES = {
+    "111": '<dl class="movie-info"><dt>Original title</dt><dd>The Godfather</dd></dl>',
+    "222": '<dl class="movie-info"><dt>Original title</dt><dd>Amélie</dd></dl>',
+}
+
+
+def make_scraper(handler, **kwargs):
+    kwargs.setdefault("max_rps", None)
+    return AsyncScraper(transport=httpx.MockTransport(handler), **kwargs)
+
+
+def list_handler(request):
+    url = str(request.url)
+    if "/film" in url:
+        movie_id = url.split("/film")[1].split(".html")[0]
+        return httpx.Response(200, text=DETAIL_PAGES[movie_id])
+    if "page=1&" in url:
+        return httpx.Response(200, text=LIST_PAGE)
+    return httpx.Response(200, text="<html><body></body></html>")
+
+
+class TestAsyncRequests:
+    """Tests for AsyncScraper.request_with_retry."""
+
+    def test_successful_request(self):
+        async def run():
+            async with make_scraper(lambda request: httpx.Response(200, text="ok")) as fa:
+                return await fa.request_with_retry("https://www.filmaffinity.com/en/")
+
+        assert asyncio.run(run()).status_code == 200
+
+    @patch("filmaffinity.async_scraper.asyncio.sleep", new_callable=AsyncMock)
+    @patch("filmaffinity.async_scraper.print")
+    def test_rate_limit_retry(self, mock_print, mock_sleep):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429)
+
+        async def run():
+            async with make_scraper(handler, max_retries=2) as fa:
+                await fa.request_with_retry("https://www.filmaffinity.com/en/")
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(run())
+        assert len(calls) == 2
+        mock_sleep.assert_awaited()
+
+    @patch("filmaffinity.async_scraper.asyncio.sleep", new_callable=AsyncMock)
+    def test_dropped_connection_is_retried(self, mock_sleep):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.RemoteProtocolError("Server disconnected", request=request)
+            return httpx.Response(200, text="ok")
+
+        async def run():
+            async with make_scraper(handler) as fa:
+                return await fa.request_with_retry("https://www.filmaffinity.com/en/")
+
+        assert asyncio.run(run()).status_code == 200
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize(
+        "error, expected, message",
+        [
+            (httpx.ConnectError("Connection refused"), ConnectionFailedError, "refused"),
+            (httpx.ReadTimeout("timed out"), TimeoutError, "timed out"),
+        ],
+    )
+    @patch("filmaffinity.async_scraper.asyncio.sleep", new_callable=AsyncMock)
+    def test_transport_errors_are_wrapped(self, mock_sleep, error, expected, message):
+        def handler(request):
+            raise error
+
+        async def run():
+            async with make_scraper(handler, max_retries=2) as fa:
+                await fa.request_with_retry("https://www.filmaffinity.com/en/")
+
+        with pytest.raises(expected, match=message) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.cause is error
+
+    def test_check_user_not_found(self):
+        async def run():
+            async with make_scraper(lambda request: httpx.Response(404)) as fa:
+                await fa.check_user("missing")
+
+        with pytest.raises(UserNotFoundError):
+            asyncio.run(run())
+
+
+class TestAsyncScraping:
+    """Tests for the async scraping methods."""
+
+    @patch("filmaffinity.async_scraper.print")
+    def test_get_list_movies(self, mock_print):
+        async def run():
+            async with make_scraper(list_handler) as fa:
+                return await fa.get_list_movies("https://fa/list?id=1")
+
+        title, info = asyncio.run(run())
+
+        assert title == "Favourites"
+        assert info["title"] == ["El Padrino", "Amélie"]
+        assert info["user score"] == ["9", "7"]
+        assert info["original title"] == ["", ""]
+
+    @patch("filmaffinity.async_scraper.print")
+    def test_get_list_movies_fetches_original_titles(self, mock_print):
+        async def run():
+            async with make_scraper(list_handler, concurrency=2) as fa:
+                return await fa.get_list_movies("https://fa/list?id=1", lang="es")
+
+        _, info = asyncio.run(run())
+
+        # Original title is only kept when it differs from the local title
+        assert info["original title"] == ["The Godfather", ""]
+
+    @patch("filmaffinity.async_scraper.print")
+    def test_original_titles_use_detail_cache(self, mock_print, tmp_path):
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return list_handler(request)
+
+        async def run():
+            async with make_scraper(handler) as fa:
+                return await fa.get_list_movies("https://fa/list?id=1", lang="es")
+
+        cache = DetailCache(tmp_path / "details.db")
+        cache.put("111", {"original title": "Il Padrino"})
+        with patch("filmaffinity.scraper.detail_cache", cache):
+            _, info = asyncio.run(run())
+            assert cache.get("222") == {"original title": "Amélie"}
+        cache.close()
+
+        assert info["original title"] == ["Il Padrino", ""]
+        assert [url for url in requested if "/film" in url] == [
+            "https://www.filmaffinity.com/es/film222.html"
+        ]
+
+    def test_original_titles_fetched_once_per_movie(self):
+        from filmaffinity.records import FilmRecord, FilmTable
+        from filmaffinity.scraper import LIST_COLUMNS
+
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return list_handler(request)
+
+        info = FilmTable(
+            LIST_COLUMNS,
+            [
+                FilmRecord(title="El Padrino", fa_movie_id="111"),
+                FilmRecord(title="Amélie", fa_movie_id="222"),
+                FilmRecord(title="El Padrino", fa_movie_id="111"),
+            ],
+        )
+
+        async def run():
+            async with make_scraper(handler) as fa:
+                await fa._fill_original_titles(info, 0)
+
+        asyncio.run(run())
+
+        assert sorted(requested) == [
+            "https://www.filmaffinity.com/es/film111.html",
+            "https://www.filmaffinity.com/es/film222.html",
+        ]
+        assert [r.original_title for r in info.records] == ["The Godfather", "", "The Godfather"]
+
+    @patch("filmaffinity.async_scraper.print")
+    def test_get_list_movies_checkpoint(self, mock_print, tmp_path):
+        from filmaffinity.checkpoint import PageJournal
+        from filmaffinity.records import FilmRecord
+
+        journal = PageJournal(tmp_path / "pages.jsonl")
+        journal.record("https://fa/list?id=1", 1, [FilmRecord(title="Restored")])
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return list_handler(request)
+
+        async def run():
+            async with make_scraper(handler) as fa:
+                return await fa.get_list_movies("https://fa/list?id=1", checkpoint=journal)
+
+        _, info = asyncio.run(run())
+
+        assert info["title"] == ["Restored"]
+        assert "page=2&" in requested[0]
+
+    @patch("filmaffinity.async_scraper.print")
+    def test_get_list_movies_uses_pager(self, mock_print):
+        pager = '<div class="pager"><a href="/en/mylist.php?list_id=1&page=3">3</a></div>'
+        requested = []
+
+        def handler(request):
+            url = str(request.url)
+            requested.append(url)
+            page = LIST_PAGE + pager if "page=1&" in url else LIST_PAGE
+            return httpx.Response(200, text=page)
+
+        async def run():
+            async with make_scraper(handler, concurrency=2) as fa:
+                return await fa.get_list_movies("https://fa/list?id=1")
+
+        _, info = asyncio.run(run())
+
+        assert sorted(url.split("page=")[1][0] for url in requested) == ["1", "2", "3"]
+        assert len(info["title"]) == 6
+
+    def test_get_user_lists(self):
+        page = (
+            '<div class="fa-list-group">'
+            '<li><a href="https://fa/list?id=1">Favourites</a></li>'
+            "</div>"
+        )
+
+        def handler(request):
+            if "&p=1" in str(request.url):
+                return httpx.Response(200, text=page)
+            return httpx.Response(200, text="<html></html>")
+
+        async def run():
+            async with make_scraper(handler) as fa:
+                return await fa.get_user_lists("123")
+
+        assert asyncio.run(run()) == {"Favourites": "https://fa/list?id=1"}
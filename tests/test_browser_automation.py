@@ -6,7 +6,7 @@ Tests for Selenium WebDriver operations, login, and rating functions.
 
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 # Import Keys from the mock
 
@@ -20,8 +20,10 @@ sys.modules["webdriver_manager.core.os_manager"] = MagicMock()
 # Import the module after mocking
 from imdb_uploader.browser_automation import (  # noqa: E402
     detect_captcha,
+    export_login_cookies,
     get_existing_rating,
     imdb_search_and_open,
+    import_login_cookies,
     start_driver,
     try_automated_login,
     try_rate_on_page,
@@ -69,6 +71,35 @@ class TestWaitForLoginManual:
         mock_input.assert_called_once()
 
 
+class TestLoginCookies:
+    """Tests for export_login_cookies and import_login_cookies."""
+
+    def test_export_keeps_imdb_cookies(self):
+        mock_driver = MagicMock()
+        mock_driver.get_cookies.return_value = [
+            {"name": "at-main", "value": "a", "domain": ".imdb.com"},
+            {"name": "session-id", "value": "b", "domain": "www.imdb.com"},
+            {"name": "ad", "value": "c", "domain": ".doubleclick.net"},
+        ]
+
+        cookies = export_login_cookies(mock_driver)
+
+        assert [c["name"] for c in cookies] == ["at-main", "session-id"]
+
+    @patch("imdb_uploader.browser_automation.time.sleep")
+    def test_import_opens_imdb_before_adding(self, mock_sleep):
+        mock_driver = MagicMock()
+        cookies = [{"name": "at-main", "value": "a"}, {"name": "bad", "value": "b"}]
+        mock_driver.add_cookie.side_effect = [None, Exception("invalid cookie domain")]
+
+        added = import_login_cookies(mock_driver, cookies, page_load_wait=0)
+
+        assert added == 1
+        assert mock_driver.method_calls[0] == call.get("https://www.imdb.com/")
+        assert mock_driver.add_cookie.call_count == 2
+        mock_driver.refresh.assert_called_once()
+
+
 class TestDetectCaptcha:
     """Tests for detect_captcha function."""
 
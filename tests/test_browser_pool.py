@@ -0,0 +1,158 @@
+"""
+Unit tests for imdb_uploader/browser_pool.py
+
+Tests for rating on several browsers and tracking out-of-order progress.
+"""
+
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader.browser_pool import (  # noqa: E402
+    BrowserPool,
+    ProgressTracker,
+    RatingResult,
+)
+from imdb_uploader.constants import SKIP_ALREADY_RATED, SKIP_AUTO_RATE_FAILED  # noqa: E402
+from imdb_uploader.reporting import create_stats  # noqa: E402
+
+
+def make_item(n):
+    return {"title": f"Movie {n}", "year": "2000", "score": 7}
+
+
+class TestRatingResult:
+    """Tests for RatingResult.apply."""
+
+    def test_adds_counts_and_skipped_items(self):
+        item = make_item(1)
+        result = RatingResult(1, item, "continue")
+        result.stats["skipped_already_rated"] += 1
+        result.skipped_items.append({"item": item, "reason": SKIP_ALREADY_RATED})
+
+        stats = create_stats()
+        stats["skipped_already_rated"] = 2
+        stats["applied"] = 5
+        skipped = [{"item": make_item(0), "reason": SKIP_ALREADY_RATED}]
+        result.apply(stats, skipped)
+
+        assert stats["skipped_already_rated"] == 3
+        assert stats["applied"] == 5
+        assert len(skipped) == 2
+
+    def test_flags_are_not_cleared(self):
+        result = RatingResult(1, make_item(1), "ok")
+        stats = create_stats()
+        stats["quit_early"] = True
+        result.apply(stats, [])
+        assert stats["quit_early"] is True
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    def test_rates_every_item_on_the_browsers(self):
+        drivers = [MagicMock(name=f"driver{n}") for n in range(3)]
+        used = set()
+        lock = threading.Lock()
+
+        def rate(driver, item, imdb_id, stats, skipped_items):
+            with lock:
+                used.add(driver)
+            stats["applied"] += 1
+            return "ok"
+
+        with BrowserPool(drivers, rate) as pool:
+            for n in range(1, 21):
+                pool.submit(n, make_item(n), f"tt{n:07d}")
+            results = pool.results(wait=True)
+
+        assert sorted(r.index for r in results) == list(range(1, 21))
+        assert all(r.outcome == "ok" and r.stats["applied"] == 1 for r in results)
+        assert used <= set(drivers)
+        assert pool.outstanding == 0
+
+    def test_rate_receives_imdb_id(self):
+        seen = []
+
+        def rate(driver, item, imdb_id, stats, skipped_items):
+            seen.append((item["title"], imdb_id))
+            return "ok"
+
+        with BrowserPool([MagicMock()], rate) as pool:
+            pool.submit(1, make_item(1), "tt0133093")
+            pool.submit(2, make_item(2), None)
+            pool.results(wait=True)
+
+        assert seen == [("Movie 1", "tt0133093"), ("Movie 2", None)]
+
+    def test_results_without_wait_does_not_block(self):
+        release = threading.Event()
+
+        def rate(driver, item, imdb_id, stats, skipped_items):
+            release.wait(5)
+            return "ok"
+
+        pool = BrowserPool([MagicMock()], rate)
+        pool.submit(1, make_item(1), "tt1")
+        assert pool.results() == []
+        assert pool.outstanding == 1
+        release.set()
+        assert [r.index for r in pool.results(wait=True)] == [1]
+        pool.close()
+
+    def test_failing_browser_skips_item_as_auto_rate_failed(self):
+        def rate(driver, item, imdb_id, stats, skipped_items):
+            raise RuntimeError("browser disconnected")
+
+        with BrowserPool([MagicMock()], rate) as pool:
+            pool.submit(1, make_item(1), "tt1")
+            (result,) = pool.results(wait=True)
+
+        assert result.outcome == "continue"
+        assert result.stats["skipped_auto_rate_failed"] == 1
+        assert result.skipped_items == [{"item": make_item(1), "reason": SKIP_AUTO_RATE_FAILED}]
+
+    def test_close_drops_queued_jobs_and_returns_running_ones(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def rate(driver, item, imdb_id, stats, skipped_items):
+            started.set()
+            release.wait(5)
+            return "ok"
+
+        pool = BrowserPool([MagicMock()], rate)
+        pool.submit(1, make_item(1), "tt1")
+        assert started.wait(5)
+        pool.submit(2, make_item(2), "tt2")  # waits in the queue
+        threading.Timer(0.05, release.set).start()
+        results = pool.close()
+
+        assert [r.index for r in results] == [1]
+        assert pool.outstanding == 0
+
+    def test_needs_a_browser(self):
+        with pytest.raises(ValueError):
+            BrowserPool([], MagicMock())
+
+
+class TestProgressTracker:
+    """Tests for ProgressTracker."""
+
+    def test_in_order(self):
+        progress = ProgressTracker()
+        assert [progress.finish(n) for n in (1, 2, 3)] == [1, 2, 3]
+
+    def test_out_of_order_waits_for_gaps(self):
+        progress = ProgressTracker(10)
+        assert progress.finish(12) == 10
+        assert progress.finish(13) == 10
+        assert progress.finish(11) == 13
+        assert progress.index == 13
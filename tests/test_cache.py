@@ -0,0 +1,206 @@
+"""
+Unit tests for filmaffinity/cache.py
+
+Tests for the on-disk movie detail cache and its use by the scraper.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity import scraper  # noqa: E402
+from filmaffinity.cache import DetailCache, ResponseCache, page_digest  # noqa: E402
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with DetailCache(tmp_path / "details.sqlite") as cache:
+        yield cache
+
+
+class TestDetailCache:
+    """Tests for the DetailCache class."""
+
+    def test_put_and_get(self, cache):
+        cache.put("123", {"original title": "The Godfather"})
+
+        assert cache.get("123") == {"original title": "The Godfather"}
+        assert cache.get("456") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "details.sqlite"
+        with DetailCache(path) as cache:
+            cache.put("123", {"original title": "Jaws"})
+
+        with DetailCache(path) as cache:
+            assert cache.get("123") == {"original title": "Jaws"}
+
+    def test_expired_entries_are_missing(self, tmp_path):
+        with DetailCache(tmp_path / "details.sqlite", ttl=60) as cache:
+            with patch("filmaffinity.cache.time.time", return_value=1000.0):
+                cache.put("123", {"original title": "Jaws"})
+            with patch("filmaffinity.cache.time.time", return_value=1030.0):
+                assert cache.get("123") is not None
+            with patch("filmaffinity.cache.time.time", return_value=1100.0):
+                assert cache.get("123") is None
+
+    def test_refresh_ignores_existing_entries(self, tmp_path):
+        path = tmp_path / "details.sqlite"
+        with DetailCache(path) as cache:
+            cache.put("123", {"original title": "Jaws"})
+
+        with DetailCache(path, refresh=True) as cache:
+            assert cache.get("123") is None
+            assert len(cache) == 1
+
+    def test_evicts_oldest_entries(self, tmp_path):
+        cache = DetailCache(tmp_path / "details.sqlite", ttl=None, max_entries=2)
+        for i, movie_id in enumerate(["1", "2", "3"]):
+            with patch("filmaffinity.cache.time.time", return_value=1000.0 + i):
+                cache.put(movie_id, {"original title": movie_id})
+
+        assert cache.prune() == 1
+        assert cache.get("1") is None
+        assert cache.get("3") is not None
+        cache.close()
+
+
+class TestScraperDetailCache:
+    """Tests for get_original_title with a detail cache configured."""
+
+    def teardown_method(self):
+        scraper.set_detail_cache(None)
+
+    @patch("filmaffinity.scraper.request_with_retry")
+    def test_fetched_title_is_cached(self, mock_request, cache):
+        mock_request.return_value = MagicMock(
+            status_code=200,
+            text="<dl class='movie-info'><dt>Título original</dt><dd>Jaws</dd></dl>",
+        )
+        scraper.set_detail_cache(cache)
+
+        assert scraper.get_original_title("123") == "Jaws"
+        assert scraper.get_original_title("123") == "Jaws"
+        assert mock_request.call_count == 1
+
+    @patch("filmaffinity.scraper.request_with_retry")
+    def test_failed_fetch_is_not_cached(self, mock_request, cache):
+        mock_request.return_value = MagicMock(status_code=500)
+        scraper.set_detail_cache(cache)
+
+        assert scraper.get_original_title("123") == ""
+        assert cache.get("123") is None
+
+    def test_no_cache_configured(self):
+        assert scraper.get_cached_original_title("123") is None
+
+
+WATCHED_PAGE = """
+<div class="user-ratings-list-resp">
+  <div class="row mb-4"><div class="fa-user-rat-box">8</div>
+    <div class="movie-card" data-movie-id="809297">
+      <div class="mc-title"><a href="/en/film809297.html">The Godfather</a></div>
+    </div></div>
+</div>
+"""
+
+
+class TestResponseCache:
+    """Tests for the ResponseCache class."""
+
+    def test_put_and_get(self, tmp_path):
+        with ResponseCache(tmp_path / "pages.sqlite") as cache:
+            digest = cache.put("http://fa/1", "<html>é</html>", etag='"abc"')
+
+            page = cache.get("http://fa/1")
+            assert page.body == "<html>é</html>"
+            assert page.digest == digest == page_digest("<html>é</html>")
+            assert page.validators() == {"If-None-Match": '"abc"'}
+            assert cache.get("http://fa/2") is None
+
+    def test_parsed_data_follows_body(self, tmp_path):
+        with ResponseCache(tmp_path / "pages.sqlite") as cache:
+            digest = cache.put("http://fa/1", "one")
+            cache.put_parsed("http://fa/1", digest, {"rows": [1]})
+
+            # Same body again: parsed data is kept
+            assert cache.put("http://fa/1", "one") == digest
+            assert cache.get_parsed("http://fa/1", digest) == {"rows": [1]}
+
+            new_digest = cache.put("http://fa/1", "two")
+            assert cache.get_parsed("http://fa/1", new_digest) is None
+            assert cache.unchanged == 1
+
+    def test_refresh_ignores_existing_entries(self, tmp_path):
+        path = tmp_path / "pages.sqlite"
+        with ResponseCache(path) as cache:
+            cache.put("http://fa/1", "one", last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+        with ResponseCache(path, refresh=True) as cache:
+            assert cache.get("http://fa/1") is None
+
+    def test_evicts_oldest_entries(self, tmp_path):
+        cache = ResponseCache(tmp_path / "pages.sqlite", max_entries=1)
+        for i, url in enumerate(["http://fa/1", "http://fa/2"]):
+            with patch("filmaffinity.cache.time.time", return_value=1000.0 + i):
+                cache.put(url, url)
+
+        assert cache.prune() == 1
+        assert cache.get("http://fa/1") is None
+        cache.close()
+
+
+class TestScraperResponseCache:
+    """Tests for request_with_retry and the pagination loops with a response cache."""
+
+    def teardown_method(self):
+        scraper.set_response_cache(None)
+
+    @patch("filmaffinity.scraper.session")
+    def test_not_modified_served_from_cache(self, mock_session, tmp_path):
+        cache = ResponseCache(tmp_path / "pages.sqlite")
+        scraper.set_response_cache(cache)
+        mock_session.get.side_effect = [
+            MagicMock(status_code=200, text="<html>page</html>", headers={"ETag": '"v1"'}),
+            MagicMock(status_code=304, text="", headers={}),
+        ]
+
+        first = scraper.request_with_retry("http://fa/list?page=1")
+        second = scraper.request_with_retry("http://fa/list?page=1")
+
+        assert mock_session.get.call_args_list[0].kwargs["headers"] is None
+        assert mock_session.get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert second.status_code == 200
+        assert second.text == "<html>page</html>"
+        assert second.digest == first.digest
+        assert cache.not_modified == 1
+        cache.close()
+
+    @patch("filmaffinity.scraper.time.sleep")
+    @patch("filmaffinity.scraper.print")
+    @patch("filmaffinity.scraper.session")
+    def test_identical_pages_are_not_parsed_again(
+        self, mock_session, mock_print, mock_sleep, tmp_path
+    ):
+        cache = ResponseCache(tmp_path / "pages.sqlite")
+        scraper.set_response_cache(cache)
+        # No validators: the server always answers with the full page
+        mock_session.get.side_effect = lambda url, **kwargs: MagicMock(
+            status_code=200 if "&p=1&" in url else 404, text=WATCHED_PAGE, headers={}
+        )
+
+        first = scraper.get_watched_movies("123", fetch_original_title=False)
+        with patch("filmaffinity.scraper.parsing.parse_page") as mock_parse:
+            second = scraper.get_watched_movies("123", fetch_original_title=False)
+
+        mock_parse.assert_not_called()
+        assert second.records == first.records
+        assert second["user score"] == ["8"]
+        assert cache.unchanged == 1
+        cache.close()
@@ -0,0 +1,74 @@
+"""
+Unit tests for filmaffinity/checkpoint.py
+
+Tests for the journal of completed scraper pages.
+"""
+
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity.checkpoint import PageJournal, watched_key  # noqa: E402
+from filmaffinity.records import FilmRecord  # noqa: E402
+from filmaffinity.scraper import LIST_COLUMNS  # noqa: E402
+
+URL = "https://www.filmaffinity.com/en/userlist.php?user_id=1&list_id=2"
+
+
+def movies(*movie_ids):
+    return [FilmRecord(title=f"Movie {i}", fa_movie_id=i, user_score="7") for i in movie_ids]
+
+
+class TestPageJournal:
+    """Tests for the PageJournal class."""
+
+    def test_restore_from_new_journal(self, tmp_path):
+        page, info = PageJournal(tmp_path / "pages.jsonl").restore(URL, LIST_COLUMNS)
+
+        assert page == 1
+        assert info.records == []
+
+    def test_restores_completed_pages(self, tmp_path):
+        path = tmp_path / "pages.jsonl"
+        journal = PageJournal(path)
+        journal.record(URL, 1, movies("1", "2"))
+        journal.record(URL, 2, movies("3"))
+        journal.record(watched_key("1", "en"), 1, movies("9"))
+
+        page, info = PageJournal(path).restore(URL, LIST_COLUMNS)
+
+        assert page == 3
+        assert info["FA movie ID"] == ["1", "2", "3"]
+        assert info.records[0] == movies("1")[0]
+
+    def test_stops_at_missing_page(self, tmp_path):
+        path = tmp_path / "pages.jsonl"
+        journal = PageJournal(path)
+        journal.record(URL, 1, movies("1"))
+        journal.record(URL, 3, movies("3"))
+
+        page, info = PageJournal(path).restore(URL, LIST_COLUMNS)
+
+        assert page == 2
+        assert info["FA movie ID"] == ["1"]
+
+    def test_ignores_truncated_line(self, tmp_path):
+        path = tmp_path / "pages.jsonl"
+        PageJournal(path).record(URL, 1, movies("1"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"key": "' + URL + '", "page": 2, "ro')
+
+        page, _ = PageJournal(path).restore(URL, LIST_COLUMNS)
+
+        assert page == 2
+
+    def test_clear(self, tmp_path):
+        journal = PageJournal(tmp_path / "pages.jsonl")
+        journal.record(URL, 1, movies("1"))
+
+        journal.clear()
+
+        assert not journal.path.exists()
+        assert journal.restore(URL, LIST_COLUMNS)[0] == 1
@@ -265,3 +265,406 @@ class TestBackupQuietMode:
             assert result.exit_code == 0
             # Normal mode should show output
             assert "Parsing" in result.stdout or "Saving" in result.stdout
+
+
+class TestConcurrentLists:
+    """Test concurrent list scraping with --workers."""
+
+    @patch("filmaffinity.cli.scraper")
+    def test_scrape_lists_preserves_order(self, mock_scraper):
+        import time
+
+        from filmaffinity.cli import scrape_lists
+
+        def fake_get_list_movies(url, lang="en", fetch_original_title=True):
+            # Make earlier lists finish last
+            time.sleep(0.05 if url.endswith("1") else 0)
+            return "", {"title": [url]}
+
+        mock_scraper.get_list_movies.side_effect = fake_get_list_movies
+
+        lists = {
+            "First": "http://fa/list1",
+            "Second": "http://fa/list2",
+            "Third": "http://fa/list3",
+        }
+        result = scrape_lists(lists, workers=3)
+
+        assert list(result) == ["First", "Second", "Third"]
+        assert result["First"] == {"title": ["http://fa/list1"]}
+
+    @patch("filmaffinity.cli.scraper")
+    def test_scrape_lists_propagates_errors(self, mock_scraper):
+        from filmaffinity.cli import scrape_lists
+        from filmaffinity.scraper import RateLimitError
+
+        mock_scraper.get_list_movies.side_effect = RateLimitError("blocked")
+
+        with pytest.raises(RateLimitError):
+            scrape_lists({"A": "http://fa/a", "B": "http://fa/b"}, workers=2)
+
+    @patch("filmaffinity.cli.scraper")
+    def test_workers_enable_global_rate_limit(self, mock_scraper):
+        import tempfile
+
+        from typer.testing import CliRunner
+
+        from filmaffinity.cli import app
+
+        mock_scraper.check_user.return_value = None
+        mock_scraper.get_user_lists.return_value = {"A": "http://fa/a", "B": "http://fa/b"}
+        mock_scraper.get_list_movies.return_value = ("", {"title": ["Movie"]})
+        mock_scraper.get_watched_movies.return_value = {"title": ["Movie"]}
+
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = runner.invoke(
+                app,
+                [
+                    "backup",
+                    "123456",
+                    "-q",
+                    "--workers",
+                    "2",
+                    "--max-rps",
+                    "3",
+                    "--fixed-rate",
+                    "--data-dir",
+                    tmpdir,
+                ],
+                color=False,
+            )
+
+            assert result.exit_code == 0
+            mock_scraper.set_rate_limit.assert_called_once_with(3.0)
+            saved = sorted(os.listdir(os.path.join(tmpdir, "123456")))
+            assert saved == ["list - A.csv", "list - B.csv", "watched.csv"]
+
+
+class TestAdaptiveRate:
+    """Test the adaptive request rate (default)."""
+
+    @patch("filmaffinity.cli.scraper")
+    def test_rate_is_learned_across_runs(self, mock_scraper, tmp_path):
+        from typer.testing import CliRunner
+
+        from filmaffinity.cli import app
+        from filmaffinity.rate_limit import RATE_STATE_FILENAME, AdaptiveRateLimiter
+
+        mock_scraper.check_user.return_value = None
+        (tmp_path / RATE_STATE_FILENAME).write_text('{"rate": 0.8}')
+
+        def fake_get_watched_movies(user_id, **kwargs):
+            # Two fast successful responses
+            mock_scraper.set_rate_limiter.call_args[0][0].record(200, 0.1)
+            mock_scraper.set_rate_limiter.call_args[0][0].record(200, 0.1)
+
+        mock_scraper.get_watched_movies.side_effect = fake_get_watched_movies
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            [
+                "backup",
+                "123456",
+                "-q",
+                "--skip-lists",
+                "--max-rps",
+                "2",
+                "--data-dir",
+                str(tmp_path),
+            ],
+            color=False,
+        )
+
+        assert result.exit_code == 0
+        limiter = mock_scraper.set_rate_limiter.call_args[0][0]
+        assert isinstance(limiter, AdaptiveRateLimiter)
+        assert limiter.max_rate == 2.0
+        assert limiter.rate == pytest.approx(0.9)
+        mock_scraper.set_rate_limit.assert_not_called()
+        assert AdaptiveRateLimiter.load(tmp_path / RATE_STATE_FILENAME, rate=0.1).rate == (
+            pytest.approx(0.9)
+        )
+
+
+class TestIncrementalBackup:
+    """Test the --since option."""
+
+    @patch("filmaffinity.cli.scraper")
+    def test_since_merges_new_ratings(self, mock_scraper, tmp_path):
+        from typer.testing import CliRunner
+
+        from filmaffinity import scraper
+        from filmaffinity.cli import app
+
+        user_dir = tmp_path / "123456"
+        user_dir.mkdir()
+        (user_dir / "watched.csv").write_text(
+            "title;FA movie ID;user score\nOld;1;5\nRerated;2;6\n"
+        )
+
+        mock_scraper.check_user.return_value = None
+        mock_scraper.index_ratings.side_effect = scraper.index_ratings
+        mock_scraper.merge_movie_info.side_effect = scraper.merge_movie_info
+        mock_scraper.get_new_watched_movies.return_value = {
+            "title": ["New", "Rerated"],
+            "FA movie ID": ["3", "2"],
+            "user score": ["9", "8"],
+        }
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            ["backup", "123456", "-q", "--skip-lists", "--since", "--data-dir", str(tmp_path)],
+            color=False,
+        )
+
+        assert result.exit_code == 0
+        mock_scraper.get_watched_movies.assert_not_called()
+        known = mock_scraper.get_new_watched_movies.call_args[0][1]
+        assert known == {"1": "5", "2": "6"}
+        lines = (user_dir / "watched.csv").read_text().splitlines()
+        assert lines == ["title;FA movie ID;user score", "New;3;9", "Rerated;2;8", "Old;1;5"]
+
+    @patch("filmaffinity.cli.scraper")
+    def test_since_without_previous_backup_downloads_all(self, mock_scraper, tmp_path):
+        from typer.testing import CliRunner
+
+        from filmaffinity.cli import app
+
+        mock_scraper.check_user.return_value = None
+        mock_scraper.get_watched_movies.return_value = {"title": ["Movie"]}
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            ["backup", "123456", "-q", "--skip-lists", "--since", "--data-dir", str(tmp_path)],
+            color=False,
+        )
+
+        assert result.exit_code == 0
+        mock_scraper.get_watched_movies.assert_called_once()
+        mock_scraper.get_new_watched_movies.assert_not_called()
+
+
+class TestAsyncEngine:
+    """Test the --engine async option."""
+
+    @patch("filmaffinity.cli.scrape_async")
+    @patch("filmaffinity.cli.scraper")
+    def test_async_engine_uses_scrape_async(self, mock_scraper, mock_scrape_async):
+        import tempfile
+
+        from typer.testing import CliRunner
+
+        from filmaffinity.checkpoint import CHECKPOINT_FILENAME
+        from filmaffinity.cli import app
+
+        mock_scraper.check_user.return_value = None
+        mock_scraper.get_user_lists.return_value = {"A": "http://fa/a"}
+        mock_scrape_async.return_value = ({"A": {"title": ["Movie"]}}, {"title": ["Movie"]})
+
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = runner.invoke(
+                app,
+                ["backup", "123456", "-q", "--engine", "async", "--data-dir", tmpdir],
+                color=False,
+            )
+
+            assert result.exit_code == 0
+            mock_scrape_async.assert_called_once()
+            checkpoint = mock_scrape_async.call_args.kwargs["checkpoint"]
+            assert checkpoint.path.name == CHECKPOINT_FILENAME
+            mock_scraper.get_list_movies.assert_not_called()
+            mock_scraper.get_watched_movies.assert_not_called()
+            saved = sorted(os.listdir(os.path.join(tmpdir, "123456")))
+            assert saved == ["list - A.csv", "watched.csv"]
+
+
+class TestStreamingBackup:
+    """Test that backups are written page by page and can resume mid-list."""
+
+    @patch("filmaffinity.cli.scraper")
+    def test_resume_continues_from_last_page(self, mock_scraper, tmp_path):
+        import pandas as pd
+        from typer.testing import CliRunner
+
+        from filmaffinity import scraper
+        from filmaffinity.cli import app
+        from filmaffinity.records import FilmRecord
+
+        mock_scraper.check_user.return_value = None
+        mock_scraper.WATCHED_COLUMNS = scraper.WATCHED_COLUMNS
+        start_pages = []
+
+        def fake_get_watched_movies(user_id, lang="en", fetch_original_title=True, **kwargs):
+            start_pages.append(kwargs["start_page"])
+            for page in range(kwargs["start_page"], 4):
+                if page == 3 and len(start_pages) == 1:
+                    raise scraper.NetworkError("connection lost")
+                films = scraper.new_movie_info(scraper.WATCHED_COLUMNS)
+                films.append(FilmRecord(title=f"Movie {page}", fa_movie_id=str(page)))
+                kwargs["on_page"](page, films)
+            return scraper.new_movie_info(scraper.WATCHED_COLUMNS)
+
+        mock_scraper.get_watched_movies.side_effect = fake_get_watched_movies
+        user_dir = tmp_path / "123456"
+        args = ["backup", "123456", "-q", "--skip-lists", "--data-dir", str(tmp_path)]
+
+        runner = CliRunner()
+        result = runner.invoke(app, args, color=False)
+        assert result.exit_code == 1
+        assert not (user_dir / "watched.csv").exists()
+        assert (user_dir / "watched.csv.part").exists()
+
+        result = runner.invoke(app, args + ["--resume"], color=False)
+        assert result.exit_code == 0
+        assert start_pages == [1, 3]
+        df = pd.read_csv(user_dir / "watched.csv", sep=";")
+        assert list(df["title"]) == ["Movie 1", "Movie 2", "Movie 3"]
+        assert sorted(os.listdir(user_dir)) == ["watched.csv"]
+
+    @patch("filmaffinity.cli.scraper")
+    def test_removes_stale_files(self, mock_scraper, tmp_path):
+        from typer.testing import CliRunner
+
+        from filmaffinity import scraper
+        from filmaffinity.cli import app
+
+        user_dir = tmp_path / "123456"
+        user_dir.mkdir()
+        (user_dir / "list - Deleted.csv").write_text("title\nOld\n")
+        mock_scraper.check_user.return_value = None
+        mock_scraper.WATCHED_COLUMNS = scraper.WATCHED_COLUMNS
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            [
+                "backup",
+                "123456",
+                "-q",
+                "--skip-lists",
+                "--format",
+                "json",
+                "--data-dir",
+                str(tmp_path),
+            ],
+            color=False,
+        )
+
+        assert result.exit_code == 0
+        assert sorted(os.listdir(user_dir)) == ["watched.csv", "watched.json"]
+
+
+class TestBatchBackup:
+    """Test the batch command."""
+
+    def test_read_user_ids(self, tmp_path):
+        from filmaffinity.cli import read_user_ids
+
+        users_file = tmp_path / "users.txt"
+        users_file.write_text("# accounts\n123\n\n 456 \n123\n")
+
+        assert read_user_ids(users_file) == ["123", "456"]
+
+    @patch("filmaffinity.cli.scraper")
+    def test_failed_user_does_not_stop_batch(self, mock_scraper, tmp_path):
+        import pandas as pd
+        from typer.testing import CliRunner
+
+        from filmaffinity import scraper
+        from filmaffinity.cli import BATCH_REPORT_FILENAME, app
+
+        def fake_check_user(user_id, lang="en"):
+            if user_id == "999":
+                raise scraper.UserNotFoundError(user_id)
+
+        mock_scraper.check_user.side_effect = fake_check_user
+        mock_scraper.get_user_lists.return_value = {}
+        mock_scraper.WATCHED_COLUMNS = scraper.WATCHED_COLUMNS
+        users_file = tmp_path / "users.txt"
+        users_file.write_text("999\n123\n456\n")
+        data_dir = tmp_path / "data"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            ["batch", str(users_file), "-q", "--users", "2", "--data-dir", str(data_dir)],
+            color=False,
+        )
+
+        assert result.exit_code == 1
+        assert "User 999: User not found" in strip_ansi(result.stdout)
+        assert (data_dir / "123" / "watched.csv").exists()
+        assert (data_dir / "456" / "watched.csv").exists()
+        report = pd.read_csv(data_dir / BATCH_REPORT_FILENAME, sep=";", dtype=str)
+        assert list(report["user_id"]) == ["999", "123", "456"]
+        assert list(report["status"]) == ["failed", "ok", "ok"]
+        # One rate limiter shared by every user
+        mock_scraper.set_rate_limiter.assert_called_once()
+
+    @patch("filmaffinity.cli.scraper")
+    @patch("filmaffinity.cli.backup_user")
+    def test_unexpected_error_is_reported(self, mock_backup_user, mock_scraper, tmp_path):
+        import pandas as pd
+        from typer.testing import CliRunner
+
+        from filmaffinity.cli import BATCH_REPORT_FILENAME, app
+
+        def fake_backup_user(user_id, data_dir, **kwargs):
+            if user_id == "123":
+                raise OSError("No space left on device")
+            return 2
+
+        mock_backup_user.side_effect = fake_backup_user
+        users_file = tmp_path / "users.txt"
+        users_file.write_text("123\n456\n")
+        data_dir = tmp_path / "data"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            ["batch", str(users_file), "-q", "--users", "2", "--data-dir", str(data_dir)],
+            color=False,
+        )
+
+        assert result.exit_code == 1
+        report = pd.read_csv(data_dir / BATCH_REPORT_FILENAME, sep=";", dtype=str)
+        assert list(report["status"]) == ["failed", "ok"]
+        assert report["error"][0] == "OSError: No space left on device"
+
+    @patch("filmaffinity.cli.scraper")
+    @patch("filmaffinity.cli.backup_user")
+    def test_keyboard_interrupt_stops_batch(self, mock_backup_user, mock_scraper, tmp_path):
+        from typer.testing import CliRunner
+
+        from filmaffinity.cli import app
+
+        mock_backup_user.side_effect = KeyboardInterrupt
+        users_file = tmp_path / "users.txt"
+        users_file.write_text("123\n456\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app, ["batch", str(users_file), "-q", "--data-dir", str(tmp_path / "data")]
+        )
+
+        assert result.exit_code != 0
+        assert mock_backup_user.call_count == 1
+
+    def test_empty_users_file(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from filmaffinity.cli import app
+
+        users_file = tmp_path / "users.txt"
+        users_file.write_text("# nobody yet\n")
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["batch", str(users_file)], color=False)
+
+        assert result.exit_code == 1
+        assert "No user IDs found" in strip_ansi(result.stdout)
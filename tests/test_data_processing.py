@@ -7,8 +7,12 @@ Tests for CSV reading, text normalization, and IMDb matching functions.
 import os
 import sys
 import tempfile
+import unicodedata
 from unittest.mock import MagicMock, patch
 
+from hypothesis import given
+from hypothesis import strategies as st
+
 # Add project root to path so we can import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -25,6 +29,21 @@ from imdb_uploader.data_processing import (  # noqa: E402
 )
 
 
+def reference_normalize_text(s):
+    """normalize_text before the translation tables and memo, kept as the oracle."""
+    if not s:
+        return ""
+    s = s.strip().lower()
+    s = unicodedata.normalize("NFD", s)
+    s = "".join(ch for ch in s if unicodedata.category(ch) != "Mn")
+    s = "".join(ch if ch.isalnum() or ch.isspace() else " " for ch in s)
+    for prefix in ("el ", "la ", "los ", "las ", "un ", "una "):
+        if s.startswith(prefix):
+            s = s[len(prefix) :]
+            break
+    return " ".join(s.split())
+
+
 class TestNormalizeText:
     """Tests for normalize_text function."""
 
@@ -64,6 +83,33 @@ class TestNormalizeText:
     def test_preserve_alphanumeric(self):
         assert normalize_text("Hello123") == "hello123"
 
+    def test_repeated_calls_return_same_result(self):
+        assert normalize_text("¡Átame!") == normalize_text("¡Átame!") == "atame"
+
+    @given(st.text())
+    def test_matches_reference(self, s):
+        assert normalize_text(s) == reference_normalize_text(s)
+
+    @given(
+        st.lists(
+            st.sampled_from(
+                ["el ", "La ", "  ", "ñ", "É", "\u0301", "\u0338", "ß", "İ", "ﬁ", "-", "2"]
+            )
+            | st.text(max_size=3),
+            max_size=12,
+        ).map("".join)
+    )
+    def test_matches_reference_on_title_like_text(self, s):
+        assert normalize_text(s) == reference_normalize_text(s)
+
+    def test_matches_reference_for_table_characters(self):
+        # ASCII, the precomputed Latin and combining mark ranges, general
+        # punctuation and letters that change length when lowercased or decomposed
+        codes = (*range(0x370), *range(0x2000, 0x2070), *map(ord, "ßİıﬁﬂ\u0338"))
+        for code in codes:
+            ch = chr(code)
+            assert normalize_text(f"a{ch}b") == reference_normalize_text(f"a{ch}b"), hex(code)
+
 
 class TestReadCSV:
     """Tests for read_csv function."""
@@ -225,6 +271,34 @@ class TestFindImdbMatch:
 
         assert result is not None
 
+    def test_candidates_keep_best_score_per_movie(self):
+        """Test candidates seen by several queries are listed once, with their best score."""
+
+        def movie(movie_id, title):
+            m = MagicMock()
+            m.movieID = movie_id
+            m.get.side_effect = {"title": title}.get
+            return m
+
+        mock_client = MagicMock()
+        mock_client.search_movie.side_effect = lambda query: (
+            [movie("0000011", "Barco Fantasma 2")]
+            + [movie(f"{i:07d}", f"qqq zzz {i}") for i in range(11)]
+        )
+
+        result = find_imdb_match(
+            "Barco Fantasma", None, ia=mock_client, original_title="Ghost Ship"
+        )
+
+        candidates = result["candidates"]
+        assert mock_client.search_movie.call_count == 2
+        assert len(candidates) == 10
+        assert len({c["movieID"] for c in candidates}) == 10
+        assert candidates[0]["movieID"] == "0000011"
+        assert candidates[0]["base_score"] == result["score"]
+        scores = [c["base_score"] for c in candidates]
+        assert scores == sorted(scores, reverse=True)
+
     def test_find_imdb_match_no_client(self):
         """Test when no IMDb client is provided."""
         result = find_imdb_match("The Matrix", "1999", ia=None)
@@ -0,0 +1,102 @@
+"""
+Unit tests for imdb_uploader/directors.py
+
+Tests for the resolution and reuse of IMDb candidate directors.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader.data_processing import find_imdb_match  # noqa: E402
+from imdb_uploader.directors import DirectorResolver  # noqa: E402
+from tests.conftest import FakeMovie  # noqa: E402
+
+CREDITS = {
+    "0133093": ["Lana Wachowski", "Lilly Wachowski"],
+    "0234215": ["Lana Wachowski", "Lilly Wachowski"],
+    "0113277": ["Michael Mann"],
+}
+PEOPLE = {movie_id: [{"name": name} for name in names] for movie_id, names in CREDITS.items()}
+
+
+class TestDirectorResolver:
+    """Tests for DirectorResolver."""
+
+    def test_uses_directors_of_search_results(self, make_client):
+        client = make_client(credits=PEOPLE)
+        resolver = DirectorResolver(client)
+        movie = FakeMovie("0113277", directors=[{"name": "Michael Mann"}])
+
+        assert resolver.resolve([movie], []) == [["Michael Mann"]]
+        assert resolver.credits("0113277") == ["Michael Mann"]
+        client.update.assert_not_called()
+
+    def test_credits_are_reused(self, make_client):
+        client = make_client(credits=PEOPLE)
+        resolver = DirectorResolver(client)
+
+        resolver.resolve([FakeMovie("0133093")], [])
+        resolved = resolver.resolve([FakeMovie("0133093"), FakeMovie("0133093")], [])
+
+        assert resolved == [CREDITS["0133093"]] * 2
+        assert client.update.call_count == 1
+        assert (resolver.fetches, resolver.hits) == (1, 2)
+
+    def test_failed_fetches_count_towards_limit(self):
+        client = MagicMock()
+        client.update.side_effect = Exception("not found")
+        resolver = DirectorResolver(client, fetch_limit=2)
+        failures = []
+
+        resolved = resolver.resolve([FakeMovie(str(i)) for i in range(5)], failures)
+
+        assert resolved == [None] * 5
+        assert client.update.call_count == 2
+        assert failures == ["0", "1"]
+
+    def test_never_fetches_without_client(self):
+        assert DirectorResolver().resolve([FakeMovie("0133093")], []) == [None]
+
+    def test_filmography(self, make_client):
+        resolver = DirectorResolver(make_client(credits=PEOPLE))
+        resolver.resolve([FakeMovie(movie_id) for movie_id in CREDITS], [])
+
+        assert resolver.filmography("Lana Wachowski") == {"0133093", "0234215"}
+        assert resolver.filmography("LANA WACHOWSKI") == {"0133093", "0234215"}
+        assert resolver.filmography("Ridley Scott") == set()
+
+    def test_least_recently_used_movies_are_forgotten(self):
+        resolver = DirectorResolver(max_entries=2)
+        resolver.remember("0133093", CREDITS["0133093"])
+        resolver.remember("0113277", CREDITS["0113277"])
+        resolver.credits("0133093")
+        resolver.remember("0234215", CREDITS["0234215"])
+
+        assert len(resolver) == 2
+        assert resolver.credits("0113277") is None
+        assert resolver.filmography("Michael Mann") == set()
+        assert resolver.filmography("Lana Wachowski") == {"0133093", "0234215"}
+
+
+class TestFindImdbMatchWithResolver:
+    """Tests for find_imdb_match with a shared DirectorResolver."""
+
+    def test_directors_are_fetched_once_per_run(self, make_client):
+        client = make_client(credits=PEOPLE)
+        client.search_movie.side_effect = lambda query: [
+            FakeMovie("0133093", title="The Matrix", year=1999),
+            FakeMovie("0234215", title="The Matrix Reloaded", year=2003),
+        ]
+        resolver = DirectorResolver(client)
+
+        for title in ("Matrix", "Matriz", "The Matrixx"):
+            best = find_imdb_match(
+                title, None, ia=client, director="Lana Wachowski", director_resolver=resolver
+            )
+            assert best["movieID"] == "0133093"
+
+        assert client.update.call_count == 2
@@ -0,0 +1,124 @@
+"""
+Unit tests for filmaffinity/enrichment.py
+
+Tests for the batched original title enrichment stage.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity.enrichment import (  # noqa: E402
+    apply_original_titles,
+    collect_movie_ids,
+    enrich_original_titles,
+    fetch_original_titles,
+    load_journal,
+)
+
+
+def make_info(ids, titles):
+    return {
+        "title": list(titles),
+        "original title": [""] * len(ids),
+        "FA movie ID": list(ids),
+    }
+
+
+class TestCollectMovieIds:
+    """Tests for collect_movie_ids."""
+
+    def test_deduplicates_across_datasets(self):
+        watched = make_info(["1", "2"], ["A", "B"])
+        favourites = make_info(["2", "3"], ["B", "C"])
+
+        assert collect_movie_ids([watched, favourites]) == ["1", "2", "3"]
+
+    def test_skips_missing_ids(self):
+        info = make_info(["1", "", None], ["A", "B", "C"])
+        assert collect_movie_ids([info]) == ["1"]
+
+
+class TestFetchOriginalTitles:
+    """Tests for fetch_original_titles."""
+
+    @patch("filmaffinity.scraper.time.sleep")
+    def test_sequential_fetch(self, mock_sleep):
+        titles = fetch_original_titles(["1", "2", "1"], fetch=lambda movie_id: f"T{movie_id}")
+
+        assert titles == {"1": "T1", "2": "T2"}
+        assert mock_sleep.call_count == 2
+
+    def test_concurrent_fetch(self):
+        fetched = []
+
+        def fetch(movie_id):
+            fetched.append(movie_id)
+            return f"T{movie_id}"
+
+        titles = fetch_original_titles([str(i) for i in range(10)], workers=4, fetch=fetch)
+
+        assert titles == {str(i): f"T{i}" for i in range(10)}
+        assert sorted(fetched) == sorted(str(i) for i in range(10))
+
+    @patch("filmaffinity.scraper.time.sleep")
+    def test_resumes_from_journal(self, mock_sleep, tmp_path):
+        journal = tmp_path / "journal.jsonl"
+        journal.write_text(json.dumps({"id": "1", "original_title": "Known"}) + "\n")
+        fetched = []
+
+        def fetch(movie_id):
+            fetched.append(movie_id)
+            return f"T{movie_id}"
+
+        titles = fetch_original_titles(["1", "2"], journal_path=journal, fetch=fetch)
+
+        assert fetched == ["2"]
+        assert titles == {"1": "Known", "2": "T2"}
+        assert load_journal(journal) == {"1": "Known", "2": "T2"}
+
+    @patch("filmaffinity.scraper.time.sleep")
+    def test_empty_titles_are_not_journaled(self, mock_sleep, tmp_path):
+        journal = tmp_path / "journal.jsonl"
+
+        fetch_original_titles(["1"], journal_path=journal, fetch=lambda movie_id: "")
+
+        assert load_journal(journal) == {}
+
+    def test_load_journal_ignores_truncated_lines(self, tmp_path):
+        journal = tmp_path / "journal.jsonl"
+        journal.write_text(json.dumps({"id": "1", "original_title": "A"}) + '\n{"id": "2", "or')
+
+        assert load_journal(journal) == {"1": "A"}
+
+
+class TestApplyOriginalTitles:
+    """Tests for apply_original_titles and enrich_original_titles."""
+
+    def test_only_distinct_titles_are_kept(self):
+        info = make_info(["1", "2", "3"], ["El padrino", "Alien", "Sin título"])
+
+        apply_original_titles(info, {"1": "The Godfather", "2": "Alien", "3": ""})
+
+        assert info["original title"] == ["The Godfather", "", ""]
+
+    def test_each_movie_fetched_once(self):
+        watched = make_info(["1", "2"], ["El padrino", "Tiburón"])
+        favourites = make_info(["1"], ["El padrino"])
+        fetched = []
+
+        def fetch(movie_id):
+            fetched.append(movie_id)
+            return {"1": "The Godfather", "2": "Jaws"}[movie_id]
+
+        with patch("filmaffinity.scraper.get_original_title", side_effect=fetch):
+            count = enrich_original_titles([watched, favourites], workers=2)
+
+        assert count == 2
+        assert sorted(fetched) == ["1", "2"]
+        assert watched["original title"] == ["The Godfather", "Jaws"]
+        assert favourites["original title"] == ["The Godfather"]
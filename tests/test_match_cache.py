@@ -0,0 +1,131 @@
+"""
+Unit tests for imdb_uploader/match_cache.py
+
+Tests for the persistent cache of IMDb matches.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader import match_cache as match_cache_module  # noqa: E402
+from imdb_uploader.data_processing import find_imdb_match, match_cache_key  # noqa: E402
+from imdb_uploader.match_cache import MatchCache  # noqa: E402
+from tests.conftest import FakeMovie  # noqa: E402
+
+
+class TestMatchCache:
+    """Tests for MatchCache storage."""
+
+    def test_round_trip_drops_imdbpy_objects(self, tmp_path):
+        match = {
+            "movieID": "0133093",
+            "title": "The Matrix",
+            "score": 1.8,
+            "candidates": [{"cand": object(), "movieID": "0133093", "base_score": 1.8}],
+        }
+        with MatchCache(tmp_path / "matches.sqlite") as cache:
+            cache.put("key", match)
+            found, cached = cache.get("key")
+
+        assert found
+        assert cached["candidates"] == [{"movieID": "0133093", "base_score": 1.8}]
+        assert "cand" in match["candidates"][0]
+
+    def test_caches_missing_movies(self, tmp_path):
+        with MatchCache(tmp_path / "matches.sqlite") as cache:
+            cache.put("unknown", None)
+
+            assert cache.get("unknown") == (True, None)
+            assert cache.get("other") == (False, None)
+            assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_missing_movies_expire(self, tmp_path):
+        with MatchCache(tmp_path / "matches.sqlite", not_found_ttl=-1) as cache:
+            cache.put("unknown", None)
+            cache.put("known", {"movieID": "1"})
+
+            assert cache.get("unknown") == (False, None)
+            assert cache.get("known") == (True, {"movieID": "1"})
+
+    def test_scoring_change_invalidates_entries(self, tmp_path, monkeypatch):
+        path = tmp_path / "matches.sqlite"
+        with MatchCache(path) as cache:
+            cache.put("key", {"movieID": "1"})
+
+        monkeypatch.setattr(match_cache_module, "DIRECTOR_FETCH_LIMIT", 5)
+        with MatchCache(path) as cache:
+            assert len(cache) == 0
+            assert cache.get("key") == (False, None)
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [
+            ("DEFAULT_CONFIDENCE_THRESHOLD", 0.7),
+            ("SELECTION_CANDIDATES", 5),
+            ("YEAR_MATCH_BOOST", 0.5),
+            ("YEAR_MISMATCH_PENALTY", 0.5),
+            ("YEAR_MISMATCH_MIN_DIFF", 3),
+            ("DIRECTOR_SURNAME_BOOST", 0.2),
+            ("DIRECTOR_SIMILARITY_BOOSTS", ((0.9, 0.3),)),
+        ],
+    )
+    def test_fingerprint_covers_scoring_constants(self, monkeypatch, name, value):
+        before = match_cache_module.scoring_fingerprint()
+        monkeypatch.setattr(match_cache_module, name, value)
+        assert match_cache_module.scoring_fingerprint() != before
+
+    def test_query_stats_accumulate_across_runs(self, tmp_path):
+        path = tmp_path / "matches.sqlite"
+        with MatchCache(path) as cache:
+            assert cache.query_stats() == {}
+            cache.add_query_stats({"title": (3, 2)})
+
+        with MatchCache(path) as cache:
+            cache.add_query_stats({"title": (1, 0), "original": (2, 2)})
+            assert cache.query_stats() == {"title": (4, 2), "original": (2, 2)}
+
+    def test_refresh_ignores_entries(self, tmp_path):
+        path = tmp_path / "matches.sqlite"
+        with MatchCache(path) as cache:
+            cache.put("key", {"movieID": "1"})
+
+        with MatchCache(path, refresh=True) as cache:
+            assert cache.get("key") == (False, None)
+
+
+class TestCachedFindImdbMatch:
+    """Tests for find_imdb_match with a MatchCache."""
+
+    def test_second_lookup_needs_no_network(self, tmp_path, make_client):
+        client = make_client([FakeMovie("0133093", title="The Matrix", year=1999)])
+
+        with MatchCache(tmp_path / "matches.sqlite") as cache:
+            first = find_imdb_match("The Matrix", "1999", ia=client, cache=cache)
+            calls = client.search_movie.call_count
+            second = find_imdb_match("the matrix", "1999", ia=client, cache=cache)
+
+        assert calls > 0
+        assert client.search_movie.call_count == calls
+        assert second["movieID"] == first["movieID"] == "0133093"
+        assert second["score"] == first["score"]
+
+    def test_failed_search_is_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        client = MagicMock()
+        client.search_movie.side_effect = Exception("HTTP Error 503")
+
+        with MatchCache(tmp_path / "matches.sqlite") as cache:
+            assert find_imdb_match("The Matrix", "1999", ia=client, cache=cache) is None
+            assert len(cache) == 0
+
+    def test_key_normalises_titles(self):
+        assert match_cache_key("El Señor de los Anillos", "2001") == match_cache_key(
+            "señor de los anillos", "2001"
+        )
+        assert match_cache_key("Heat", "1995") != match_cache_key("Heat", "1986")
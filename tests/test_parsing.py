@@ -0,0 +1,153 @@
+"""
+Unit tests for filmaffinity/parsing.py
+
+Tests that every parsing backend extracts the same data from FilmAffinity pages.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity import parsing, scraper  # noqa: E402
+
+CARD = """
+<div class="movie-card mc-flex" data-movie-id="{movie_id}">
+  <div class="mc-title"><a href="/es/film{movie_id}.html"> {title} </a></div>
+  <span class="mc-year ms-1"></span><span class="mc-year ms-1">1972</span>
+  <img class="nflag" alt=" Estados Unidos " src="/us.png">
+  <div class="mc-director"><a>Francis Ford Coppola</a><a>Otro</a></div>
+  <div class="fa-avg-rat-box"><div class="avg">9,0</div></div>
+</div>
+"""
+
+WATCHED_PAGE = f"""
+<html><body><nav><a href="/">Home</a></nav>
+<div class="user-ratings-list-resp">
+  <div class="row mb-4"><div class="fa-user-rat-box"> 8 </div>
+    {CARD.format(movie_id=809297, title="El padrino (TV)")}</div>
+  <div class="row mb-4"><div class="fa-user-rat-box">6</div>
+    <div class="movie-card" data-movie-id="1"><div class="mc-title">No link</div></div></div>
+  <div class="row mb-4"><div class="movie-card" data-movie-id="2"></div></div>
+</div>
+</body></html>
+"""
+
+LIST_PAGE = """
+<html><body><span class="fs-5">Lista: Favoritas</span>
+<ul class="fa-list-group">
+  <li data-movie-id="100"><div class="fa-user-rat-box">10</div>
+    <div class="mc-title"><a>Tiburón</a></div><div class="avg">7,8</div></li>
+  <li><p>Advert</p></li>
+</ul></body></html>
+"""
+
+USER_LISTS_PAGE = """
+<html><body><ul class="fa-list-group">
+  <li><a class="ls-imgs" href="/imgs"></a><a href="/es/mylist.php?list_id=1">Favoritas</a></li>
+  <li><a class="ls-imgs" href="/imgs"></a><a>Sin enlace</a></li>
+</ul></body></html>
+"""
+
+FILM_PAGE = """
+<html><body><dl class="movie-info">
+  <dt>Año</dt><dd>1972</dd>
+  <dt>Título original</dt><!-- --><dd> The Godfather <span>aka</span> Mario Puzo's </dd>
+</dl></body></html>
+"""
+
+
+def parse_all(backend):
+    """Parse every sample page with the given backend."""
+    parsing.set_parser(backend)
+    try:
+        watched = scraper.new_movie_info(scraper.WATCHED_COLUMNS)
+        watched_count = scraper.parse_watched_page(
+            parsing.parse_page(WATCHED_PAGE, parsing.WATCHED_PAGE),
+            watched,
+            fetch_original_title=False,
+        )
+        list_page = parsing.parse_page(LIST_PAGE, parsing.LIST_PAGE)
+        movies = scraper.new_movie_info(scraper.LIST_COLUMNS)
+        list_count = scraper.parse_list_page(list_page, movies, fetch_original_title=False)
+        return {
+            "watched": (watched_count, watched),
+            "list": (scraper.parse_list_title(list_page), list_count, movies),
+            "user lists": scraper.parse_user_lists_page(
+                parsing.parse_page(USER_LISTS_PAGE, parsing.USER_LISTS_PAGE)
+            ),
+            "original title": scraper.parse_original_title(
+                parsing.parse_page(FILM_PAGE, parsing.DETAIL_PAGE)
+            ),
+            "empty": (
+                scraper.parse_watched_page(parsing.parse_page(""), {}),
+                scraper.parse_user_lists_page(parsing.parse_page("<p>nothing</p>")),
+            ),
+        }
+    finally:
+        parsing.set_parser(None)
+
+
+class TestSetParser:
+    """Tests for backend selection."""
+
+    def teardown_method(self):
+        parsing.set_parser(None)
+
+    def test_unknown_parser(self):
+        with pytest.raises(ValueError):
+            parsing.set_parser("html5lib")
+
+    def test_html_parser_builds_soup(self):
+        parsing.set_parser("html.parser")
+
+        page = parsing.parse_page(FILM_PAGE, parsing.DETAIL_PAGE)
+
+        assert parsing.get_parser() == "html.parser"
+        assert not parsing.is_lxml(page)
+        assert page.find("nav") is None
+
+    def test_missing_lxml(self, monkeypatch):
+        monkeypatch.setattr(parsing, "lxml", None)
+        with pytest.raises(ImportError):
+            parsing.set_parser("lxml")
+
+
+class TestHtmlParserBackend:
+    """Tests for the BeautifulSoup backend."""
+
+    def test_extracts_pages(self):
+        result = parse_all("html.parser")
+
+        watched_count, watched = result["watched"]
+        assert watched_count == 2
+        assert watched["FA movie ID"] == ["809297"]
+        assert watched["title"] == ["El padrino"]
+        assert watched["year"] == ["1972"]
+        assert watched["country"] == ["Estados Unidos"]
+        assert watched["directors"] == ["Francis Ford Coppola, Otro"]
+        assert watched["FA score"] == ["9,0"]
+        assert result["list"][:2] == ("Favoritas", 1)
+        assert result["user lists"] == {"Favoritas": "/es/mylist.php?list_id=1"}
+        assert result["original title"] == "The Godfather"
+        assert result["empty"] == (None, None)
+
+
+class TestLxmlBackend:
+    """Tests that the lxml backend matches the BeautifulSoup one."""
+
+    def test_same_results_as_html_parser(self):
+        pytest.importorskip("lxml")
+
+        assert parse_all("lxml") == parse_all("html.parser")
+
+    def test_pages_are_lxml_elements(self):
+        pytest.importorskip("lxml")
+        parsing.set_parser("lxml")
+        try:
+            assert parsing.is_lxml(parsing.parse_page(FILM_PAGE))
+        finally:
+            parsing.set_parser(None)
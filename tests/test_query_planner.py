@@ -0,0 +1,145 @@
+"""
+Unit tests for imdb_uploader/query_planner.py
+
+Tests for the ordering, deduplication and statistics of IMDb search queries.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader.data_processing import find_imdb_match  # noqa: E402
+from imdb_uploader.query_planner import QueryPlanner, imdb_query_key  # noqa: E402
+from tests.conftest import FakeMovie  # noqa: E402
+
+
+class TestQueryPlanner:
+    """Tests for QueryPlanner."""
+
+    def test_default_order(self):
+        plan = QueryPlanner().plan("Señor (El)", "2001", "The Lord")
+
+        assert plan == [
+            ("original", "The Lord"),
+            ("original_year", "The Lord 2001"),
+            ("title", "Señor (El)"),
+            ("title_base", "Señor"),
+            ("normalized", "senor el"),
+            ("title_year", "Señor (El) 2001"),
+            ("normalized_year", "senor el 2001"),
+        ]
+
+    def test_variants_of_the_same_imdb_query_are_searched_once(self):
+        planner = QueryPlanner()
+        plan = planner.plan("The Matrix", "1999", "THE MATRIX!")
+
+        assert [query for _, query in plan] == ["THE MATRIX!", "THE MATRIX! 1999"]
+        assert planner.variants == 6
+        assert imdb_query_key("  It's  a Test ") == "it s a test"
+
+    def test_variants_ordered_by_hit_rate(self):
+        planner = QueryPlanner()
+        for _ in range(3):
+            planner.record(["title", "title_year"], "title_year")
+
+        plan = planner.plan("Heat", "1995")
+
+        assert plan == [("title_year", "Heat 1995"), ("normalized", "heat")]
+        assert planner.hit_rates() == {"title": 0.0, "title_year": 1.0}
+
+    def test_history_orders_variants(self):
+        planner = QueryPlanner({"title_year": (10, 9), "title": (10, 1)})
+
+        assert planner.plan("Heat", "1995")[0] == ("title_year", "Heat 1995")
+        assert planner.hit_rates() == {"title": 0.1, "title_year": 0.9}
+
+    def test_run_stats_exclude_history(self):
+        planner = QueryPlanner({"title": (10, 1)})
+        planner.record(["title", "title_year"], "title_year")
+
+        assert planner.run_stats() == {"title": (1, 0), "title_year": (1, 1)}
+
+    def test_summary(self):
+        planner = QueryPlanner()
+        planner.plan("Heat", "1995")
+        planner.record(["title"], "title")
+
+        assert planner.summary() == (
+            "IMDb searches: 1.0 per lookup (of 4.0 query variants) over 1 lookups"
+        )
+
+
+class TestFindImdbMatchWithPlanner:
+    """Tests for find_imdb_match with a QueryPlanner."""
+
+    def test_decisive_match_stops_searching(self):
+        client = MagicMock()
+        client.search_movie.return_value = [
+            FakeMovie("0234215", title="The Matrix Reloaded", year=2003),
+            FakeMovie("0034583", title="Casablanca", year=1942),
+        ]
+        planner = QueryPlanner()
+
+        best = find_imdb_match(
+            "Matrix Recargado",
+            None,
+            ia=client,
+            director="Lana Wachowski",
+            original_title="Matrix Reloadd",
+            query_planner=planner,
+        )
+
+        assert best["movieID"] == "0234215"
+        assert client.search_movie.call_count == 1
+        assert (planner.lookups, planner.searches) == (1, 1)
+        assert planner.hit_rates()["original"] == 1.0
+
+    def test_decisive_match_keeps_director_boost(self):
+        def search(query):
+            return [
+                FakeMovie("0234215", title="The Matrix Reloaded", year=2003),
+                FakeMovie("0034583", title="Casablanca", year=1942),
+            ]
+
+        def update(movie, *args):
+            movie["director"] = [{"name": "Lana Wachowski"}]
+
+        def lookup():
+            client = MagicMock()
+            client.search_movie.side_effect = search
+            client.update.side_effect = update
+            best = find_imdb_match(
+                "Matrix Recargado",
+                None,
+                ia=client,
+                director="Lana Wachowski",
+                original_title="Matrix Reloadd",
+            )
+            return best
+
+        best = lookup()
+        with patch("imdb_uploader.data_processing.QUERY_DECISIVE_MARGIN", float("inf")):
+            baseline = lookup()
+
+        assert best["movieID"] == baseline["movieID"] == "0234215"
+        assert best["score"] == baseline["score"]
+
+    def test_index_searches_are_not_recorded(self):
+        index = MagicMock()
+        index.search_movie.return_value = []
+        index.directors.return_value = {}
+        client = MagicMock()
+        client.search_movie.return_value = [FakeMovie("0113277", title="Heat", year=1995)]
+        planner = QueryPlanner()
+
+        best = find_imdb_match("Heat", "1995", ia=client, index=index, query_planner=planner)
+
+        assert best["movieID"] == "0113277"
+        assert index.search_movie.call_count > 0
+        assert planner.lookups == 1
+        assert planner.searches == client.search_movie.call_count
+        assert planner.variants == 4
+        assert planner.run_stats()["title"] == (1, 1)
@@ -0,0 +1,201 @@
+"""
+Unit tests for filmaffinity/rate_limit.py
+
+Tests for the token bucket shared by concurrent scraper workers.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity.rate_limit import (  # noqa: E402
+    AdaptiveRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket class."""
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1, burst=0)
+
+    @patch("filmaffinity.rate_limit.time.monotonic", return_value=100.0)
+    def test_burst_is_free(self, mock_monotonic):
+        bucket = TokenBucket(rate=2, burst=3)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    @patch("filmaffinity.rate_limit.time.monotonic", return_value=100.0)
+    def test_reservations_queue_behind_each_other(self, mock_monotonic):
+        bucket = TokenBucket(rate=2, burst=1)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    @patch("filmaffinity.rate_limit.time.monotonic")
+    def test_tokens_refill_over_time(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1, burst=1)
+        assert bucket.reserve() == 0.0
+
+        mock_monotonic.return_value = 101.0
+        assert bucket.reserve() == 0.0
+
+    @patch("filmaffinity.rate_limit.time.sleep")
+    @patch("filmaffinity.rate_limit.time.monotonic", return_value=100.0)
+    def test_acquire_sleeps_for_reserved_delay(self, mock_monotonic, mock_sleep):
+        bucket = TokenBucket(rate=4, burst=1)
+
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(pytest.approx(0.25))
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for the AIMD rate limiter."""
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(1, min_rate=2, max_rate=1)
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(1, decrease=1)
+
+    def test_initial_rate_is_clamped(self):
+        assert AdaptiveRateLimiter(10, max_rate=2).rate == 2
+        assert AdaptiveRateLimiter(0.001, min_rate=0.1).rate == 0.1
+
+    def test_fast_responses_increase_rate(self):
+        limiter = AdaptiveRateLimiter(0.5, max_rate=0.6, increase=0.05)
+
+        limiter.record(200, 0.2)
+        assert limiter.rate == pytest.approx(0.55)
+
+        limiter.record(200, 0.2)
+        limiter.record(200, 0.2)
+        assert limiter.rate == pytest.approx(0.6)
+
+    @patch("filmaffinity.rate_limit.time.monotonic")
+    def test_errors_decrease_rate_once_per_interval(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        limiter = AdaptiveRateLimiter(1.0, min_rate=0.2, decrease=0.5)
+
+        limiter.record(429, 0.2)
+        limiter.record(503, 0.2)
+        assert limiter.rate == 0.5
+
+        mock_monotonic.return_value = 102.0
+        limiter.record(None, 30.0)
+        assert limiter.rate == 0.25
+
+        mock_monotonic.return_value = 110.0
+        limiter.record(500, 0.2)
+        assert limiter.rate == 0.2
+
+    @patch("filmaffinity.rate_limit.time.monotonic", return_value=100.0)
+    def test_latency_spike_decreases_rate(self, mock_monotonic):
+        limiter = AdaptiveRateLimiter(1.0, increase=0.0, latency_factor=3.0)
+        limiter.record(200, 0.2)
+
+        limiter.record(200, 0.5)
+        assert limiter.rate == 1.0
+
+        limiter.record(200, 2.0)
+        assert limiter.rate == 0.5
+
+    @patch("filmaffinity.rate_limit.time.monotonic", return_value=100.0)
+    def test_retry_after_pauses_requests(self, mock_monotonic):
+        limiter = AdaptiveRateLimiter(1.0, burst=5)
+
+        limiter.record(429, 0.1, retry_after=20)
+
+        assert limiter.reserve() == pytest.approx(20)
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "rate.json"
+        AdaptiveRateLimiter(0.7).save(path)
+
+        assert AdaptiveRateLimiter.load(path, rate=0.2).rate == 0.7
+        assert AdaptiveRateLimiter.load(path, rate=0.2, max_rate=0.5).rate == 0.5
+        assert AdaptiveRateLimiter.load(tmp_path / "missing.json", rate=0.2).rate == 0.2
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestScraperRateLimit:
+    """Tests for the scraper's global rate limiter hooks."""
+
+    def teardown_method(self):
+        from filmaffinity import scraper
+
+        scraper.set_rate_limit(None)
+
+    def test_set_and_clear_rate_limit(self):
+        from filmaffinity import scraper
+
+        scraper.set_rate_limit(2.0)
+        assert isinstance(scraper.rate_limiter, TokenBucket)
+        assert scraper.rate_limiter.rate == 2.0
+
+        scraper.set_rate_limit(None)
+        assert scraper.rate_limiter is None
+
+    @patch("filmaffinity.scraper.time.sleep")
+    def test_page_cooldown_skipped_with_limiter(self, mock_sleep):
+        from filmaffinity import scraper
+
+        scraper.page_cooldown()
+        mock_sleep.assert_called_once_with(scraper.DEFAULT_COOLDOWN)
+
+        mock_sleep.reset_mock()
+        scraper.set_rate_limit(1.0)
+        scraper.page_cooldown()
+        mock_sleep.assert_not_called()
+
+    @patch("filmaffinity.scraper.session")
+    def test_request_acquires_token(self, mock_session):
+        from filmaffinity import scraper
+
+        mock_session.get.return_value.status_code = 200
+        scraper.set_rate_limit(1.0)
+        with patch.object(scraper.rate_limiter, "acquire") as mock_acquire:
+            scraper.request_with_retry("http://example.com")
+        mock_acquire.assert_called_once()
+
+    @patch("filmaffinity.scraper.time.sleep")
+    @patch("filmaffinity.scraper.print")
+    @patch("filmaffinity.scraper.session")
+    def test_request_honours_retry_after(self, mock_session, mock_print, mock_sleep):
+        from unittest.mock import MagicMock
+
+        from filmaffinity import scraper
+
+        mock_session.get.side_effect = [
+            MagicMock(status_code=503, headers={"Retry-After": "7"}),
+            MagicMock(status_code=200, headers={}),
+        ]
+        limiter = AdaptiveRateLimiter(1.0, max_rate=1.0)
+        scraper.set_rate_limiter(limiter)
+        with patch.object(limiter, "acquire"):
+            response = scraper.request_with_retry("http://example.com")
+
+        assert response.status_code == 200
+        mock_sleep.assert_called_once_with(7.0)
+        # Halved by the 503, then raised by the 200
+        assert limiter.rate == pytest.approx(0.55)
@@ -0,0 +1,106 @@
+"""
+Unit tests for filmaffinity/records.py
+
+Tests for the film record containers filled by the scraper.
+"""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+from bs4 import BeautifulSoup
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity import scraper  # noqa: E402
+from filmaffinity.exporters import export_to_json, export_to_letterboxd  # noqa: E402
+from filmaffinity.records import FilmRecord, FilmTable  # noqa: E402
+
+
+def make_table():
+    return FilmTable(
+        ("title", "original title", "year", "user score"),
+        [
+            FilmRecord(
+                title="El padrino", original_title="The Godfather", year="1972", user_score="9"
+            ),
+            FilmRecord(title="Amélie", year="2001", user_score="7"),
+        ],
+    )
+
+
+class TestFilmRecord:
+    """Tests for the FilmRecord class."""
+
+    def test_missing_fields_are_empty(self):
+        record = FilmRecord(title="Alien")
+
+        assert record.get("title") == "Alien"
+        assert record.get("FA movie ID") == ""
+
+    def test_unknown_field(self):
+        with pytest.raises(TypeError):
+            FilmRecord(rating="9")
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(FilmRecord(), "__dict__")
+
+
+class TestFilmTable:
+    """Tests for the FilmTable class."""
+
+    def test_reads_like_a_dict_of_columns(self):
+        table = make_table()
+
+        assert list(table) == ["title", "original title", "year", "user score"]
+        assert table["title"] == ["El padrino", "Amélie"]
+        assert table.to_dict()["user score"] == ["9", "7"]
+        assert "genre" not in table
+
+    def test_unknown_column(self):
+        with pytest.raises(KeyError):
+            FilmTable(("rating",))
+
+    def test_rows(self):
+        rows = list(make_table().rows())
+
+        assert rows[1] == {
+            "title": "Amélie",
+            "original title": "",
+            "year": "2001",
+            "user score": "7",
+        }
+
+    def test_exporters_accept_tables(self):
+        json_out = io.StringIO()
+        export_to_json(make_table(), json_out)
+        assert json.loads(json_out.getvalue())[0]["original title"] == "The Godfather"
+
+        csv_out = io.StringIO()
+        export_to_letterboxd(make_table(), csv_out)
+        assert csv_out.getvalue().splitlines()[1:] == ["The Godfather,1972,9,", "Amélie,2001,7,"]
+
+
+class TestScraperRecords:
+    """Tests that scraped movies stay aligned across columns."""
+
+    def test_invalid_card_does_not_shift_scores(self):
+        soup = BeautifulSoup(
+            """
+            <ul class="fa-list-group">
+              <li><div class="fa-user-rat-box">3</div><div class="mc-title">No id</div></li>
+              <li data-movie-id="7"><div class="fa-user-rat-box">8</div>
+                <div class="mc-title"><a>Alien</a></div></li>
+            </ul>
+            """,
+            "html.parser",
+        )
+        info = scraper.new_movie_info(scraper.LIST_COLUMNS)
+
+        scraper.parse_list_page(soup, info, fetch_original_title=False)
+
+        assert info["title"] == ["Alien"]
+        assert info["user score"] == ["8"]
@@ -239,7 +239,7 @@ class TestRunDryRun:
             "movieID": "0133093",
         }
 
-        with patch("imdb_uploader.reporting.find_imdb_match", return_value=mock_match):
+        with patch("imdb_uploader.workers.find_imdb_match", return_value=mock_match):
             run_dry_run(items, MagicMock(), "/tmp/test.csv")
 
             # Verify CSV writer was called correctly
@@ -272,6 +272,36 @@ class TestRunDryRun:
                 ]
             )
 
+    def test_run_dry_run_parallel_keeps_order_and_collects_errors(self, tmp_path):
+        """Test that --jobs writes rows in input order and reports failed items."""
+        import threading
+        import time
+
+        items = [{"title": f"Movie {i}", "year": str(2000 + i)} for i in range(8)]
+        threads = set()
+
+        def fake_match(title, year, **kwargs):
+            threads.add(threading.get_ident())
+            index = int(title.split()[1])
+            time.sleep(0.01 * (8 - index))  # later items finish first
+            if index == 3:
+                raise RuntimeError("HTTP Error 503")
+            return {"movieID": f"{index:07d}", "title": title, "year": year, "score": 1.0}
+
+        output = tmp_path / "matches.csv"
+        with patch("imdb_uploader.workers.find_imdb_match", side_effect=fake_match):
+            errors = run_dry_run(items, MagicMock(), str(output), jobs=4)
+
+        with open(output, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["local_title"] for row in rows] == [item["title"] for item in items]
+        assert rows[3]["imdb_id"] == ""
+        assert rows[4]["imdb_id"] == "tt0000004"
+        assert errors == [
+            {"title": "Movie 3", "year": "2003", "error": "RuntimeError: HTTP Error 503"}
+        ]
+        assert len(threads) > 1
+
 
 class TestSetupBrowserSession:
     """Tests for setup_browser_session function."""
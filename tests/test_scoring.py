@@ -0,0 +1,80 @@
+"""
+Unit tests for imdb_uploader/scoring.py
+
+Tests for the batched candidate scoring used by find_imdb_match.
+"""
+
+import difflib
+import os
+import sys
+
+import pytest
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader import scoring  # noqa: E402
+from imdb_uploader.scoring import (  # noqa: E402
+    director_boosts,
+    similarities,
+    year_adjustments,
+)
+
+
+@pytest.fixture
+def difflib_backend():
+    scoring.set_backend("difflib")
+    yield
+    scoring.set_backend(None)
+
+
+class TestSimilarities:
+    """Tests for similarities."""
+
+    def test_difflib_matches_per_pair_ratios(self, difflib_backend):
+        choices = ["the matrix", "matrix reloaded", "", "heat", "the matrix revolutions"]
+        expected = [difflib.SequenceMatcher(None, "the matrix", c).ratio() for c in choices]
+
+        assert similarities("the matrix", choices).tolist() == expected
+
+    def test_empty_choices(self):
+        assert similarities("heat", []).shape == (0,)
+
+    @pytest.mark.skipif(scoring.process is None, reason="rapidfuzz not installed")
+    def test_rapidfuzz_scores_identical_strings_as_one(self):
+        scoring.set_backend("rapidfuzz")
+        try:
+            assert similarities("heat", ["heat", "zzzz"]).tolist() == [1.0, 0.0]
+        finally:
+            scoring.set_backend(None)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            scoring.set_backend("levenshtein")
+
+
+class TestYearAdjustments:
+    """Tests for year_adjustments."""
+
+    def test_boosts_and_penalties(self):
+        adjustments = year_adjustments("1999", ["1999", "2000", "2003", "", "unknown"])
+
+        assert adjustments.tolist() == [0.8, 0.0, -0.6, 0.0, 0.0]
+
+    def test_without_local_year(self):
+        assert year_adjustments("", ["1999"]).tolist() == [0.0]
+
+
+class TestDirectorBoosts:
+    """Tests for director_boosts."""
+
+    def test_best_boost_per_candidate(self, difflib_backend):
+        boosts = director_boosts(
+            "lana wachowski",
+            [["lilly wachowski"], ["lana wachowsky"], ["michael mann"], []],
+        )
+
+        assert boosts.tolist() == [0.35, 0.3, 0.0, 0.0]
+
+    def test_without_local_director(self):
+        assert director_boosts("", [["michael mann"]]).tolist() == [0.0]
@@ -493,6 +493,228 @@ class TestPaginationEdgeCases:
         assert result == {}
 
 
+def watched_page_html(ratings):
+    """Build a user ratings page with one card per (movie_id, score) pair."""
+    rows = "".join(
+        f"""
+        <div class="row mb-4">
+            <div class="fa-user-rat-box">{score}</div>
+            <div class="movie-card" data-movie-id="{movie_id}">
+                <div class="mc-title"><a>Movie {movie_id}</a></div>
+            </div>
+        </div>"""
+        for movie_id, score in ratings
+    )
+    return f'<html><body><div class="user-ratings-list-resp">{rows}</div></body></html>'
+
+
+class TestIncrementalWatched:
+    """Tests for incremental watched movie backups."""
+
+    @patch("filmaffinity.scraper.time.sleep")
+    @patch("filmaffinity.scraper.request_with_retry")
+    @patch("filmaffinity.scraper.print")
+    def test_stops_at_first_page_of_known_ratings(self, mock_print, mock_request, mock_sleep):
+        from filmaffinity import scraper
+
+        pages = [
+            watched_page_html([("4", "9"), ("3", "7")]),
+            watched_page_html([("2", "6"), ("1", "5")]),
+            watched_page_html([("0", "8")]),
+        ]
+        mock_request.side_effect = [MagicMock(status_code=200, text=page) for page in pages]
+
+        # Movie 3 was re-rated, movie 4 is new
+        known = {"3": "6", "2": "6", "1": "5", "0": "8"}
+        delta = scraper.get_new_watched_movies("12345", known)
+
+        assert delta["FA movie ID"] == ["4", "3"]
+        assert delta["user score"] == ["9", "7"]
+        assert mock_request.call_count == 2
+        assert f"orderby={scraper.WATCHED_ORDER_BY_DATE}" in mock_request.call_args[0][0]
+
+    def test_index_ratings_matches_csv_types(self):
+        from filmaffinity import scraper
+
+        # pandas reads IDs and scores back as numbers
+        assert scraper.index_ratings({"FA movie ID": [123], "user score": [8]}) == {"123": "8"}
+
+    def test_merge_puts_delta_first(self):
+        from filmaffinity import scraper
+
+        existing = {"title": ["A", "B", "C"], "FA movie ID": [1, 2, 3], "user score": [5, 6, 7]}
+        delta = {"title": ["D", "B"], "FA movie ID": ["4", "2"], "user score": ["9", "8"]}
+
+        merged = scraper.merge_movie_info(delta, existing)
+
+        assert merged["title"] == ["D", "B", "A", "C"]
+        assert merged["user score"] == ["9", "8", 5, 7]
+
+
+class TestPageCallback:
+    """Tests for streaming pages out of the pagination loops."""
+
+    @patch("filmaffinity.scraper.time.sleep")
+    @patch("filmaffinity.scraper.request_with_retry")
+    @patch("filmaffinity.scraper.print")
+    def test_on_page_receives_each_page(self, mock_print, mock_request, mock_sleep):
+        from filmaffinity import scraper
+
+        pages = [watched_page_html([("2", "6")]), watched_page_html([("1", "5")])]
+        mock_request.side_effect = [MagicMock(status_code=200, text=page) for page in pages] + [
+            MagicMock(status_code=404)
+        ]
+        received = []
+
+        info = scraper.get_watched_movies(
+            "12345",
+            start_page=4,
+            on_page=lambda page, films: received.append((page, films["FA movie ID"])),
+        )
+
+        assert received == [(4, ["2"]), (5, ["1"])]
+        assert info.records == []
+        assert "&p=4&" in mock_request.call_args_list[0][0][0]
+
+
+class TestPageCheckpoints:
+    """Tests for resuming pagination from a page journal."""
+
+    @patch("filmaffinity.scraper.time.sleep")
+    @patch("filmaffinity.scraper.request_with_retry")
+    @patch("filmaffinity.scraper.print")
+    def test_watched_resumes_after_last_page(self, mock_print, mock_request, mock_sleep, tmp_path):
+        from filmaffinity import scraper
+        from filmaffinity.checkpoint import PageJournal
+
+        pages = [watched_page_html([("2", "6")]), watched_page_html([("1", "5")])]
+        mock_request.side_effect = [MagicMock(status_code=200, text=page) for page in pages] + [
+            MagicMock(status_code=404)
+        ]
+        journal = PageJournal(tmp_path / "pages.jsonl")
+        scraper.get_watched_movies("12345", max_page=1, checkpoint=journal)
+
+        info = scraper.get_watched_movies("12345", checkpoint=journal)
+
+        assert info["FA movie ID"] == ["2", "1"]
+        assert "&p=2&" in mock_request.call_args_list[1][0][0]
+        assert "&p=3&" in mock_request.call_args_list[2][0][0]
+
+
+class TestPageCount:
+    """Tests for reading the number of pages from the pager."""
+
+    def test_ratings_pager(self):
+        from filmaffinity import scraper
+
+        pager = (
+            '<div class="pager"><a href="userratings.php?user_id=1&amp;p=2&amp;orderby=8">2</a>'
+            "<a href='userratings.php?user_id=1&amp;p=12&amp;orderby=8'>12</a></div>"
+        )
+
+        assert scraper.parse_page_count(pager, "p") == 12
+
+    def test_list_pager(self):
+        from filmaffinity import scraper
+
+        pager = (
+            '<ul class="pagination"><li><a href="/es/mylist.php?list_id=5&page=3">3</a></li>'
+            '<li><a href="?page=4&orderby=3">4</a></li></ul>'
+        )
+
+        assert scraper.parse_page_count(pager, "page") == 4
+        assert scraper.parse_page_count(pager, "p") == 1
+
+    def test_ignores_links_outside_pager(self):
+        from filmaffinity import scraper
+
+        markup = (
+            '<nav><a href="/es/topgen.php?p=90">Top</a></nav>'
+            '<div class="pager"><div><a href="userratings.php?user_id=1&p=3">3</a></div></div>'
+            '<aside><a href="/es/news.php?p=40">News</a></aside>'
+        )
+
+        assert scraper.parse_page_count(markup, "p") == 3
+
+    def test_single_page_without_pager(self):
+        from filmaffinity import scraper
+
+        assert scraper.parse_page_count(watched_page_html([("1", "5")]), "p") == 1
+
+    def test_unrecognised_markup(self):
+        from filmaffinity import scraper
+
+        # Page links but no known pager element, or no movies at all
+        markup = watched_page_html([("1", "5")]) + '<a href="userratings.php?p=2">2</a>'
+        assert scraper.parse_page_count(markup, "p") is None
+        assert scraper.parse_page_count("<html><body></body></html>", "p") is None
+
+    @patch("filmaffinity.scraper.time.sleep")
+    @patch("filmaffinity.scraper.request_with_retry")
+    @patch("filmaffinity.scraper.print")
+    def test_single_page_needs_one_request(self, mock_print, mock_request, mock_sleep):
+        from filmaffinity import scraper
+
+        mock_request.return_value = MagicMock(status_code=200, text=watched_page_html([("1", "5")]))
+
+        info = scraper.get_watched_movies("12345")
+
+        assert info["FA movie ID"] == ["1"]
+        # No empty pages are probed after the only page
+        assert mock_request.call_count == 1
+
+    @patch("filmaffinity.scraper.time.sleep")
+    @patch("filmaffinity.scraper.request_with_retry")
+    @patch("filmaffinity.scraper.print")
+    def test_stops_at_last_page(self, mock_print, mock_request, mock_sleep):
+        from filmaffinity import scraper
+
+        pager = '<div class="pager"><a href="userratings.php?user_id=1&p=2">2</a></div>'
+        pages = [watched_page_html([("2", "6")]) + pager, watched_page_html([("1", "5")])]
+        mock_request.side_effect = [MagicMock(status_code=200, text=page) for page in pages]
+
+        info = scraper.get_watched_movies("12345")
+
+        assert info["FA movie ID"] == ["2", "1"]
+        # No empty pages are requested past the last one
+        assert mock_request.call_count == 2
+
+    @patch("filmaffinity.scraper.print")
+    def test_prefetches_pages_in_order(self, mock_print):
+        import threading
+
+        from filmaffinity import scraper
+        from filmaffinity.rate_limit import TokenBucket
+
+        pager = '<div class="pager">{}</div>'.format(
+            "".join(f'<a href="userratings.php?user_id=1&p={page}">{page}</a>' for page in (2, 5))
+        )
+        lock = threading.Lock()
+        requested = []
+
+        def fake_request(url):
+            page = int(url.split("&p=")[1].split("&")[0])
+            with lock:
+                requested.append(page)
+            text = watched_page_html([(str(page), "7")])
+            return MagicMock(status_code=200, text=text + pager if page == 1 else text)
+
+        received = []
+        with patch("filmaffinity.scraper.request_with_retry", side_effect=fake_request):
+            scraper.set_rate_limiter(TokenBucket(1000, burst=10))
+            try:
+                scraper.get_watched_movies(
+                    "12345",
+                    workers=3,
+                    on_page=lambda page, films: received.append((page, films["FA movie ID"])),
+                )
+            finally:
+                scraper.set_rate_limiter(None)
+
+        assert sorted(requested) == [1, 2, 3, 4, 5]
+        assert received == [(page, [str(page)]) for page in range(1, 6)]
+
+
 # Integration tests (require network access)
 # These are marked with pytest.mark.integration and skipped by default
 # Run with: pytest -m integration
@@ -0,0 +1,147 @@
+"""
+Unit tests for imdb_uploader/search_cache.py
+
+Tests for the cache of raw IMDb searches and movie details.
+"""
+
+import json
+import os
+import pickle
+import sqlite3
+import sys
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader.search_cache import CachingIMDbClient  # noqa: E402
+from tests.conftest import FakeMovie, FakePerson  # noqa: E402
+
+CLASSES = {"movie": FakeMovie, "person": FakePerson}
+
+
+RESULTS = [FakeMovie("0133093", title="The Matrix", year=1999, accessSystem="http")]
+CREDITS = {"0133093": [FakePerson("0905154", {"name": "Lana Wachowski"})]}
+
+
+class TestCachingIMDbClient:
+    """Tests for CachingIMDbClient."""
+
+    def test_search_is_cached(self, tmp_path, make_client):
+        client = make_client(RESULTS, CREDITS)
+        with CachingIMDbClient(client, tmp_path / "search.sqlite", classes=CLASSES) as ia:
+            first = ia.search_movie("The Matrix 1999")
+            second = ia.search_movie("The Matrix 1999")
+            ia.search_movie("Heat")
+
+            assert client.search_movie.call_count == 2
+            assert second[0].movieID == first[0].movieID == "0133093"
+            assert (ia.hits, ia.misses) == (1, 2)
+
+    def test_cache_persists_between_runs(self, tmp_path, make_client):
+        path = tmp_path / "search.sqlite"
+        with CachingIMDbClient(make_client(RESULTS, CREDITS), path, classes=CLASSES) as ia:
+            ia.search_movie("The Matrix")
+
+        client = make_client(RESULTS, CREDITS)
+        with CachingIMDbClient(client, path, classes=CLASSES) as ia:
+            assert ia.search_movie("The Matrix")[0]["title"] == "The Matrix"
+        client.search_movie.assert_not_called()
+
+    def test_update_restores_details(self, tmp_path, make_client):
+        client = make_client(RESULTS, CREDITS)
+        with CachingIMDbClient(client, tmp_path / "search.sqlite", classes=CLASSES) as ia:
+            ia.update(FakeMovie("0133093"))
+            movie = FakeMovie("0133093")
+            ia.update(movie)
+
+        assert client.update.call_count == 1
+        (director,) = movie["directors"]
+        assert isinstance(director, FakePerson)
+        assert (director.personID, director["name"]) == ("0905154", "Lana Wachowski")
+
+    def test_search_results_are_rebuilt(self, tmp_path, make_client):
+        path = tmp_path / "search.sqlite"
+        with CachingIMDbClient(make_client(RESULTS, CREDITS), path, classes=CLASSES) as ia:
+            ia.search_movie("The Matrix")
+
+        with CachingIMDbClient(make_client(RESULTS, CREDITS), path, classes=CLASSES) as ia:
+            (movie,) = ia.search_movie("The Matrix")
+        assert isinstance(movie, FakeMovie)
+        assert (movie.movieID, movie.accessSystem) == ("0133093", "http")
+        assert dict(movie) == {"title": "The Matrix", "year": 1999}
+
+    def test_entries_are_stored_as_json(self, tmp_path, make_client):
+        path = tmp_path / "search.sqlite"
+        with CachingIMDbClient(make_client(RESULTS, CREDITS), path, classes=CLASSES) as ia:
+            ia.search_movie("The Matrix")
+
+        with sqlite3.connect(path) as conn:
+            (value,) = conn.execute("SELECT value FROM responses").fetchone()
+        assert json.loads(value)[0]["id"] == "0133093"
+
+    def test_pickled_entries_are_never_loaded(self, tmp_path, make_client):
+        path = tmp_path / "search.sqlite"
+        with CachingIMDbClient(make_client(RESULTS, CREDITS), path, classes=CLASSES):
+            pass
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "INSERT INTO responses VALUES ('search:None:The Matrix', ?, 1e12, 1e12)",
+                (pickle.dumps([FakeMovie("0000001")]),),
+            )
+
+        client = make_client(RESULTS, CREDITS)
+        with CachingIMDbClient(client, path, ttl=None, classes=CLASSES) as ia:
+            assert ia.search_movie("The Matrix")[0].movieID == "0133093"
+            assert (ia.hits, ia.misses) == (0, 1)
+        client.search_movie.assert_called_once()
+
+    def test_unstorable_responses_are_not_cached(self, tmp_path, make_client):
+        client = make_client(RESULTS, CREDITS)
+        client.search_movie.return_value = [object()]
+        with CachingIMDbClient(client, tmp_path / "search.sqlite", classes=CLASSES) as ia:
+            ia.search_movie("The Matrix")
+            assert len(ia) == 0
+
+    def test_failed_requests_are_not_cached(self, tmp_path, make_client):
+        client = make_client(RESULTS, CREDITS)
+        client.search_movie.side_effect = Exception("HTTP Error 503")
+        with CachingIMDbClient(client, tmp_path / "search.sqlite", classes=CLASSES) as ia:
+            for _ in range(2):
+                try:
+                    ia.search_movie("The Matrix")
+                except Exception:
+                    pass
+            assert len(ia) == 0
+        assert client.search_movie.call_count == 2
+
+    def test_expired_entries_are_searched_again(self, tmp_path, make_client):
+        client = make_client(RESULTS, CREDITS)
+        with CachingIMDbClient(client, tmp_path / "search.sqlite", ttl=-1, classes=CLASSES) as ia:
+            ia.search_movie("The Matrix")
+            ia.search_movie("The Matrix")
+        assert client.search_movie.call_count == 2
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, make_client):
+        with CachingIMDbClient(
+            make_client(RESULTS, CREDITS),
+            tmp_path / "search.sqlite",
+            max_entries=2,
+            classes=CLASSES,
+        ) as ia:
+            ia.search_movie("a")
+            ia.search_movie("b")
+            ia.search_movie("a")
+            ia.search_movie("c")
+            ia.prune()
+
+            assert len(ia) == 2
+            assert ia.search_movie("a")
+            assert ia.misses == 3
+
+    def test_delegates_other_attributes(self, tmp_path, make_client):
+        client = make_client(RESULTS, CREDITS)
+        client.get_movie.return_value = "movie"
+        with CachingIMDbClient(
+            client, tmp_path / "search.sqlite", refresh=True, classes=CLASSES
+        ) as ia:
+            assert ia.get_movie("0133093") == "movie"
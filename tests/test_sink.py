@@ -0,0 +1,102 @@
+"""
+Unit tests for filmaffinity/sink.py
+
+Tests for the page-by-page CSV writer used by backups.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filmaffinity.records import FilmRecord, FilmTable  # noqa: E402
+from filmaffinity.sink import CsvSink  # noqa: E402
+
+COLUMNS = ("title", "year", "FA movie ID")
+
+
+def page(*titles):
+    """Build a one-page table with one movie per title."""
+    return FilmTable(
+        COLUMNS,
+        [
+            FilmRecord(title=title, year="2000", fa_movie_id=str(i))
+            for i, title in enumerate(titles)
+        ],
+    )
+
+
+class TestCsvSink:
+    """Tests for the CsvSink class."""
+
+    def test_commit_moves_part_file(self, tmp_path):
+        path = tmp_path / "watched.csv"
+        sink = CsvSink(path, COLUMNS)
+        sink.write_page(1, page("A", "B"))
+
+        assert not path.exists()
+        assert sink.part_path.exists()
+
+        sink.commit()
+
+        assert path.read_text(encoding="utf-8").splitlines() == [
+            "title;year;FA movie ID",
+            "A;2000;0",
+            "B;2000;1",
+        ]
+        assert not sink.part_path.exists()
+        assert not sink.checkpoint_path.exists()
+
+    def test_output_matches_pandas(self, tmp_path):
+        films = page("Amélie", "Rocky; Part II", 'Say "Hi"')
+        with CsvSink(tmp_path / "sink.csv", COLUMNS) as sink:
+            sink.write_page(1, films)
+        sink.commit()
+        pd.DataFrame.from_records(list(films.iter_rows()), columns=list(COLUMNS)).to_csv(
+            tmp_path / "pandas.csv", sep=";", index=False
+        )
+
+        assert (tmp_path / "sink.csv").read_bytes() == (tmp_path / "pandas.csv").read_bytes()
+
+    def test_resume_continues_after_checkpoint(self, tmp_path):
+        path = tmp_path / "list.csv"
+        sink = CsvSink(path, COLUMNS)
+        sink.write_page(1, page("A"))
+        sink.write_page(2, page("B"))
+        # Simulate a crash while page 3 was being written
+        sink._writer.writerow(["Partial", "", ""])
+        sink.close()
+
+        resumed = CsvSink(path, COLUMNS, resume=True)
+        assert resumed.next_page == 3
+        assert resumed.rows == 2
+        resumed.write_page(3, page("C"))
+        resumed.commit()
+
+        titles = [line.split(";")[0] for line in path.read_text(encoding="utf-8").splitlines()]
+        assert titles == ["title", "A", "B", "C"]
+
+    def test_resume_without_checkpoint_starts_over(self, tmp_path):
+        path = tmp_path / "list.csv"
+        path.with_name("list.csv.part").write_text("garbage\n", encoding="utf-8")
+
+        sink = CsvSink(path, COLUMNS, resume=True)
+
+        assert sink.next_page == 1
+        sink.commit()
+        assert path.read_text(encoding="utf-8") == "title;year;FA movie ID\n"
+
+    def test_no_resume_discards_previous_part(self, tmp_path):
+        path = tmp_path / "list.csv"
+        sink = CsvSink(path, COLUMNS)
+        sink.write_page(1, page("A"))
+        sink.close()
+
+        sink = CsvSink(path, COLUMNS)
+
+        assert sink.next_page == 1
+        sink.commit()
+        assert path.read_text(encoding="utf-8").splitlines() == ["title;year;FA movie ID"]
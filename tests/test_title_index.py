@@ -0,0 +1,229 @@
+"""
+Unit tests for imdb_uploader/title_index.py
+
+Tests for the offline title index built from the IMDb datasets.
+"""
+
+import gzip
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader.data_processing import find_imdb_match  # noqa: E402
+from imdb_uploader.directors import DirectorResolver  # noqa: E402
+from imdb_uploader.match_cache import MatchCache  # noqa: E402
+from imdb_uploader.title_index import (  # noqa: E402
+    TitleIndex,
+    TitleIndexError,
+    build_title_index,
+)
+
+BASICS = [
+    "tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\tstartYear\tendYear\truntimeMinutes\tgenres",
+    "tt0133093\tmovie\tThe Matrix\tThe Matrix\t0\t1999\t\\N\t136\tAction,Sci-Fi",
+    "tt0234215\tmovie\tThe Matrix Reloaded\tThe Matrix Reloaded\t0\t2003\t\\N\t138\tAction,Sci-Fi",
+    "tt0113277\tmovie\tHeat\tHeat\t0\t1995\t\\N\t170\tCrime,Drama",
+    "tt0090859\tmovie\tHeat\tHeat\t0\t1986\t\\N\t101\tAction,Crime",
+    "tt0211915\tmovie\tAmélie\tLe fabuleux destin d'Amélie Poulain\t0\t2001\t\\N\t122\tComedy",
+    "tt0583453\ttvEpisode\tThe Matrix\tThe Matrix\t0\t2004\t\\N\t22\tDocumentary",
+]
+AKAS = [
+    "titleId\tordering\ttitle\tregion\tlanguage\ttypes\tattributes\tisOriginalTitle",
+    "tt0133093\t1\tMatrix\tES\t\\N\t\\N\t\\N\t0",
+    "tt0133093\t2\tThe Matrix\tUS\t\\N\t\\N\t\\N\t0",
+    "tt0583453\t1\tMatrix episode\tES\t\\N\t\\N\t\\N\t0",
+]
+CREW = [
+    "tconst\tdirectors\twriters",
+    "tt0133093\tnm0905154,nm0905152\tnm0905154",
+    "tt0113277\tnm0000520\tnm0000520",
+    "tt0090859\tnm0551851\t\\N",
+    "tt0211915\tnm0000466\t\\N",
+]
+NAMES = [
+    "nconst\tprimaryName\tbirthYear\tdeathYear\tprimaryProfession\tknownForTitles",
+    "nm0905154\tLana Wachowski\t1965\t\\N\tdirector\ttt0133093",
+    "nm0905152\tLilly Wachowski\t1967\t\\N\tdirector\ttt0133093",
+    "nm0000520\tMichael Mann\t1943\t\\N\tdirector\ttt0113277",
+    "nm0551851\tDick Richards\t1936\t\\N\tdirector\ttt0090859",
+    "nm0000466\tJean-Pierre Jeunet\t1953\t\\N\tdirector\ttt0211915",
+]
+
+
+def write_tsv(path, lines):
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        fh.write("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    datasets = tmp_path / "datasets"
+    datasets.mkdir()
+    write_tsv(datasets / "title.basics.tsv.gz", BASICS)
+    write_tsv(datasets / "title.akas.tsv.gz", AKAS)
+    write_tsv(datasets / "title.crew.tsv.gz", CREW)
+    write_tsv(datasets / "name.basics.tsv.gz", NAMES)
+    path = tmp_path / "titles.sqlite"
+    build_title_index(datasets, path, progress=lambda message: None)
+    return path
+
+
+class TestBuildTitleIndex:
+    """Tests for build_title_index."""
+
+    def test_skips_episodes(self, index_path):
+        with TitleIndex(index_path) as index:
+            assert len(index) == 5
+            assert [t.movieID for t in index.search_movie("matrix episode")] == []
+
+    def test_missing_dataset_files(self, tmp_path):
+        with pytest.raises(TitleIndexError, match="title.basics"):
+            build_title_index(tmp_path, tmp_path / "titles.sqlite")
+
+    def test_open_missing_index(self, tmp_path):
+        with pytest.raises(TitleIndexError):
+            TitleIndex(tmp_path / "missing.sqlite")
+
+
+class TestTitleIndexSearch:
+    """Tests for TitleIndex.search_movie."""
+
+    def test_exact_title_first_with_directors(self, index_path):
+        with TitleIndex(index_path) as index:
+            results = index.search_movie("The Matrix")
+
+        assert [t.movieID for t in results] == ["0133093", "0234215"]
+        assert results[0]["year"] == 1999
+        assert results[0]["kind"] == "movie"
+        assert sorted(results[0]["directors"]) == ["Lana Wachowski", "Lilly Wachowski"]
+
+    def test_matches_akas_and_original_titles(self, index_path):
+        with TitleIndex(index_path) as index:
+            assert index.search_movie("Matrix")[0]["title"] == "Matrix"
+            assert index.search_movie("fabuleux destin amelie")[0].movieID == "0211915"
+
+    def test_trailing_year_ranks_titles(self, index_path):
+        with TitleIndex(index_path) as index:
+            assert index.search_movie("Heat 1986")[0].movieID == "0090859"
+            assert index.search_movie("Heat 1995")[0].movieID == "0113277"
+
+
+class TestTitleIndexBlocking:
+    """Tests for the candidate lists of TitleIndex.candidates."""
+
+    def test_candidates_share_a_word_and_the_year(self, index_path):
+        with TitleIndex(index_path) as index:
+            assert [t.movieID for t in index.candidates("Matrix Recargado", 2003)] == ["0234215"]
+            assert [t.movieID for t in index.candidates("Heat", 1996)] == ["0113277"]
+            assert index.candidates("Heat", 1990) == []
+
+    def test_search_falls_back_to_candidates(self, index_path):
+        with TitleIndex(index_path) as index:
+            assert index.search_movie("Matrix Recargado") == []
+            results = index.search_movie("Matrix Recargado 2003")
+
+        assert [t.movieID for t in results] == ["0234215"]
+
+    def test_outdated_index_must_be_rebuilt(self, index_path):
+        import sqlite3
+
+        conn = sqlite3.connect(index_path)
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+        with pytest.raises(TitleIndexError, match="rebuild"):
+            TitleIndex(index_path)
+
+
+class TestTitleIndexDirectors:
+    """Tests for the bulk director lookup of the title index."""
+
+    def test_directors_of_indexed_titles(self, index_path):
+        with TitleIndex(index_path) as index:
+            found = index.directors(["0133093", "0113277", "0234215", "9999999", "abc"])
+
+        assert found == {
+            "0133093": ["Lana Wachowski", "Lilly Wachowski"],
+            "0113277": ["Michael Mann"],
+            "0234215": [],
+        }
+
+    def test_resolver_reads_imdb_candidates_from_index(self, index_path):
+        client = MagicMock()
+        candidates = [MagicMock(movieID=movie_id) for movie_id in ("0090859", "15398776")]
+        for movie in candidates:
+            movie.get.return_value = None
+
+        with TitleIndex(index_path) as index:
+            resolver = DirectorResolver(client, index)
+            resolved = resolver.resolve(candidates, [])
+
+        assert resolved[0] == ["Dick Richards"]
+        assert client.update.call_count == 1
+        assert resolver.index_hits == 1
+
+
+class TestFindImdbMatchWithIndex:
+    """Tests for find_imdb_match with a TitleIndex."""
+
+    def test_matches_offline(self, index_path):
+        with TitleIndex(index_path) as index:
+            best = find_imdb_match("Heat", "1986", director="Dick Richards", index=index)
+
+        assert best["movieID"] == "0090859"
+
+    def test_matches_candidates_of_the_year(self, index_path):
+        with TitleIndex(index_path) as index:
+            with patch.object(index, "candidates", wraps=index.candidates) as candidates:
+                best = find_imdb_match("Matrix Recargado", "2003", index=index)
+
+        candidates.assert_called_with("Matrix Recargado", 2003)
+        assert best["movieID"] == "0234215"
+        assert best["query"] == "Matrix Recargado"
+
+    def test_candidates_need_a_year(self, index_path):
+        with TitleIndex(index_path) as index:
+            with patch.object(index, "candidates", wraps=index.candidates) as candidates:
+                best = find_imdb_match("The Matrix", None, index=index)
+
+        candidates.assert_not_called()
+        assert best["movieID"] == "0133093"
+
+    def test_falls_back_to_imdb_for_unresolved_titles(self, index_path):
+        movie = MagicMock()
+        movie.get.side_effect = {"title": "Oppenheimer", "year": 2023}.get
+        movie.movieID = "15398776"
+        client = MagicMock()
+        client.search_movie.return_value = [movie]
+
+        with TitleIndex(index_path) as index:
+            assert find_imdb_match("The Matrix", "1999", ia=client, index=index)["movieID"] == (
+                "0133093"
+            )
+            client.search_movie.assert_not_called()
+
+            best = find_imdb_match("Oppenheimer", "2023", ia=client, index=index)
+
+        assert best["movieID"] == "15398776"
+
+    def test_offline_lookup_caches_only_confident_matches(self, index_path, tmp_path):
+        movie = MagicMock()
+        movie.get.side_effect = {"title": "Oppenheimer", "year": 2023}.get
+        movie.movieID = "15398776"
+        client = MagicMock()
+        client.search_movie.return_value = [movie]
+
+        with TitleIndex(index_path) as index, MatchCache(tmp_path / "matches.sqlite") as cache:
+            assert find_imdb_match("The Matrix", "1999", index=index, cache=cache) is not None
+            assert find_imdb_match("Oppenheimer", "2023", index=index, cache=cache) is None
+            assert len(cache) == 1
+
+            best = find_imdb_match("Oppenheimer", "2023", ia=client, index=index, cache=cache)
+
+        assert best["movieID"] == "15398776"
@@ -464,6 +464,88 @@ class TestParseArguments:
             assert args.confirm_threshold == 0.9
 
 
+class TestBrowserPoolOption:
+    """Tests for --browsers and the browser pool setup."""
+
+    def make_args(self, *argv):
+        with patch("sys.argv", ["uploader.py", "--csv", "test.csv", *argv]):
+            return uploader.parse_arguments()
+
+    def test_default_one_browser(self):
+        assert self.make_args().browsers == 1
+
+    def test_browsers_option(self):
+        assert self.make_args("--browsers", "3").browsers == 3
+
+    def test_one_browser_has_no_pool(self):
+        args = self.make_args("--unattended", "--auto-rate")
+        assert uploader.open_browser_pool(args, {}, MagicMock()) == (None, [])
+
+    def test_needs_unattended_auto_rate(self, capsys):
+        args = self.make_args("--browsers", "3", "--auto-rate")
+        with patch("imdb_uploader.uploader.start_driver") as mock_start:
+            assert uploader.open_browser_pool(args, {}, MagicMock()) == (None, [])
+        mock_start.assert_not_called()
+        assert "--unattended" in capsys.readouterr().out
+
+    @patch("imdb_uploader.uploader.import_login_cookies")
+    @patch("imdb_uploader.uploader.export_login_cookies")
+    @patch("imdb_uploader.uploader.start_driver")
+    def test_extra_browsers_share_login(self, mock_start, mock_export, mock_import):
+        args = self.make_args("--browsers", "3", "--unattended", "--auto-rate")
+        driver = MagicMock()
+        extra = [MagicMock(), MagicMock()]
+        mock_start.side_effect = extra
+        mock_export.return_value = [{"name": "at-main", "value": "a"}]
+
+        pool, extra_drivers = uploader.open_browser_pool(args, {"page_load_wait": 0}, driver)
+        pool.close()
+
+        assert pool.size == 3
+        assert extra_drivers == extra
+        mock_export.assert_called_once_with(driver)
+        assert [c.args[0] for c in mock_import.call_args_list] == extra
+        assert all(c.args[1] == mock_export.return_value for c in mock_import.call_args_list)
+
+    @patch("imdb_uploader.uploader.import_login_cookies")
+    @patch("imdb_uploader.uploader.export_login_cookies")
+    @patch("imdb_uploader.uploader.start_driver")
+    def test_browser_start_failure_keeps_started_ones(self, mock_start, mock_export, mock_import):
+        args = self.make_args("--browsers", "4", "--unattended", "--auto-rate")
+        mock_start.side_effect = [MagicMock(), RuntimeError("no chrome")]
+
+        pool, extra_drivers = uploader.open_browser_pool(args, {}, MagicMock())
+        pool.close()
+
+        assert pool.size == 2
+        assert len(extra_drivers) == 1
+
+    def test_matched_item_is_queued_on_pool(self):
+        args = self.make_args("--unattended", "--auto-rate")
+        driver = MagicMock()
+        pool = MagicMock()
+        item = {"title": "The Matrix", "year": "1999", "score": 9}
+        match = {"movieID": "0133093", "title": "The Matrix", "year": "1999", "score": 1.0}
+        future = MagicMock()
+        future.result.return_value = match
+
+        result = uploader.process_single_item(
+            driver,
+            None,
+            item,
+            args,
+            uploader.create_stats(),
+            [],
+            match_future=future,
+            browser_pool=pool,
+            index=7,
+        )
+
+        assert result == "queued"
+        pool.submit.assert_called_once_with(7, item, "tt0133093")
+        driver.get.assert_not_called()
+
+
 class TestInitImdbpyClient:
     """Tests for init_imdbpy_client function."""
 
@@ -0,0 +1,113 @@
+"""
+Unit tests for imdb_uploader/workers.py
+
+Tests for the per-thread IMDbPY clients and the shared rate limiter.
+"""
+
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+# Add project root to path so we can import the module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imdb_uploader.workers import MatchPrefetcher, PerThreadIMDbClient, RateLimiter  # noqa: E402
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_spaces_requests(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("imdb_uploader.workers.time.sleep", sleeps.append)
+        monkeypatch.setattr("imdb_uploader.workers.time.monotonic", lambda: 100.0)
+
+        limiter = RateLimiter(max_rps=4)
+        for _ in range(3):
+            limiter.wait()
+
+        assert sleeps == [0.25, 0.5]
+
+    def test_zero_disables_limit(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("imdb_uploader.workers.time.sleep", sleeps.append)
+
+        limiter = RateLimiter(max_rps=0)
+        limiter.wait()
+        limiter.wait()
+
+        assert sleeps == []
+
+
+class TestPerThreadIMDbClient:
+    """Tests for PerThreadIMDbClient."""
+
+    def test_each_thread_gets_its_own_client(self):
+        created = []
+
+        def factory():
+            client = MagicMock()
+            created.append(client)
+            return client
+
+        main_client = MagicMock()
+        ia = PerThreadIMDbClient(factory, client=main_client)
+        ia.search_movie("The Matrix")
+
+        worker = threading.Thread(target=lambda: (ia.search_movie("Heat"), ia.search_movie("Up")))
+        worker.start()
+        worker.join()
+
+        main_client.search_movie.assert_called_once_with("The Matrix")
+        assert len(created) == 1
+        assert created[0].search_movie.call_count == 2
+
+    def test_requests_wait_for_limiter(self):
+        limiter = MagicMock()
+        client = MagicMock()
+        ia = PerThreadIMDbClient(MagicMock(), limiter=limiter, client=client)
+
+        ia.search_movie("The Matrix")
+        ia.update("movie")
+        ia.get_movie("0133093")
+
+        assert limiter.wait.call_count == 2
+        client.get_movie.assert_called_once_with("0133093")
+
+
+class TestMatchPrefetcher:
+    """Tests for MatchPrefetcher."""
+
+    def test_yields_items_in_order_with_their_matches(self):
+        items = [{"title": f"Movie {i}", "year": "2000"} for i in range(6)]
+
+        def fake_match(title, year, **kwargs):
+            time.sleep(0.01 * (6 - int(title.split()[1])))
+            return {"title": title}
+
+        with patch("imdb_uploader.workers.find_imdb_match", side_effect=fake_match):
+            with MatchPrefetcher(MagicMock(), lookahead=3) as prefetcher:
+                pairs = [(item, future.result()) for item, future in prefetcher.iter_items(items)]
+
+        assert [item["title"] for item, _ in pairs] == [item["title"] for item in items]
+        assert all(match["title"] == item["title"] for item, match in pairs)
+
+    def test_resolves_at_most_lookahead_items_ahead(self):
+        items = [{"title": f"Movie {i}"} for i in range(10)]
+        started = []
+
+        def fake_match(title, year, **kwargs):
+            started.append(title)
+            return None
+
+        with patch("imdb_uploader.workers.find_imdb_match", side_effect=fake_match):
+            prefetcher = MatchPrefetcher(MagicMock(), lookahead=2)
+            pairs = prefetcher.iter_items(items)
+            item, future = next(pairs)
+            future.result()
+            prefetcher.close()
+
+        assert item["title"] == "Movie 0"
+        assert len(started) <= 3